@@ -0,0 +1,75 @@
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from app.config.settings import NOTION_DATABASE_ID, SLACK_WEBHOOKS, SLACK_WEBHOOK_NAMES
+from app.storage.mongo import COLLECTION_NAME
+
+
+JOB_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+# 환경 변수 설정으로 만든 기본 작업 (main.py 단독 실행)
+def default_job() -> Dict[str, Any]:
+    return {
+        "name": "default",
+        "database_id": NOTION_DATABASE_ID,
+        "webhooks": SLACK_WEBHOOKS,
+        "collection": COLLECTION_NAME,
+        "prompt": None,
+        "source": None
+    }
+
+# 웹훅 이름(ALL_SHARE / JARVIS_TEST) 또는 URL 을 실제 URL 로 변환
+def resolve_webhooks(targets: List[str]) -> List[str]:
+    return [SLACK_WEBHOOK_NAMES.get(target.strip(), target.strip()) for target in targets if target.strip()]
+
+# 작업 하나의 설정 검증 및 기본값 채우기
+# prompt_file 은 설정 파일 기준 상대 경로 (prompt 와 함께 쓰면 둘 다 추가 지침으로 사용)
+def build_job(config: Dict[str, Any], base_dir: str = ".") -> Dict[str, Any]:
+    name = config.get("name")
+    if not name or not JOB_NAME_PATTERN.match(name):
+        raise ValueError(f"작업 이름이 없거나 올바르지 않습니다: {name!r} (영문, 숫자, _ . - 만 사용)")
+    if not config.get("database_id"):
+        raise ValueError(f"{name}: database_id 가 없습니다")
+
+    webhooks = resolve_webhooks(config.get("webhooks", []))
+    if not webhooks or not all(webhooks):
+        raise ValueError(f"{name}: webhooks 가 없거나 이름에 해당하는 웹훅 URL 이 설정되지 않았습니다")
+
+    instructions = [config["prompt"]] if config.get("prompt") else []
+    if config.get("prompt_file"):
+        with open(os.path.join(base_dir, config["prompt_file"]), "r", encoding="utf-8") as f:
+            instructions.append(f.read().strip())
+
+    return {
+        "name": name,
+        "database_id": config["database_id"],
+        "webhooks": webhooks,
+        "collection": config.get("collection") or COLLECTION_NAME,
+        "prompt": "\n\n".join(instructions) or None,
+        "source": config.get("source")
+    }
+
+# 작업 설정 파일(JSON) 로드
+# {"jobs": [{"name", "database_id", "webhooks", "collection", "prompt" | "prompt_file", "source"}, ...]}
+def load_jobs(path: str, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    jobs = [build_job(job, base_dir) for job in config.get("jobs", [])]
+
+    seen = set()
+    for job in jobs:
+        if job["name"] in seen:
+            raise ValueError(f"작업 이름이 중복됩니다: {job['name']}")
+        seen.add(job["name"])
+
+    if names:
+        unknown = set(names) - seen
+        if unknown:
+            raise ValueError(f"설정 파일에 없는 작업: {', '.join(sorted(unknown))}")
+        jobs = [job for job in jobs if job["name"] in names]
+    return jobs
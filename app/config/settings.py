@@ -1,4 +1,6 @@
 from dotenv import load_dotenv
+import json
+import logging
 import os
 
 # .env 파일 로드
@@ -6,14 +8,119 @@ load_dotenv()
 
 # OpenAI
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
 
 # Notion
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
 NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
+NOTION_BASE_URL = os.getenv("NOTION_BASE_URL", "https://api.notion.com")
 
 # Slack
 SLACK_WEBHOOK_ALL_SHARE = os.getenv("SLACK_WEBHOOK_ALL_SHARE")
 SLACK_WEBHOOK_JARVIS_TEST = os.getenv("SLACK_WEBHOOK_JARVIS_TEST")
 
+# 이름으로 지정할 수 있는 웹훅 (SLACK_WEBHOOK_TARGETS, jobs.json 의 webhooks)
+SLACK_WEBHOOK_NAMES = {"ALL_SHARE": SLACK_WEBHOOK_ALL_SHARE, "JARVIS_TEST": SLACK_WEBHOOK_JARVIS_TEST}
+
+# 전송 대상 웹훅 목록 (ALL_SHARE / JARVIS_TEST 이름 또는 웹훅 URL, 쉼표로 구분)
+# 이름에 해당하는 환경 변수가 비어 있으면 None 으로 남기고 SLACK_WEBHOOKS_UNSET 에 기록 (전송 시점에 오류)
+SLACK_WEBHOOK_TARGETS = [target.strip() for target in os.getenv("SLACK_WEBHOOK_TARGETS", "JARVIS_TEST").split(",") if target.strip()]
+SLACK_WEBHOOKS = [SLACK_WEBHOOK_NAMES.get(target, target) for target in SLACK_WEBHOOK_TARGETS]
+SLACK_WEBHOOKS_UNSET = [target for target in SLACK_WEBHOOK_TARGETS if target in SLACK_WEBHOOK_NAMES and not SLACK_WEBHOOK_NAMES[target]]
+SLACK_TIMEOUT = float(os.getenv("SLACK_TIMEOUT", "10"))
+SLACK_MAX_RETRIES = int(os.getenv("SLACK_MAX_RETRIES", "3"))
+SLACK_MAX_PARALLEL = int(os.getenv("SLACK_MAX_PARALLEL", "4"))
+
 #Mongodb
 MONGODB_CONNECTION_STRING = os.getenv("MONGODB_CONNECTION_STRING")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "10"))
+
+# Notion 동시 요청 수 제한 (비동기 블록 조회)
+NOTION_MAX_CONCURRENCY = int(os.getenv("NOTION_MAX_CONCURRENCY", "8"))
+
+# Notion 요청 속도 제한 (초당 평균 요청 수, 순간 허용량) 및 재시도 횟수
+NOTION_RATE_LIMIT_PER_SEC = float(os.getenv("NOTION_RATE_LIMIT_PER_SEC", "3"))
+NOTION_RATE_LIMIT_BURST = int(os.getenv("NOTION_RATE_LIMIT_BURST", "3"))
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "5"))
+
+# Notion 블록 로컬 캐시 (재실행 시 변경되지 않은 블록 재사용)
+NOTION_CACHE_ENABLED = os.getenv("NOTION_CACHE_ENABLED", "true").lower() == "true"
+NOTION_CACHE_PATH = os.getenv("NOTION_CACHE_PATH", ".cache/notion_blocks.sqlite3")
+NOTION_CACHE_MAX_MB = int(os.getenv("NOTION_CACHE_MAX_MB", "200"))
+# 최근 이 시간(분) 안에 수정된 페이지는 캐시를 쓰지 않음 (last_edited_time 이 분 단위라 같은 분의 재수정을 구분할 수 없음)
+NOTION_CACHE_SETTLE_MINUTES = int(os.getenv("NOTION_CACHE_SETTLE_MINUTES", "5"))
+
+# 요약 모드 (single: 한 번에 요약 / map_reduce: 청크별 요약 후 병합 / auto: 입력 크기로 자동 선택)
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "auto")
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "6000"))
+SUMMARY_MAX_PARALLEL = int(os.getenv("SUMMARY_MAX_PARALLEL", "4"))
+
+# 모델 라우팅 (입력 크기 / 기사 수로 모델과 출력 토큰 한도 선택, 꺼져 있으면 항상 LLM_MODEL_LARGE)
+# - 청크별 부분 요약과 가벼운 주(추정 입력 토큰, 기사 수가 LIGHT 이하)의 요약은 작은 모델
+# - 병합 / 큰 주의 최종 요약 / 섹션 수정은 큰 모델
+LLM_ROUTING_ENABLED = os.getenv("LLM_ROUTING_ENABLED", "true").lower() == "true"
+LLM_MODEL_LARGE = os.getenv("LLM_MODEL_LARGE", "gpt-4o")
+LLM_MODEL_SMALL = os.getenv("LLM_MODEL_SMALL", "gpt-4o-mini")
+LLM_LIGHT_MAX_TOKENS = int(os.getenv("LLM_LIGHT_MAX_TOKENS", "3000"))
+LLM_LIGHT_MAX_ARTICLES = int(os.getenv("LLM_LIGHT_MAX_ARTICLES", "8"))
+
+# 모델별 100만 토큰당 가격 (USD, 입력 / 출력, 비용 집계용)
+# LLM_MODEL_PRICES(JSON: {"모델": [입력, 출력]})로 덮어쓰기, 형식이 잘못되면 경고 후 기본값 사용
+DEFAULT_MODEL_PRICES = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60)
+}
+
+def _load_model_prices(raw: str) -> dict:
+    prices = dict(DEFAULT_MODEL_PRICES)
+    if not raw:
+        return prices
+    try:
+        for model, (input_price, output_price) in json.loads(raw).items():
+            prices[model] = (float(input_price), float(output_price))
+    except (ValueError, TypeError, AttributeError) as e:
+        logging.getLogger('tech_trend_bot').warning(f"LLM_MODEL_PRICES 형식 오류, 기본 가격 사용: {str(e)}")
+        return dict(DEFAULT_MODEL_PRICES)
+    return prices
+
+LLM_MODEL_PRICES = _load_model_prices(os.getenv("LLM_MODEL_PRICES", ""))
+
+# 요약 출력 형식 (text: 이모지 텍스트 + 정규식 파싱 / json: 스키마 기반 JSON + 섹션 단위 검증)
+SUMMARY_OUTPUT = os.getenv("SUMMARY_OUTPUT", "text")
+
+# 최종 요약 스트리밍 (섹션 단위 증분 파싱, 중간 타임아웃 시 완료된 섹션 유지)
+SUMMARY_STREAM = os.getenv("SUMMARY_STREAM", "false").lower() == "true"
+
+# LLM 응답 로컬 캐시 (동일 프롬프트 재실행 시 재사용, FORCE_REFRESH=true 면 항상 새로 생성)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "50"))
+LLM_CACHE_FORCE_REFRESH = os.getenv("LLM_CACHE_FORCE_REFRESH", "false").lower() == "true"
+
+# 프롬프트 전 중복 기사 제거 (링크 일치 + 본문 MinHash 유사도 기준)
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+DEDUP_SIMILARITY = float(os.getenv("DEDUP_SIMILARITY", "0.8"))
+
+# 이전 주 요약본에 이미 있는 기사(같은 링크 / 제목)는 한 줄 참조로 축소
+CROSS_WEEK_DEDUP_ENABLED = os.getenv("CROSS_WEEK_DEDUP_ENABLED", "true").lower() == "true"
+
+# 여러 주 백필 시 동시에 처리할 주 수
+BACKFILL_MAX_WORKERS = int(os.getenv("BACKFILL_MAX_WORKERS", "3"))
+
+# 단계별 체크포인트 저장 위치 (main.py --resume / --from-stage)
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "runs")
+
+# 실행 지표 Prometheus 텍스트 파일 경로 (node_exporter textfile collector, 비어 있으면 저장 안 함)
+# JSON 실행 리포트는 체크포인트 디렉토리의 metrics.json 으로 저장
+METRICS_TEXTFILE_PATH = os.getenv("METRICS_TEXTFILE_PATH", "")
+
+# 여러 작업(Notion DB / 웹훅 / 컬렉션 / 프롬프트) 설정 파일과 동시에 실행할 작업 수 (run_jobs.py)
+JOBS_CONFIG_PATH = os.getenv("JOBS_CONFIG_PATH", "jobs.json")
+JOBS_MAX_WORKERS = int(os.getenv("JOBS_MAX_WORKERS", "4"))
+
+# 데몬 모드 (daemon.py): cron 스케줄(세미콜론으로 여러 개), 스케줄 기준 시간대, 상태 확인 / 즉시 실행용 HTTP 주소
+DAEMON_SCHEDULE = os.getenv("DAEMON_SCHEDULE", "0 13 * * 3")
+DAEMON_TIMEZONE = os.getenv("DAEMON_TIMEZONE", "Asia/Seoul")
+DAEMON_HOST = os.getenv("DAEMON_HOST", "127.0.0.1")
+DAEMON_PORT = int(os.getenv("DAEMON_PORT", "8080"))
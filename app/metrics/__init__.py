@@ -0,0 +1,3 @@
+"""
+실행 지표(지연 시간, 요청 수, 토큰 사용량) 수집 관련 모듈
+"""
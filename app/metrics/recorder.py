@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+METRIC_PREFIX = "tech_trend_bot"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+# 실행 단위 지표 수집기 (스레드 / 이벤트 루프에서 함께 사용)
+# - 타이머: 구간별 횟수, 합계, 최대 소요 시간 (span 또는 observe)
+# - 카운터: 요청 수, 재시도 수, 바이트, 토큰 사용량 등 누적 값 (increment)
+# - 호출 기록: LLM 호출처럼 건별로 남길 항목 (record_call, 리포트의 calls 에 그대로 포함)
+class MetricsRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = datetime.now()
+            self._timers: Dict[Tuple[str, LabelKey], Dict[str, float]] = {}
+            self._counters: Dict[Tuple[str, LabelKey], float] = {}
+            self._calls: Dict[str, List[Dict[str, Any]]] = {}
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            timer = self._timers.setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+            timer["count"] += 1
+            timer["sum"] += seconds
+            timer["max"] = max(timer["max"], seconds)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    # 구간 소요 시간 측정 (예외가 나도 기록하고, 실패 횟수는 {name}_errors 카운터로 집계)
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.increment(f"{name}_errors", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def record_call(self, kind: str, **fields: Any) -> None:
+        with self._lock:
+            self._calls.setdefault(kind, []).append(fields)
+
+    # OpenAI 응답의 usage 를 모델별 토큰 카운터로 누적
+    def record_token_usage(self, model: str, usage: Any) -> None:
+        if usage is None:
+            return
+        for field in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            value = getattr(usage, field, None)
+            if value:
+                self.increment(f"llm_{field}", value, model=model)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            timers = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": timer["count"],
+                    "total_ms": round(timer["sum"] * 1000, 1),
+                    "avg_ms": round(timer["sum"] / timer["count"] * 1000, 1),
+                    "max_ms": round(timer["max"] * 1000, 1)
+                }
+                for (name, labels), timer in sorted(self._timers.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            calls = {kind: list(entries) for kind, entries in self._calls.items()}
+        return {
+            "startedAt": self.started_at.isoformat(),
+            "elapsed_seconds": round((datetime.now() - self.started_at).total_seconds(), 3),
+            "timers": timers,
+            "counters": counters,
+            "calls": calls
+        }
+
+    # Prometheus 텍스트 포맷 (node_exporter textfile collector 용)
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            timers = sorted(self._timers.items())
+            counters = sorted(self._counters.items())
+
+        declared = set()
+        for (name, labels), timer in timers:
+            metric = f"{METRIC_PREFIX}_{name}_seconds"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} summary")
+                declared.add(metric)
+            lines.append(f"{metric}_sum{_format_labels(labels)} {timer['sum']:.6f}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {timer['count']}")
+
+        for (name, labels), value in counters:
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} counter")
+                declared.add(metric)
+            lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    # JSON 실행 리포트와 Prometheus 텍스트 파일 저장 (경로가 없으면 해당 출력은 건너뜀)
+    def export(self, report_path: Optional[str] = None, textfile_path: Optional[str] = None) -> Dict[str, Any]:
+        report = self.report()
+        if report_path:
+            _atomic_write(report_path, json.dumps(report, ensure_ascii=False, indent=2))
+            logger.info(f"실행 지표 리포트 저장: {report_path}")
+        if textfile_path:
+            _atomic_write(textfile_path, self.to_prometheus())
+        return report
+
+
+# 쓰는 도중 수집기가 읽어가지 않도록 임시 파일에 쓴 뒤 교체
+def _atomic_write(path: str, content: str) -> None:
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+# 프로세스 공용 지표 수집기
+metrics = MetricsRecorder()
@@ -0,0 +1,17 @@
+from typing import Any, Dict
+
+
+# 블록 텍스트 추출
+def extract_text(block: Dict[str, Any]) -> str:
+    # 블록에서 'rich_text' 키의 값을 추출
+    text_objects = block.get("rich_text", [])
+    # rich_text 배열에서 'plain_text' 값을 추출
+    return " ".join(t.get("plain_text", "") for t in text_objects if isinstance(t, dict)).strip()
+
+# 블록 타입별 본문 텍스트 (rich_text 가 없는 타입(child_page, table, column_list 등)은 빈 문자열)
+def block_content(block: Dict[str, Any]) -> str:
+    return extract_text(block.get(block.get("type"), {}))
+
+# 파서가 하위 블록까지 텍스트로 만드는 블록인지 (텍스트가 없는 블록은 하위 트리째 버려지므로 조회하지 않음)
+def renders_children(block: Any) -> bool:
+    return isinstance(block, dict) and bool(block.get("has_children")) and bool(block_content(block))
@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from app.config.settings import NOTION_CACHE_ENABLED, NOTION_CACHE_MAX_MB, NOTION_CACHE_PATH
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+# 블록 하위 목록 로컬 캐시 (SQLite)
+# - block_id 별로 "직속" 하위 블록 목록만 저장하고, 저장 시의 검증 값(last_edited_time)이 같을 때만 적중
+#   (fetcher 는 페이지와 블록의 last_edited_time 을 합친 값을 넘기므로 페이지가 수정되면 하위 엔트리 전체가 무효)
+# - 손자 블록은 각자의 엔트리로 저장되므로 하위 단계마다 따로 검증됨
+# - 전체 크기가 max_bytes 를 넘으면 가장 오래 사용되지 않은 엔트리부터 삭제
+class BlockCache:
+    def __init__(self, path: str = NOTION_CACHE_PATH, max_bytes: int = NOTION_CACHE_MAX_MB * 1024 * 1024):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS block_children (
+                block_id TEXT PRIMARY KEY,
+                last_edited_time TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_block_children_accessed ON block_children (accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM block_children").fetchone()[0]
+
+    # 캐시 조회: 저장된 last_edited_time 과 일치할 때만 하위 블록 목록 반환
+    def get(self, block_id: str, last_edited_time: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        if not last_edited_time:
+            self.misses += 1
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM block_children WHERE block_id = ? AND last_edited_time = ?",
+                (block_id, last_edited_time)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE block_children SET accessed_at = ? WHERE block_id = ?",
+                (time.time(), block_id)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    # 캐시 저장: 직속 하위 블록만 저장 ("children" 키는 제외)
+    def set(self, block_id: str, last_edited_time: Optional[str], children: List[Dict[str, Any]]) -> None:
+        if not last_edited_time:
+            return
+
+        payload = json.dumps(
+            [{key: value for key, value in child.items() if key != "children"} for child in children],
+            ensure_ascii=False
+        )
+        size = len(payload.encode("utf-8"))
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM block_children WHERE block_id = ?", (block_id,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO block_children (block_id, last_edited_time, payload, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (block_id, last_edited_time, payload, size, time.time())
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    # 크기 기반 제거: 최대 크기의 90% 이하가 될 때까지 오래된 엔트리부터 삭제
+    def _evict(self) -> None:
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT block_id, size FROM block_children ORDER BY accessed_at ASC"
+        ).fetchall()
+
+        evicted = []
+        for block_id, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((block_id,))
+            self._total_bytes -= size
+
+        self._conn.executemany("DELETE FROM block_children WHERE block_id = ?", evicted)
+        logger.info(f"Notion 블록 캐시 정리: {len(evicted)}개 엔트리 삭제")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size_bytes": self._total_bytes
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_block_cache: Optional[BlockCache] = None
+_block_cache_lock = threading.Lock()
+
+# 프로세스 공용 블록 캐시 반환 (비활성화 시 None)
+def get_block_cache() -> Optional[BlockCache]:
+    global _block_cache
+    if not NOTION_CACHE_ENABLED:
+        return None
+    with _block_cache_lock:
+        if _block_cache is None:
+            _block_cache = BlockCache()
+    return _block_cache
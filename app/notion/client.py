@@ -1,20 +1,31 @@
-from notion_client import Client
-from app.config.settings import NOTION_API_KEY, NOTION_DATABASE_ID
+from app.config.settings import NOTION_API_KEY, NOTION_BASE_URL, NOTION_DATABASE_ID
+from app.notion.ratelimit import call_notion, notion_event_hooks
 from datetime import date, timedelta
+import threading
 
 
-# Notion Client 생성
-notion = Client(auth = NOTION_API_KEY)
+# Notion Client (처음 사용할 때 생성, notion_client 도 그때 import)
+_notion = None
+_notion_lock = threading.Lock()
+
+def get_notion_client():
+    global _notion
+    with _notion_lock:
+        if _notion is None:
+            import httpx
+            from notion_client import Client
+            _notion = Client(auth = NOTION_API_KEY, base_url = NOTION_BASE_URL, client = httpx.Client(event_hooks = notion_event_hooks()))
+    return _notion
 
 # Notion Database ID
 DATABASE_ID = NOTION_DATABASE_ID
 
 # database_id 로 조회
 def get_database(database_id):
-    return notion.databases.query(database_id=database_id)
+    return call_notion(get_notion_client().databases.query, database_id=database_id)
 
-# 특정 날짜 범위의 데이터베이스 조회
-def get_filtered_database(database_id, start_date=None, end_date=None):
+# 회의일자 기준 날짜 범위 필터 생성 (edited_after 가 있으면 그 시각 이후 수정된 페이지만)
+def build_date_filter(start_date=None, end_date=None, edited_after=None):
     if not start_date:
         # 기본설정값: 해당 주 월-금
         today = date.today()
@@ -25,27 +36,58 @@ def get_filtered_database(database_id, start_date=None, end_date=None):
     start_date_str = start_date.isoformat() if isinstance(start_date, date) else start_date
     end_date_str = end_date.isoformat() if isinstance(end_date, date) else end_date
 
-    # 필터링 -> 조회
-    response = notion.databases.query(
-        database_id=database_id,
-        filter={
-            "and": [
-                {
-                    "property": "회의일자",
-                    "date": {
-                        "on_or_after": start_date_str
-                    }
-                },
-                {
-                    "property": "회의일자",
-                    "date": {
-                        "on_or_before": end_date_str
-                    }
+    date_filter = {
+        "and": [
+            {
+                "property": "회의일자",
+                "date": {
+                    "on_or_after": start_date_str
+                }
+            },
+            {
+                "property": "회의일자",
+                "date": {
+                    "on_or_before": end_date_str
                 }
-            ]
-        }
-    )
-    return response
+            }
+        ]
+    }
+
+    # last_edited_time 은 분 단위라 같은 분에 수정된 페이지를 놓치지 않도록 on_or_after 사용
+    if edited_after:
+        date_filter["and"].append({
+            "timestamp": "last_edited_time",
+            "last_edited_time": {
+                "on_or_after": edited_after
+            }
+        })
+    return date_filter
+
+# 특정 날짜 범위의 데이터베이스 페이지를 순서대로 조회 (next_cursor 기준 페이지네이션)
+def iter_database_pages(database_id, start_date=None, end_date=None, edited_after=None):
+    date_filter = build_date_filter(start_date, end_date, edited_after)
+    cursor = None
+
+    while True:
+        params = {"database_id": database_id, "filter": date_filter, "page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+
+        response = call_notion(get_notion_client().databases.query, **params)
+        yield from response.get("results", [])
+
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or cursor is None:
+            break
+
+# 특정 날짜 범위의 데이터베이스 조회 (전체 페이지 취합)
+def get_filtered_database(database_id, start_date=None, end_date=None, edited_after=None):
+    return {
+        "object": "list",
+        "results": list(iter_database_pages(database_id, start_date, end_date, edited_after)),
+        "next_cursor": None,
+        "has_more": False
+    }
 
 # Notion Page Block 조회
 def get_page_blocks(page_id):
@@ -53,7 +95,8 @@ def get_page_blocks(page_id):
     cursor = None
 
     while True:
-        response = notion.blocks.children.list(
+        response = call_notion(
+            get_notion_client().blocks.children.list,
             block_id = page_id,
             start_cursor = cursor
         )
@@ -63,18 +106,3 @@ def get_page_blocks(page_id):
             break
 
     return blocks
-
-# 특정 날짜 범위의 페이지 블록 리스트 추출
-def get_pages_blocks_by_date(database_id, start_date=None, end_date=None):
-    entry = get_filtered_database(database_id, start_date, end_date)
-    result = []
-
-    for page in entry.get("results", []):
-        page_id = page.get("id")
-        blocks = get_page_blocks(page_id)
-        result.append({
-            "page_id": page_id,
-            "blocks": blocks
-        })
-
-    return result
\ No newline at end of file
@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from app.config.settings import NOTION_API_KEY, NOTION_BASE_URL, NOTION_MAX_CONCURRENCY, NOTION_CACHE_SETTLE_MINUTES
+from app.notion.blocks import renders_children
+from app.notion.cache import BlockCache, get_block_cache
+from app.notion.client import build_date_filter
+from app.notion.ratelimit import acall_notion, notion_event_hooks, notion_rate_limiter
+
+if TYPE_CHECKING:
+    from notion_client import AsyncClient
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+# 프로세스 공용 이벤트 루프(전용 스레드)와 그 루프에서 쓰는 AsyncClient
+# 동기 호출(iter_pages_blocks_by_date)은 모두 이 루프에서 실행되므로 실행 / 작업 간 Notion 커넥션 풀을 재사용
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_client: Optional["AsyncClient"] = None
+_shared_lock = threading.Lock()
+
+
+def get_notion_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _shared_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="notion-loop", daemon=True).start()
+    return _loop
+
+# AsyncClient 생성 (응답 크기 기록 훅을 단 httpx 클라이언트 사용)
+def new_async_notion_client() -> "AsyncClient":
+    import httpx
+    from notion_client import AsyncClient
+
+    return AsyncClient(
+        auth=NOTION_API_KEY,
+        base_url=NOTION_BASE_URL,
+        client=httpx.AsyncClient(event_hooks=notion_event_hooks(asynchronous=True))
+    )
+
+# 공용 AsyncClient (get_notion_loop 의 루프에서만 사용)
+def get_async_notion_client() -> "AsyncClient":
+    global _async_client
+    with _shared_lock:
+        if _async_client is None:
+            _async_client = new_async_notion_client()
+    return _async_client
+
+# 공용 AsyncClient 와 루프 정리 (데몬 종료 시)
+def close_async_notion_client() -> None:
+    global _loop, _async_client
+    with _shared_lock:
+        loop, client = _loop, _async_client
+        _loop, _async_client = None, None
+    if loop is None:
+        return
+    if client is not None:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+# 블록의 하위 블록 목록 조회 (next_cursor 기준 페이지네이션)
+async def fetch_block_children(client: "AsyncClient", block_id: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+    blocks = []
+    cursor = None
+
+    while True:
+        params = {"block_id": block_id, "page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+
+        # 요청 단위로만 세마포어를 잡아 재귀 중 교착 상태 방지
+        async with semaphore:
+            response = await acall_notion(client.blocks.children.list, **params)
+
+        blocks.extend(response.get("results", []))
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or cursor is None:
+            break
+
+    return blocks
+
+# 캐시 검증 값: 페이지(데이터베이스 쿼리로 매번 새로 받는 값)와 블록 자신의 last_edited_time
+# - 하위 블록 수정이 상위 블록의 last_edited_time 을 바꾼다는 보장이 없어 페이지 수정 시각도 함께 비교
+# - 최근 NOTION_CACHE_SETTLE_MINUTES 안에 수정된 페이지는 같은 분 안의 재수정을 구분할 수 없어 캐시 사용 안 함 (None)
+def cache_validator(page_edited_time: Optional[str], last_edited_time: Optional[str]) -> Optional[str]:
+    if not page_edited_time or not last_edited_time:
+        return None
+    try:
+        edited = datetime.fromisoformat(page_edited_time.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if edited.tzinfo is None:
+        edited = edited.replace(tzinfo=timezone.utc)
+    if datetime.now(timezone.utc) - edited < timedelta(minutes=NOTION_CACHE_SETTLE_MINUTES):
+        return None
+    return f"{page_edited_time}|{last_edited_time}"
+
+# 블록 트리 조회: has_children 블록의 하위 블록을 모든 깊이에서 동시에 가져와 "children" 키에 채움
+# 파서가 버리는 블록(텍스트가 없는 child_page, table, column_list 등)의 하위 트리는 조회하지 않음
+# 캐시가 있으면 페이지와 블록의 last_edited_time 이 그대로인 하위 목록은 네트워크 호출 없이 재사용
+# (page_edited_time 을 생략하면 페이지 조회로 보고 last_edited_time 을 페이지 수정 시각으로 사용)
+async def fetch_block_tree(
+    client: "AsyncClient",
+    block_id: str,
+    semaphore: asyncio.Semaphore,
+    cache: Optional[BlockCache] = None,
+    last_edited_time: Optional[str] = None,
+    page_edited_time: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    page_edited_time = page_edited_time or last_edited_time
+    validator = cache_validator(page_edited_time, last_edited_time) if cache else None
+    blocks = cache.get(block_id, validator) if cache else None
+    if blocks is None:
+        blocks = await fetch_block_children(client, block_id, semaphore)
+        if cache:
+            cache.set(block_id, validator, blocks)
+
+    await asyncio.gather(*(
+        _fill_children(client, block, semaphore, cache, page_edited_time)
+        for block in blocks
+        if renders_children(block)
+    ))
+    return blocks
+
+async def _fill_children(
+    client: "AsyncClient",
+    block: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    cache: Optional[BlockCache],
+    page_edited_time: Optional[str]
+) -> None:
+    # 재시도 후에도 실패하면 하위 트리를 버리지 않고 실행 전체를 실패시킴
+    try:
+        block["children"] = await fetch_block_tree(
+            client, block["id"], semaphore, cache, block.get("last_edited_time"), page_edited_time
+        )
+    except Exception as e:
+        logger.error(f"하위 블록 가져오기 실패: {str(e)}")
+        raise
+
+# 특정 날짜 범위의 데이터베이스 페이지를 쿼리 배치 단위로 조회 (next_cursor 기준 페이지네이션)
+async def aiter_database_batches(
+    client: "AsyncClient",
+    database_id: str,
+    start_date,
+    end_date,
+    semaphore: asyncio.Semaphore,
+    edited_after: Optional[str] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    date_filter = build_date_filter(start_date, end_date, edited_after)
+    cursor = None
+
+    while True:
+        params = {"database_id": database_id, "filter": date_filter, "page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+
+        async with semaphore:
+            response = await acall_notion(client.databases.query, **params)
+
+        yield response.get("results", [])
+
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or cursor is None:
+            break
+
+# 특정 날짜 범위의 페이지 블록 트리를 스트리밍 조회
+# 쿼리 배치(최대 100페이지) 안에서는 동시에 가져오고, 완성된 페이지부터 데이터베이스 순서대로 반환
+# edited_after 가 있으면 그 시각 이후 수정된 페이지만 조회 (증분 실행)
+# client 를 넘기면 그 클라이언트를 그대로 사용 (닫지 않음), 없으면 이번 조회용 클라이언트를 만들고 닫음
+async def aiter_pages_blocks_by_date(
+    database_id: str,
+    start_date=None,
+    end_date=None,
+    max_concurrency: Optional[int] = None,
+    edited_after: Optional[str] = None,
+    client: Optional["AsyncClient"] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    if client is None:
+        # async with 는 훅 없는 httpx 클라이언트로 바꿔 끼우므로 직접 닫음
+        owned_client = new_async_notion_client()
+        try:
+            async for page in aiter_pages_blocks_by_date(
+                database_id, start_date, end_date, max_concurrency, edited_after, owned_client
+            ):
+                yield page
+        finally:
+            await owned_client.aclose()
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency or NOTION_MAX_CONCURRENCY)
+    cache = get_block_cache()
+
+    async for pages in aiter_database_batches(client, database_id, start_date, end_date, semaphore, edited_after):
+        tasks = [
+            asyncio.ensure_future(
+                fetch_block_tree(client, page.get("id"), semaphore, cache, page.get("last_edited_time"))
+            )
+            for page in pages
+        ]
+        try:
+            for page, task in zip(pages, tasks):
+                yield {
+                    "page_id": page.get("id"),
+                    "last_edited_time": page.get("last_edited_time"),
+                    "blocks": await task
+                }
+        finally:
+            # 소비자가 중간에 멈춘 경우 남은 조회 취소
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if cache:
+        logger.info(f"Notion 블록 캐시: {cache.stats()}")
+    logger.info(f"Notion 속도 제한: {notion_rate_limiter.stats()}")
+
+# 특정 날짜 범위의 페이지 블록 트리를 동시에 조회
+async def fetch_pages_blocks_by_date(
+    database_id: str,
+    start_date=None,
+    end_date=None,
+    max_concurrency: Optional[int] = None,
+    edited_after: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    return [
+        page
+        async for page in aiter_pages_blocks_by_date(database_id, start_date, end_date, max_concurrency, edited_after)
+    ]
+
+# 특정 날짜 범위의 페이지 블록 트리를 완성되는 대로 하나씩 반환 (동기 제너레이터)
+# 공용 루프 / AsyncClient 에서 실행 (여러 스레드에서 동시에 호출해도 같은 루프에서 함께 처리)
+def iter_pages_blocks_by_date(database_id, start_date=None, end_date=None, max_concurrency=None, edited_after=None) -> Iterator[Dict[str, Any]]:
+    loop = get_notion_loop()
+    pages = aiter_pages_blocks_by_date(
+        database_id, start_date, end_date, max_concurrency, edited_after, get_async_notion_client()
+    )
+    done = object()
+
+    async def next_page():
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return done
+
+    async def close_pages():
+        await pages.aclose()
+
+    try:
+        while True:
+            page = asyncio.run_coroutine_threadsafe(next_page(), loop).result()
+            if page is done:
+                break
+            yield page
+    finally:
+        asyncio.run_coroutine_threadsafe(close_pages(), loop).result()
+
+# 특정 날짜 범위의 페이지 블록 리스트 추출 (동기 호출용)
+def get_pages_blocks_by_date(database_id, start_date=None, end_date=None, max_concurrency=None, edited_after=None):
+    return list(iter_pages_blocks_by_date(database_id, start_date, end_date, max_concurrency, edited_after))
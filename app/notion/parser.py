@@ -1,118 +1,132 @@
-from app.notion.client import notion, get_pages_blocks_by_date
-from typing import List, Dict, Any
+from app.notion.blocks import block_content, extract_text
+from app.notion.fetcher import iter_pages_blocks_by_date
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TextIO
+import io
 import logging
 
 
 logger = logging.getLogger('tech_trend_bot')
 
-# 노션 블록을 파싱하여 텍스트 형식으로 변환
-def parse_notion_blocks(blocks: List[Dict[str, Any]], indent_level: int = 0) -> List[str]:
-    parsed_blocks = []
-    list_buffer = []
-    list_type = None
+HEADING_PREFIXES = {
+    "heading_1": "#",
+    "heading_2": "##",
+    "heading_3": "###"
+}
+
+
+# 한 단계(같은 부모)의 블록 순회 상태: 남은 블록, 들여쓰기 단계, 연속된 리스트 항목 버퍼
+class _BlockLevel:
+    __slots__ = ("blocks", "indent_level", "list_buffer", "list_type")
+
+    def __init__(self, blocks: List[Dict[str, Any]], indent_level: int):
+        self.blocks = iter(blocks)
+        self.indent_level = indent_level
+        self.list_buffer: List[str] = []
+        self.list_type = None
 
     # 리스트 버퍼 처리
-    def flush_list():
-        nonlocal list_buffer, list_type
-        if not list_buffer:
+    def flush_list(self) -> Iterator[str]:
+        if not self.list_buffer:
             return
 
+        indent_level = self.indent_level
         # 리스트 타입별 처리
-        if list_type == "bulleted_list_item":
-            for item in list_buffer:
-                marker = "->" * indent_level + "" if indent_level > 0 else "-"
-                parsed_blocks.append(f"{marker} {item}")
+        if self.list_type == "bulleted_list_item":
+            marker = "->" * indent_level if indent_level > 0 else "-"
+            for item in self.list_buffer:
+                yield f"{marker} {item}"
 
-        elif list_type == "numbered_list_item":
-            for i, item in enumerate(list_buffer):
+        elif self.list_type == "numbered_list_item":
+            for i, item in enumerate(self.list_buffer):
                 if indent_level == 0:
-                    parsed_blocks.append(f"{i + 1}. {item}")
+                    yield f"{i + 1}. {item}"
                 else:
-                    marker = "->" * indent_level
-                    parsed_blocks.append(f"{marker} {i + 1}. {item}")
-
-        list_buffer = []
-        list_type = None
-
-    # 블록 텍스트 추출
-    def extract_text(block: Dict[str, Any]) -> str:
-        # 블록에서 'rich_text' 키의 값을 추출
-        text_objects = block.get("rich_text", [])
-        # rich_text 배열에서 'plain_text' 값을 추출
-        return " ".join(t.get("plain_text", "") for t in text_objects if isinstance(t, dict)).strip()
-    
-    for block in blocks:
-        if not isinstance(block, dict):
-            continue
+                    yield f"{'->' * indent_level} {i + 1}. {item}"
 
-        block_type = block.get("type")
-        content = extract_text(block.get(block_type, {}))
+        self.list_buffer = []
+        self.list_type = None
 
-        if not content:
-            continue
+# 노션 블록을 파싱하여 한 줄씩 반환
+# 재귀 대신 명시적 스택으로 하위 블록을 순회하므로 중첩 깊이에 제한이 없고, 단계마다 목록을 복사하지 않음
+def iter_notion_block_lines(blocks: List[Dict[str, Any]], indent_level: int = 0) -> Iterator[str]:
+    stack = [_BlockLevel(blocks, indent_level)]
 
-        # 블록 타입별 처리
-        if block_type in ["paragraph", "quote"]:
-            flush_list()
-            if block_type == "quote":
-                parsed_blocks.append(f"> {content}")
-            else:
-                parsed_blocks.append(content)
-
-        elif block_type in ["bulleted_list_item", "numbered_list_item"]:
-            if list_type is None:
-                list_type = block_type
-            elif list_type != block_type:
-                flush_list()
-                list_type = block_type
-            list_buffer.append(content)
-
-        elif block_type in ["heading_1", "heading_2", "heading_3"]:
-            flush_list()
-            heading_prefix = {
-                "heading_1": "#",
-                "heading_2": "##",
-                "heading_3": "###"
-            }.get(block_type, "##")
-            parsed_blocks.append(f"{heading_prefix} {content}")
-
-        # 하위 블록 처리
-        if block.get("has_children"):
-            try:
-                child_blocks = notion.blocks.children.list(
-                    block_id=block["id"],
-                    page_size=100 
-                ).get("results", [])
-                
-                child_parsed = parse_notion_blocks(child_blocks, indent_level + 1)
-                flush_list()
-                parsed_blocks.extend(child_parsed)
-            except Exception as e:
-                logger.error(f"하위 블록 가져오기 실패: {str(e)}")
-
-    flush_list()
-    return parsed_blocks
+    while stack:
+        level = stack[-1]
 
-# 특정 날짜 범위의 노션 블록 파싱
-def parse_notion_blocks_by_date(database_id: str, start_date=None, end_date=None) -> List[Dict[str, Any]]:
-    pages = get_pages_blocks_by_date(database_id, start_date, end_date)
-    parsed = []
-    for page in pages:
+        # 하위 블록을 만나면 break 로 자식 단계를 먼저 처리하고, 돌아오면 같은 iterator 에서 이어서 순회
+        for block in level.blocks:
+            if not isinstance(block, dict):
+                continue
+
+            block_type = block.get("type")
+            content = block_content(block)
+
+            if not content:
+                continue
+
+            # 블록 타입별 처리
+            if block_type in ["paragraph", "quote"]:
+                if level.list_buffer:
+                    yield from level.flush_list()
+                if block_type == "quote":
+                    yield f"> {content}"
+                else:
+                    yield content
+
+            elif block_type in ["bulleted_list_item", "numbered_list_item"]:
+                if level.list_type is None:
+                    level.list_type = block_type
+                elif level.list_type != block_type:
+                    yield from level.flush_list()
+                    level.list_type = block_type
+                level.list_buffer.append(content)
+
+            elif block_type in HEADING_PREFIXES:
+                if level.list_buffer:
+                    yield from level.flush_list()
+                yield f"{HEADING_PREFIXES[block_type]} {content}"
+
+            # 하위 블록 처리 (fetcher가 미리 채워둔 "children" 사용, 네트워크 호출 없음)
+            # 텍스트가 있는 블록만 여기까지 오므로 fetcher 의 renders_children 과 같은 조건
+            if block.get("has_children"):
+                if level.list_buffer:
+                    yield from level.flush_list()
+                stack.append(_BlockLevel(block.get("children", []), level.indent_level + 1))
+                break
+        else:
+            # 현재 단계의 블록을 모두 처리하면 남은 리스트를 내보내고 부모 단계로 복귀
+            yield from level.flush_list()
+            stack.pop()
+
+# 노션 블록을 파싱하여 텍스트 형식으로 변환
+def parse_notion_blocks(blocks: List[Dict[str, Any]], indent_level: int = 0) -> List[str]:
+    return list(iter_notion_block_lines(blocks, indent_level))
+
+# 특정 날짜 범위의 노션 블록을 페이지 단위로 파싱하여 하나씩 반환 (원본 블록은 파싱 후 바로 해제)
+def iter_parsed_pages_by_date(database_id: str, start_date=None, end_date=None, edited_after=None) -> Iterator[Dict[str, Any]]:
+    for page in iter_pages_blocks_by_date(database_id, start_date, end_date, edited_after=edited_after):
         blocks = page.get("blocks", [])
-        parsed_content = parse_notion_blocks(blocks)
-        parsed.append({
+        yield {
             "page_id": page.get("page_id"),
-            "parsed_content": parsed_content
-        })
-    return parsed
+            "last_edited_time": page.get("last_edited_time"),
+            "parsed_content": parse_notion_blocks(blocks)
+        }
 
-# 파싱된 노션 블록을 텍스트 형식으로 변환
-def convert_parsed_page_to_text(parsed_page: Dict[str, Any]) -> str:
+# 특정 날짜 범위의 노션 블록 파싱
+def parse_notion_blocks_by_date(database_id: str, start_date=None, end_date=None, edited_after=None) -> List[Dict[str, Any]]:
+    return list(iter_parsed_pages_by_date(database_id, start_date, end_date, edited_after))
+
+# 파싱된 페이지 중 가장 최근 수정 시각 (증분 실행 워터마크, ISO 8601 UTC 문자열이라 문자열 비교로 충분)
+def latest_edited_time(parsed_pages: List[Dict[str, Any]]) -> Optional[str]:
+    edited_times = [page["last_edited_time"] for page in parsed_pages if page.get("last_edited_time")]
+    return max(edited_times) if edited_times else None
+
+# 파싱된 노션 블록을 날짜 / 작성자 / 기사 단위 항목으로 분리
+def extract_page_entries(parsed_page: Dict[str, Any]) -> List[Dict[str, Any]]:
     lines = parsed_page.get("parsed_content", [])
-    result = []
+    entries: List[Dict[str, Any]] = []
 
-    current_date = None
-    current_author = None
     current_title = None
     current_links = []
     current_body = []
@@ -120,13 +134,12 @@ def convert_parsed_page_to_text(parsed_page: Dict[str, Any]) -> str:
     def flush_article():
         nonlocal current_title, current_links, current_body
         if current_title or current_links or current_body:
-            result.append(f"[제목] {current_title or '(제목 없음)'}")
-            for link in current_links:
-                result.append(f"[링크] {link}")
-            if current_body:
-                result.append("[내용]")
-                result.extend(current_body)
-            result.append("")
+            entries.append({
+                "type": "article",
+                "title": current_title,
+                "links": current_links,
+                "body": current_body
+            })
         current_title = None
         current_links = []
         current_body = []
@@ -137,12 +150,10 @@ def convert_parsed_page_to_text(parsed_page: Dict[str, Any]) -> str:
             continue
         if line.startswith("# "):
             flush_article()
-            current_date = line[2:].strip()
-            result.append(f"\n[날짜] {current_date}")
+            entries.append({"type": "date", "value": line[2:].strip()})
         elif line.startswith("@"):
             flush_article()
-            current_author = line.strip()
-            result.append(f"\n[작성자] {current_author}")
+            entries.append({"type": "author", "value": line.strip()})
         elif line.startswith("##") or line.startswith("###"):
             flush_article()
             current_title = line.lstrip("#").strip()
@@ -152,7 +163,55 @@ def convert_parsed_page_to_text(parsed_page: Dict[str, Any]) -> str:
             current_body.append(line)
 
     flush_article()
-    return "\n".join(result)
+    return entries
+
+# 날짜 / 작성자 / 기사 항목을 프롬프트용 텍스트로 변환하여 한 줄씩 반환
+# 이전 주에 다룬 기사(covered)는 제목 / 링크 / 날짜만 한 줄로 표시
+def iter_page_entry_lines(entries: List[Dict[str, Any]]) -> Iterator[str]:
+    for entry in entries:
+        if entry["type"] == "date":
+            yield f"\n[날짜] {entry['value']}"
+        elif entry["type"] == "author":
+            yield f"\n[작성자] {entry['value']}"
+        elif entry.get("covered"):
+            link = f" | {entry['links'][0]}" if entry["links"] else ""
+            yield f"[이미 다룬 기사] {entry['title'] or '(제목 없음)'}{link} | {entry['covered']} 커피챗"
+            yield ""
+        else:
+            yield f"[제목] {entry['title'] or '(제목 없음)'}"
+            for link in entry["links"]:
+                yield f"[링크] {link}"
+            if entry["body"]:
+                yield "[내용]"
+                yield from entry["body"]
+            yield ""
+
+# 줄들을 텍스트 버퍼에 줄바꿈으로 이어서 기록 ("\n".join 과 같은 결과, 중간 목록 / 문자열을 만들지 않음)
+def write_lines(lines: Iterable[str], out: TextIO) -> None:
+    for index, line in enumerate(lines):
+        if index:
+            out.write("\n")
+        out.write(line)
+
+# 날짜 / 작성자 / 기사 항목을 프롬프트용 텍스트로 변환
+def render_page_entries(entries: List[Dict[str, Any]]) -> str:
+    out = io.StringIO()
+    write_lines(iter_page_entry_lines(entries), out)
+    return out.getvalue()
+
+# 파싱된 노션 블록을 텍스트 형식으로 변환
+def convert_parsed_page_to_text(parsed_page: Dict[str, Any]) -> str:
+    return render_page_entries(extract_page_entries(parsed_page))
+
+# 페이지별 항목을 하나의 텍스트 버퍼에 차례로 기록 (페이지별 문자열을 만들지 않음)
+def write_pages_entries_text(pages_entries: Iterable[List[Dict[str, Any]]], out: TextIO) -> None:
+    for entries in pages_entries:
+        write_lines(iter_page_entry_lines(entries), out)
+
+# 파싱된 페이지들을 하나의 텍스트 버퍼에 차례로 기록
+# ("".join(convert_all_parsed_pages_to_text(...)) 와 같은 결과)
+def write_parsed_pages_text(parsed_pages: Iterable[Dict[str, Any]], out: TextIO) -> None:
+    write_pages_entries_text((extract_page_entries(page) for page in parsed_pages), out)
 
 # 모든 파싱된 노션 블록을 텍스트 형식으로 변환
 def convert_all_parsed_pages_to_text(parsed_pages: List[Dict[str, Any]]) -> List[str]:
@@ -0,0 +1,186 @@
+import asyncio
+import contextvars
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config.settings import NOTION_MAX_RETRIES, NOTION_RATE_LIMIT_BURST, NOTION_RATE_LIMIT_PER_SEC
+from app.metrics.recorder import metrics
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 진행 중인 Notion 호출의 엔드포인트 이름 (HTTP 응답 훅에서 지표 라벨로 사용)
+_current_endpoint: contextvars.ContextVar[str] = contextvars.ContextVar("notion_endpoint", default="unknown")
+
+# 토큰 버킷 방식 요청 속도 제한기 (동기/비동기 호출이 하나의 버킷을 공유)
+# - 토큰을 미리 예약하고 부족분만큼 대기하므로 호출 순서대로 공평하게 처리됨
+# - 429 응답의 Retry-After 동안은 버킷 전체를 멈춰 다른 동시 요청도 함께 대기
+class RateLimiter:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.throttled_seconds = 0.0
+        self.retries = 0
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    # 토큰 1개 예약 후 대기해야 할 시간(초) 반환
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self.throttled_seconds += wait
+            return wait
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    # Retry-After 동안 모든 요청 일시 정지
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def record_backoff(self, seconds: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.throttled_seconds += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "throttled_seconds": round(self.throttled_seconds, 3)
+        }
+
+
+# 프로세스 공용 Notion 속도 제한기
+notion_rate_limiter = RateLimiter(rate=NOTION_RATE_LIMIT_PER_SEC, burst=NOTION_RATE_LIMIT_BURST)
+
+# 재시도 가능한 오류면 대기 시간(초), 아니면 None 반환
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    # 오류가 났을 때만 필요하므로 여기서 import (시작 시간 단축)
+    import httpx
+    from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+    if isinstance(error, HTTPResponseError):
+        if error.status not in RETRYABLE_STATUS:
+            return None
+        retry_after = error.headers.get("retry-after") if error.headers else None
+        if retry_after:
+            try:
+                return float(retry_after) + random.uniform(0, 0.5)
+            except ValueError:
+                pass
+    elif not isinstance(error, (RequestTimeoutError, httpx.TransportError)):
+        return None
+
+    # 지수 백오프 + 지터
+    base_delay = min(30.0, 0.5 * (2 ** attempt))
+    return base_delay / 2 + random.uniform(0, base_delay / 2)
+
+def _should_retry(error: Exception, attempt: int, limiter: RateLimiter) -> Optional[float]:
+    if attempt >= NOTION_MAX_RETRIES:
+        return None
+    delay = _retry_delay(error, attempt)
+    if delay is None:
+        return None
+
+    logger.warning(f"Notion API 재시도 {attempt + 1}/{NOTION_MAX_RETRIES} ({delay:.1f}초 후): {str(error)}")
+    metrics.increment("notion_retries", status=getattr(error, "status", type(error).__name__))
+
+    # 429 는 버킷 전체를 멈추고, 대기는 다음 acquire 에서 처리 (대기 시간도 그쪽에서 집계)
+    if getattr(error, "status", None) == 429:
+        limiter.pause(delay)
+        limiter.record_backoff(0.0)
+        return 0.0
+
+    limiter.record_backoff(delay)
+    return delay
+
+# 지표 라벨용 엔드포인트 이름 (BlocksChildrenEndpoint.list -> blocks.children.list)
+def _endpoint_name(method: Callable[..., Any]) -> str:
+    qualname = getattr(method, "__qualname__", getattr(method, "__name__", "unknown"))
+    owner, _, name = qualname.rpartition(".")
+    owner = owner.replace("Endpoint", "")
+    if not owner:
+        return name
+    return ".".join(part.lower() for part in re.findall(r"[A-Z][a-z0-9]*", owner)) + f".{name}"
+
+# 응답 크기 기록: 응답 본문을 다시 직렬화하지 않고 Content-Length 사용 (없으면 받은 본문 길이)
+def _record_response_size(response: Any) -> None:
+    size = response.headers.get("content-length")
+    if size is None:
+        response.read()
+        size = len(response.content)
+    metrics.increment("notion_response_bytes", int(size), endpoint=_current_endpoint.get())
+
+async def _arecord_response_size(response: Any) -> None:
+    if response.headers.get("content-length") is None:
+        await response.aread()
+    _record_response_size(response)
+
+# Notion 용 httpx 클라이언트의 event_hooks (응답 크기를 notion_response_bytes 로 집계)
+def notion_event_hooks(asynchronous: bool = False) -> Dict[str, List[Callable[..., Any]]]:
+    return {"response": [_arecord_response_size if asynchronous else _record_response_size]}
+
+# 속도 제한 + 재시도가 적용된 Notion 호출 (동기)
+def call_notion(method: Callable[..., Any], *args, limiter: RateLimiter = notion_rate_limiter, **kwargs) -> Any:
+    endpoint = _endpoint_name(method)
+    attempt = 0
+    while True:
+        limiter.acquire()
+        token = _current_endpoint.set(endpoint)
+        try:
+            with metrics.span("notion_request", endpoint=endpoint):
+                response = method(*args, **kwargs)
+            metrics.increment("notion_requests", endpoint=endpoint)
+            return response
+        except Exception as e:
+            delay = _should_retry(e, attempt, limiter)
+            if delay is None:
+                raise
+            if delay:
+                time.sleep(delay)
+            attempt += 1
+        finally:
+            _current_endpoint.reset(token)
+
+# 속도 제한 + 재시도가 적용된 Notion 호출 (비동기)
+async def acall_notion(method: Callable[..., Any], *args, limiter: RateLimiter = notion_rate_limiter, **kwargs) -> Any:
+    endpoint = _endpoint_name(method)
+    attempt = 0
+    while True:
+        await limiter.acquire_async()
+        token = _current_endpoint.set(endpoint)
+        try:
+            with metrics.span("notion_request", endpoint=endpoint):
+                response = await method(*args, **kwargs)
+            metrics.increment("notion_requests", endpoint=endpoint)
+            return response
+        except Exception as e:
+            delay = _should_retry(e, attempt, limiter)
+            if delay is None:
+                raise
+            if delay:
+                await asyncio.sleep(delay)
+            attempt += 1
+        finally:
+            _current_endpoint.reset(token)
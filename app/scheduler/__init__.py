@@ -0,0 +1,3 @@
+"""
+주기 실행(cron 스케줄, 데몬) 관련 모듈
+"""
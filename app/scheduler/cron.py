@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from typing import List, Set
+
+
+# 필드별 허용 범위 (분, 시, 일, 월, 요일 / 요일은 0=일요일, 7 도 일요일로 취급)
+FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+# 다음 실행 시각 탐색 한도 (존재하지 않는 날짜 조합에서 무한 루프 방지)
+MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"cron 간격은 1 이상이어야 합니다: {field}")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+
+        if not minimum <= start <= end <= maximum:
+            raise ValueError(f"cron 값이 범위({minimum}-{maximum})를 벗어났습니다: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+# 5필드 cron 표현식 (분 시 일 월 요일)
+# - *, 목록(1,3), 범위(1-5), 간격(*/15, 0-30/10) 지원
+# - 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+class CronSchedule:
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression!r}")
+
+        try:
+            parsed = [_parse_field(field, *FIELD_RANGES[i]) for i, field in enumerate(fields)]
+        except ValueError as e:
+            raise ValueError(f"잘못된 cron 표현식 {expression!r}: {str(e)}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+        # Vixie cron 과 같이 "*" 로 시작하는 필드(*/2 포함)는 제한 없음으로 취급 (일 / 요일 OR 규칙 판단용)
+        self.day_restricted = not fields[2].startswith("*")
+        self.weekday_restricted = not fields[4].startswith("*")
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day_match = moment.day in self.days
+        weekday_match = (moment.isoweekday() % 7) in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    # after 이후(같은 분 제외) 첫 실행 시각 (after 의 tzinfo 유지)
+    def next_after(self, after: datetime) -> datetime:
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=MAX_SEARCH_DAYS)
+
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._matches_day(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment
+
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식입니다: {self.expression!r}")
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+# 세미콜론으로 구분된 여러 cron 표현식 파싱
+def parse_schedules(expressions: str) -> List[CronSchedule]:
+    return [CronSchedule(expression.strip()) for expression in expressions.split(";") if expression.strip()]
@@ -1,12 +1,43 @@
-import requests
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, Optional, Union
+import hashlib
 import json
+import logging
 import re
-from app.config.settings import SLACK_WEBHOOK_JARVIS_TEST
+import threading
+import time
+from app.config.settings import SLACK_WEBHOOK_JARVIS_TEST, SLACK_TIMEOUT, SLACK_MAX_RETRIES, SLACK_MAX_PARALLEL
+from app.metrics.recorder import metrics
 from app.summarizer.formatter import format_summary_to_slack_message
 
+# requests 는 실제로 전송할 때 import (메시지 포맷팅만 하는 경로의 시작 시간 단축)
+if TYPE_CHECKING:
+    import requests
 
-# 텍스트를 슬랙 블록 형식으로 변환
+
+logger = logging.getLogger('tech_trend_bot')
+
+DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+CATEGORY_PATTERN = re.compile(r"^[🔵🟣🟡🟢🟠🟤]\s+\*")
+
+SLACK_MAX_BLOCKS = 50  # Slack 메시지당 최대 블록 수
+SLACK_MAX_SECTION_CHARS = 2900  # section 블록 텍스트 제한(3000자) 여유분
+
+
+# 제목 줄을 슬랙 헤더 블록으로 변환 (YYYY-MM-DD -> YYYY년 M월 D일)
+def _format_header_block(header_text: str) -> Dict[str, Any]:
+    date_match = DATE_PATTERN.search(header_text)
+    if date_match:
+        year, month, day = date_match.groups()
+        formatted_date = f"{year}년 {int(month)}월 {int(day)}일"
+        header_text = header_text.replace(f"{year}-{month}-{day}", formatted_date)
+
+    return {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": f"*{header_text[:SLACK_MAX_SECTION_CHARS]}*"}
+    }
+
+# 텍스트를 슬랙 블록 형식으로 변환 (단일 메시지, 블록 수 제한 초과분은 생략)
 def format_blocks_from_text(text: str) -> Dict[str, List[Dict[str, Any]]]:
     lines = text.strip().split("\n")
     blocks: List[Dict[str, Any]] = []
@@ -14,17 +45,7 @@ def format_blocks_from_text(text: str) -> Dict[str, List[Dict[str, Any]]]:
     if lines and lines[0]:
         # 앞에 디바이더 추가
         # blocks.append({"type": "divider"})
-        header_text = lines[0]
-        date_match = re.search(r"(\d{4})-(\d{2})-(\d{2})", header_text)
-        if date_match:
-            year, month, day = date_match.groups()
-            formatted_date = f"{year}년 {int(month)}월 {int(day)}일"
-            header_text = header_text.replace(f"{year}-{month}-{day}", formatted_date)
-        
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": f"*{header_text[:2900]}*"}
-        })
+        blocks.append(_format_header_block(lines[0]))
         lines = lines[1:]
 
     current_section_text = ""
@@ -48,7 +69,7 @@ def format_blocks_from_text(text: str) -> Dict[str, List[Dict[str, Any]]]:
             continue
 
         # 카테고리 시작:
-        if re.match(r"^[🔵🟣🟡🟢🟠🟤]\s+\*", line):
+        if CATEGORY_PATTERN.match(line):
             if len(blocks) >= block_count_limit:
                 break
             flush_section()
@@ -79,19 +100,259 @@ def format_blocks_from_text(text: str) -> Dict[str, List[Dict[str, Any]]]:
     return {"blocks": blocks}
 
 
+# 카테고리 단위로 줄을 묶고, 카테고리 안에서는 주제(•) 단위 조각으로 나눔
+# 조각 문자열은 format_blocks_from_text 와 같은 규칙으로 렌더링
+def _group_sections(lines: List[str]) -> List[Dict[str, Any]]:
+    sections = [{"header": None, "items": [[]]}]
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            sections[-1]["items"][-1].append("\n")
+        elif CATEGORY_PATTERN.match(line):
+            sections.append({"header": f"{line}\n\n", "items": [[]]})
+        elif line.startswith("• "):
+            sections[-1]["items"].append([f"\n{line}\n" if line.startswith("• _") else f"{line}\n"])
+        else:
+            sections[-1]["items"][-1].append(f"{line}\n")
+
+    return [
+        section for section in sections
+        if section["header"] or "".join("".join(item) for item in section["items"]).strip()
+    ]
+
+# 카테고리 하나를 section 블록 텍스트 목록으로 채움 (주제 경계 우선, 넘치면 줄 경계에서 분할)
+def _pack_section_texts(header: Optional[str], items: List[List[str]], max_chars: int) -> List[str]:
+    texts: List[str] = []
+    current = header or ""
+    has_content = False
+
+    def fits(candidate: str) -> bool:
+        return len(candidate.strip()) <= max_chars
+
+    def close() -> None:
+        nonlocal current, has_content
+        if current.strip():
+            texts.append(current.strip())
+        current = ""
+        has_content = False
+
+    for item in items:
+        item_text = "".join(item)
+        if not item_text:
+            continue
+        if fits(current + item_text):
+            current += item_text
+            has_content = has_content or bool(item_text.strip())
+            continue
+
+        # 이미 주제가 담긴 블록이면 닫고 새 블록에서 주제 시작 (카테고리 제목만 있는 블록은 유지)
+        if has_content:
+            close()
+        if fits(current + item_text):
+            current += item_text
+            has_content = True
+            continue
+
+        # 주제 하나가 블록 하나보다 크면 줄 경계에서 나눔
+        for piece in item:
+            if not fits(current + piece) and current.strip():
+                close()
+            # 한 줄이 블록 제한보다 긴 경우만 글자 수 기준으로 자름
+            while not fits(piece):
+                texts.append(piece.strip()[:max_chars])
+                piece = piece.strip()[max_chars:]
+            current += piece
+            has_content = True
+
+    close()
+    return texts
+
+# 텍스트를 여러 슬랙 메시지로 나누어 변환 (내용 생략 없음)
+# - 주제 / 줄 중간에서 자르지 않고, 카테고리 제목은 첫 주제와 같은 블록에 둠
+# - 블록을 순서대로 가득 채우므로 메시지 수가 최소가 됨
+def format_messages_from_text(
+    text: str,
+    max_blocks: int = SLACK_MAX_BLOCKS,
+    max_chars: int = SLACK_MAX_SECTION_CHARS
+) -> List[Dict[str, List[Dict[str, Any]]]]:
+    lines = text.strip().split("\n")
+    first_blocks: List[Dict[str, Any]] = []
+    if lines and lines[0]:
+        first_blocks.append(_format_header_block(lines[0]))
+        lines = lines[1:]
+
+    # 같은 메시지에 있어야 하는 블록 묶음 (divider + 카테고리 첫 블록)
+    units: List[List[Dict[str, Any]]] = []
+    for section in _group_sections(lines):
+        texts = _pack_section_texts(section["header"], section["items"], max_chars)
+        blocks = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": section_text}}
+            for section_text in texts
+        ]
+        if section["header"] and blocks:
+            units.append([{"type": "divider"}, blocks[0]])
+            blocks = blocks[1:]
+        units.extend([block] for block in blocks)
+
+    messages: List[Dict[str, List[Dict[str, Any]]]] = []
+    current = first_blocks
+    for unit in units:
+        if current and len(current) + len(unit) > max_blocks:
+            messages.append({"blocks": current})
+            current = []
+        current.extend(unit)
+
+    if current:
+        messages.append({"blocks": current})
+    return messages
+
+
+# 프로세스 공용 HTTP 세션 (웹훅 간 커넥션 재사용)
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+def get_session() -> "requests.Session":
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(4, SLACK_MAX_PARALLEL))
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+    return _session
+
+# 로그용 웹훅 주소 마스킹 (토큰 부분 숨김)
+def mask_webhook(webhook_url: Optional[str]) -> str:
+    if not webhook_url:
+        return "(설정되지 않음)"
+    if "/services/" in webhook_url:
+        base, token = webhook_url.split("/services/", 1)
+        return f"{base}/services/{token.split('/')[0]}/***"
+    return webhook_url.split("?")[0][:40] + "..."
+
+# 웹훅 하나로 전송 (429 는 Retry-After 만큼, 5xx / 네트워크 오류는 지수 백오프 후 재시도)
+def deliver_to_webhook(webhook_url: str, message: Dict[str, Any]) -> Dict[str, Any]:
+    from requests import RequestException
+
+    started = time.perf_counter()
+    attempts = 0
+    error = None
+
+    while attempts < SLACK_MAX_RETRIES:
+        attempts += 1
+        try:
+            response = get_session().post(
+                webhook_url,
+                json=message,
+                headers={"Content-Type": "application/json"},
+                timeout=SLACK_TIMEOUT
+            )
+            if response.status_code == 200:
+                error = None
+                break
+
+            error = f"Slack API 응답 오류 ({response.status_code}): {response.text}"
+            if response.status_code == 429:
+                try:
+                    wait_time = float(response.headers.get("Retry-After", "1"))
+                except ValueError:
+                    wait_time = 1.0
+            elif response.status_code >= 500:
+                wait_time = 2 ** (attempts - 1)
+            else:
+                break
+        except RequestException as e:
+            error = str(e)
+            wait_time = 2 ** (attempts - 1)
+
+        if attempts < SLACK_MAX_RETRIES:
+            logger.warning(f"Slack 전송 재시도 {attempts}/{SLACK_MAX_RETRIES} ({wait_time}초 후): {error}")
+            time.sleep(wait_time)
+
+    elapsed = time.perf_counter() - started
+    status = "sent" if error is None else "failed"
+    metrics.observe("slack_post", elapsed, status=status)
+    metrics.increment("slack_requests", attempts)
+    metrics.increment("slack_retries", attempts - 1)
+    metrics.increment("slack_payload_bytes", len(json.dumps(message, ensure_ascii=False).encode("utf-8")) * attempts)
+
+    return {
+        "webhook": mask_webhook(webhook_url),
+        "ok": error is None,
+        "status": status,
+        "attempts": attempts,
+        "latency_ms": round(elapsed * 1000, 1),
+        "error": error
+    }
+
 # Slack 메시지 전송
 def post_to_slack(webhook_url: str, message: Dict[str, Any]) -> bool:
-    try:
-        response = requests.post(
-            webhook_url,
-            json=message,
-            headers={"Content-Type": "application/json"}
-        )
-        if response.status_code != 200:
-            raise Exception(f"Slack API 응답 오류: {response.text}")
-        return True
-    except Exception as e:
-        raise Exception(f"Slack 전송 실패: {str(e)}")
+    result = deliver_to_webhook(webhook_url, message)
+    if not result["ok"]:
+        raise Exception(f"Slack 전송 실패: {result['error']}")
+    return True
+
+# 진행 상황 기록용 웹훅 키 (웹훅 주소는 비밀값이라 해시만 저장)
+def webhook_key(webhook_url: str) -> str:
+    return hashlib.sha256(webhook_url.encode("utf-8")).hexdigest()[:16]
+
+# 웹훅 하나로 여러 메시지를 순서대로 전송 (실패 시 이후 메시지는 보내지 않음)
+# start 개는 이미 보낸 메시지로 보고 건너뛰고, 한 통 보낼 때마다 on_sent(지금까지 보낸 수) 호출
+def deliver_messages_to_webhook(
+    webhook_url: str,
+    messages: List[Dict[str, Any]],
+    start: int = 0,
+    on_sent: Optional[Callable[[int], None]] = None
+) -> Dict[str, Any]:
+    result = {
+        "webhook": mask_webhook(webhook_url),
+        "ok": True,
+        "status": "sent",
+        "messages": start,
+        "skipped": start,
+        "attempts": 0,
+        "latency_ms": 0.0,
+        "error": None
+    }
+    for message in messages[start:]:
+        message_result = deliver_to_webhook(webhook_url, message)
+        result["attempts"] += message_result["attempts"]
+        result["latency_ms"] = round(result["latency_ms"] + message_result["latency_ms"], 1)
+        if not message_result["ok"]:
+            result.update(ok=False, status="failed", error=message_result["error"])
+            break
+        result["messages"] += 1
+        if on_sent:
+            on_sent(result["messages"])
+    return result
+
+# 여러 웹훅으로 동시에 전송하고 대상별 결과(성공 여부, 시도 횟수, 지연 시간) 반환
+# message 에는 메시지 하나 또는 format_messages_from_text 의 메시지 목록을 넘길 수 있음
+# progress(웹훅 키 -> 이미 보낸 메시지 수)가 있으면 그 다음 메시지부터 전송하고, 보낼 때마다 on_progress(웹훅 키, 보낸 수) 호출
+def post_to_webhooks(
+    webhook_urls: List[str],
+    message: Union[Dict[str, Any], List[Dict[str, Any]]],
+    progress: Optional[Dict[str, int]] = None,
+    on_progress: Optional[Callable[[str, int], None]] = None
+) -> List[Dict[str, Any]]:
+    if not webhook_urls:
+        return []
+    if not all(webhook_urls):
+        raise ValueError("설정되지 않은 웹훅(빈 값)이 전송 대상에 있습니다")
+    messages = message if isinstance(message, list) else [message]
+    progress = progress or {}
+
+    def deliver(webhook_url: str) -> Dict[str, Any]:
+        key = webhook_key(webhook_url)
+        on_sent = (lambda sent: on_progress(key, sent)) if on_progress else None
+        return deliver_messages_to_webhook(webhook_url, messages, progress.get(key, 0), on_sent)
+
+    with ThreadPoolExecutor(max_workers=min(len(webhook_urls), SLACK_MAX_PARALLEL)) as executor:
+        return list(executor.map(deliver, webhook_urls))
 
 
 # 테스트용
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config.settings import CHECKPOINT_DIR
+from app.metrics.recorder import metrics
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+# 파이프라인 단계 (순서대로 실행)
+STAGES = ["parse", "text", "summary", "json", "slack"]
+
+_MISSING = object()
+
+
+# 단계 입력값 해시 (입력이 같으면 같은 결과를 재사용)
+def hash_inputs(inputs: Any) -> str:
+    payload = json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# 실행 단위 체크포인트 (기간별 디렉토리에 단계 결과를 JSON 으로 저장)
+# - resume=True 면 입력 해시가 같은 단계는 저장된 결과를 그대로 사용
+# - from_stage 를 지정하면 해당 단계부터는 저장된 결과를 무시하고 다시 실행
+class RunCheckpoint:
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        resume: bool = False,
+        from_stage: Optional[str] = None,
+        root: str = CHECKPOINT_DIR
+    ):
+        if from_stage is not None and from_stage not in STAGES:
+            raise ValueError(f"알 수 없는 단계: {from_stage} (가능한 값: {', '.join(STAGES)})")
+
+        self.directory = os.path.join(root, f"{start_date}_{end_date}")
+        self.resume = resume
+        self.from_stage = from_stage
+        self.reused: List[str] = []
+
+    def _path(self, stage: str) -> str:
+        return os.path.join(self.directory, f"{stage}.json")
+
+    def _progress_path(self, stage: str) -> str:
+        return os.path.join(self.directory, f"{stage}.progress.json")
+
+    def _forced(self, stage: str) -> bool:
+        return self.from_stage is not None and STAGES.index(stage) >= STAGES.index(self.from_stage)
+
+    # 재사용 가능한 단계 결과 반환 (없으면 _MISSING)
+    def load(self, stage: str, input_hash: str) -> Any:
+        if not self.resume or self._forced(stage) or not os.path.exists(self._path(stage)):
+            return _MISSING
+
+        try:
+            with open(self._path(stage), "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"체크포인트 읽기 실패 ({stage}): {str(e)}")
+            return _MISSING
+
+        if checkpoint.get("input_hash") != input_hash:
+            return _MISSING
+        return checkpoint.get("output")
+
+    # 단계 결과 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 깨지지 않도록)
+    def save(self, stage: str, input_hash: str, output: Any) -> None:
+        self._write(self._path(stage), {
+            "stage": stage,
+            "input_hash": input_hash,
+            "savedAt": datetime.now().isoformat(),
+            "output": output
+        })
+
+    # 끝나지 않은 단계의 진행 상황 (예: slack 단계의 웹훅별 전송한 메시지 수)
+    # 재개 시 입력 해시가 같으면 반환해 이미 끝난 부분을 건너뛰게 함 (없으면 빈 dict)
+    def load_progress(self, stage: str, input_hash: str) -> Dict[str, Any]:
+        path = self._progress_path(stage)
+        if not self.resume or self._forced(stage) or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                progress = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"진행 상황 읽기 실패 ({stage}): {str(e)}")
+            return {}
+        return progress.get("progress", {}) if progress.get("input_hash") == input_hash else {}
+
+    def save_progress(self, stage: str, input_hash: str, progress: Dict[str, Any]) -> None:
+        self._write(self._progress_path(stage), {
+            "stage": stage,
+            "input_hash": input_hash,
+            "savedAt": datetime.now().isoformat(),
+            "progress": progress
+        })
+
+    def _write(self, path: str, payload: Dict[str, Any]) -> None:
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, default=str)
+        os.replace(temp_path, path)
+
+# 체크포인트가 있으면 재사용하고, 없으면 실행 후 저장 (결과가 비어 있으면 저장하지 않음)
+# 실제로 실행한 단계만 stage 타이머에 기록하고, 재사용한 단계는 stage_checkpoint_hits 로 집계
+def run_stage(checkpoint: Optional[RunCheckpoint], stage: str, inputs: Any, func: Callable[[], Any]) -> Any:
+    if checkpoint is None:
+        with metrics.span("stage", stage=stage):
+            return func()
+
+    input_hash = hash_inputs(inputs)
+    output = checkpoint.load(stage, input_hash)
+    if output is not _MISSING:
+        logger.info(f"체크포인트 재사용: {stage} ({input_hash[:12]})")
+        checkpoint.reused.append(stage)
+        metrics.increment("stage_checkpoint_hits", stage=stage)
+        return output
+
+    with metrics.span("stage", stage=stage):
+        output = func()
+    if output:
+        checkpoint.save(stage, input_hash, output)
+    return output
@@ -0,0 +1,99 @@
+import argparse
+import json
+import logging
+import time
+from datetime import date, datetime, time as datetime_time
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from app.metrics.recorder import metrics
+from app.storage.mongo import COLLECTION_NAME, DATABASE_NAME, _indexed_collections, get_client, get_collection
+from app.summarizer.dedup import coverage_keys
+
+if TYPE_CHECKING:
+    from pymongo.collection import Collection
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+COVERAGE_COLLECTION_NAME = "covered_articles"
+
+
+# 이전 주에 다룬 기사 색인 (요약본 컬렉션 + 키(정규화 링크 / 제목 지문)당 문서 하나, date 는 처음 다룬 요약본 날짜)
+def get_coverage_collection() -> "Collection":
+    from pymongo import ASCENDING
+
+    collection = get_client()[DATABASE_NAME][COVERAGE_COLLECTION_NAME]
+    if collection.full_name not in _indexed_collections:
+        collection.create_index([("collection", ASCENDING), ("date", ASCENDING)], name="collection_date")
+        _indexed_collections.add(collection.full_name)
+    return collection
+
+def _coverage_operations(collection_name: str, summary_date: datetime, sections: List[Dict[str, Any]]) -> List[Any]:
+    from pymongo import UpdateOne
+
+    operations = []
+    for section in sections:
+        for item in section.get("items", []):
+            for key in coverage_keys(item.get("title"), [item["link"]] if item.get("link") else []):
+                operations.append(UpdateOne(
+                    {"_id": f"{collection_name}|{key}"},
+                    {
+                        "$min": {"date": summary_date},
+                        "$setOnInsert": {"collection": collection_name, "key": key, "title": item.get("title")}
+                    },
+                    upsert=True
+                ))
+    return operations
+
+# 요약본의 주제를 색인에 추가 (이미 있는 키는 더 이른 날짜만 반영)
+def record_covered_items(summary_date: datetime, sections: List[Dict[str, Any]], collection_name: str = COLLECTION_NAME) -> int:
+    operations = _coverage_operations(collection_name, summary_date, sections)
+    if operations:
+        started = time.perf_counter()
+        get_coverage_collection().bulk_write(operations, ordered=False)
+        metrics.observe("coverage_write", time.perf_counter() - started)
+    return len(operations)
+
+# 이번 주 기사 키 중 before 이전 요약본에서 이미 다룬 것만 조회 (키 -> 처음 다룬 날짜)
+# _id 조회 한 번이라 색인 전체 크기와 무관하게 이번 주 기사 수만큼만 읽음
+def load_covered_index(keys: List[str], before: date, collection_name: str = COLLECTION_NAME) -> Dict[str, str]:
+    if not keys:
+        return {}
+    started = time.perf_counter()
+    cursor = get_coverage_collection().find(
+        {
+            "_id": {"$in": [f"{collection_name}|{key}" for key in keys]},
+            "date": {"$lt": datetime.combine(before, datetime_time.min)}
+        },
+        {"_id": 0, "key": 1, "date": 1}
+    )
+    covered = {document["key"]: document["date"].strftime("%Y-%m-%d") for document in cursor}
+    metrics.observe("coverage_load", time.perf_counter() - started)
+    return covered
+
+# 저장된 요약본 전체로 색인 재생성 (최초 도입 시 1회)
+def rebuild_coverage_index(collection_name: str = COLLECTION_NAME) -> Dict[str, Any]:
+    started = time.perf_counter()
+    coverage = get_coverage_collection()
+    coverage.delete_many({"collection": collection_name})
+
+    summaries = 0
+    keys = 0
+    for document in get_collection(collection_name).find({}, {"_id": 0, "date": 1, "sections": 1}):
+        summaries += 1
+        operations = _coverage_operations(collection_name, document["date"], document.get("sections", []))
+        if operations:
+            coverage.bulk_write(operations, ordered=False)
+            keys += len(operations)
+
+    report = {"summaries": summaries, "keys": keys, "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+    logger.info(f"기사 색인 재생성 완료 ({collection_name}): {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이전 주에 다룬 기사 색인 재생성")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--collection", default=COLLECTION_NAME, help="요약본 컬렉션")
+    args = parser.parse_args()
+    print(json.dumps(rebuild_coverage_index(args.collection), ensure_ascii=False, indent=2))
@@ -1,47 +1,272 @@
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-from app.config.settings import MONGODB_CONNECTION_STRING
-from datetime import datetime
-from typing import Dict, Any, Optional, Union
-from datetime import date
-
-
-# 요약본을 DB에 저장
-def insert_summary_to_db(summary_data: Dict[str, Any]) -> bool:
-    client: Optional[MongoClient] = None
-    try:
-        client = MongoClient(MONGODB_CONNECTION_STRING)
-        
-        # 연결 상태 확인
-        client.admin.command('ping')
-        
-        db = client["Jarvis"]
-        collection = db["tech_trend_coffee_chat_logs"]
-        
-        summary_date = datetime.strptime(summary_data["date"], "%Y-%m-%d")
-
-        document = {
-            "date": summary_date,
-            "source": summary_data.get("source"),
-            "sections": summary_data.get("sections", []),
-            "createdAt": datetime.now(),
-        }
+from app.config.settings import MONGODB_CONNECTION_STRING, MONGODB_MAX_POOL_SIZE
+from app.metrics.recorder import metrics
+from datetime import date, datetime, time as datetime_time
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+import logging
+import threading
+import time
+
+# pymongo 는 실제로 DB 에 접근할 때 import (Slack / 포맷팅만 쓰는 경로의 시작 시간 단축)
+if TYPE_CHECKING:
+    from pymongo import MongoClient
+    from pymongo.collection import Collection
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+DATABASE_NAME = "Jarvis"
+COLLECTION_NAME = "tech_trend_coffee_chat_logs"
+WATERMARK_COLLECTION_NAME = "pipeline_watermarks"
+
+# 프로세스 공용 MongoClient (커넥션 풀 재사용)
+_client: Optional["MongoClient"] = None
+_client_lock = threading.Lock()
+_indexed_collections = set()
+
+
+def get_client() -> "MongoClient":
+    global _client
+    with _client_lock:
+        if _client is None:
+            from pymongo import MongoClient
+            _client = MongoClient(
+                MONGODB_CONNECTION_STRING,
+                maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                serverSelectionTimeoutMS=10000
+            )
+    return _client
+
+def close_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            _indexed_collections.clear()
+
+# 최초 1회 인덱스 생성
+# - date 유니크 인덱스: 날짜 기준 upsert, 기간 조회, 커서 페이지네이션
+# - sections.category + date: 카테고리 필터 후 최신순 조회
+# - 텍스트 인덱스 (카테고리 / 주제 제목 / 요약 문장): 전문 검색, 한국어는 형태소 분석이 없어 어간 추출 없이(none) 단어 단위로 색인
+def ensure_indexes(collection: "Collection") -> None:
+    from pymongo import ASCENDING, DESCENDING, TEXT
+    from pymongo.errors import OperationFailure
+
+    if collection.full_name in _indexed_collections:
+        return
+    try:
+        collection.create_index([("date", ASCENDING)], unique=True, name="date_unique")
+    except OperationFailure as e:
+        # 기존 중복 데이터가 있으면 유니크 인덱스를 만들 수 없음 -> 저장은 계속 진행
+        logger.warning(f"date 유니크 인덱스 생성 실패: {str(e)}")
+
+    try:
+        collection.create_index([("sections.category", ASCENDING), ("date", DESCENDING)], name="category_date")
+        collection.create_index(
+            [("sections.category", TEXT), ("sections.items.title", TEXT), ("sections.items.bullets", TEXT)],
+            weights={"sections.items.title": 5, "sections.category": 2, "sections.items.bullets": 1},
+            default_language="none",
+            name="summary_text"
+        )
+    except OperationFailure as e:
+        logger.warning(f"조회용 인덱스 생성 실패: {str(e)}")
+    _indexed_collections.add(collection.full_name)
+
+def get_collection(collection_name: str = COLLECTION_NAME) -> "Collection":
+    collection = get_client()[DATABASE_NAME][collection_name]
+    ensure_indexes(collection)
+    return collection
+
+def build_summary_document(summary_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "date": datetime.strptime(summary_data["date"], "%Y-%m-%d"),
+        "source": summary_data.get("source"),
+        "sections": summary_data.get("sections", []),
+        "lastEditedTime": summary_data.get("lastEditedTime"),
+        "createdAt": datetime.now(),
+    }
+
+def _record_write(operation: str, documents: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    elapsed_ms = elapsed * 1000
+    metrics.observe("mongo_write", elapsed, operation=operation)
+    metrics.increment("mongo_documents", documents, operation=operation)
+    logger.info(f"MongoDB {operation}: 문서 {documents}개, {elapsed_ms:.1f}ms")
+
+# 요약본 저장 후 파생 데이터 갱신: 주별 트렌드 집계, 이전 주 기사 색인
+# (갱신 실패는 요약본 저장 결과에 영향 없음)
+def _on_summary_saved(summary_date: datetime, sections: List[Dict[str, Any]], collection_name: str) -> None:
+    from app.storage.coverage import record_covered_items
+    from app.storage.trends import refresh_trend_rollup
 
-        existing = collection.find_one({"date": summary_date})
-        if existing:
+    try:
+        refresh_trend_rollup(summary_date, sections, collection_name)
+    except Exception as e:
+        logger.warning(f"트렌드 집계 갱신 실패 ({summary_date:%Y-%m-%d}): {str(e)}")
+    try:
+        record_covered_items(summary_date, sections, collection_name)
+    except Exception as e:
+        logger.warning(f"기사 색인 갱신 실패 ({summary_date:%Y-%m-%d}): {str(e)}")
+
+# 요약본을 DB에 저장 (같은 날짜가 없을 때만 삽입하는 단일 upsert, 새로 저장되면 트렌드 집계 / 기사 색인 갱신)
+def insert_summary_to_db(summary_data: Dict[str, Any], collection_name: str = COLLECTION_NAME) -> bool:
+    from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+
+    started = time.perf_counter()
+    try:
+        collection = get_collection(collection_name)
+        document = build_summary_document(summary_data)
+
+        result = collection.update_one(
+            {"date": document["date"]},
+            {"$setOnInsert": document},
+            upsert=True
+        )
+        _record_write("upsert", 1, started)
+
+        if result.upserted_id is None:
             print(f"{summary_data['date']} 커피챗의 요약본이 이미 존재합니다.")
             return False
-        
-        collection.insert_one(document)
+
+        _on_summary_saved(document["date"], document["sections"], collection_name)
+
         print(f"{summary_data['date']} 커피챗의 요약본이 DB에 저장되었습니다.")
         return True
 
     except (ConnectionFailure, ServerSelectionTimeoutError) as e:
         raise Exception(f"MongoDB 연결 실패: {str(e)}")
-    
+
     except Exception as e:
         raise Exception(f"예상치 못한 오류 발생: {str(e)}")
-    
-    finally:
-        if client:
-            client.close()
\ No newline at end of file
+
+# 여러 요약본을 한 번의 bulk_write 로 저장 (이미 있는 날짜는 건너뜀, 새로 저장된 요약본만 트렌드 집계 / 기사 색인 갱신)
+def insert_summaries_to_db(summaries: List[Dict[str, Any]]) -> Dict[str, int]:
+    from pymongo import UpdateOne
+    from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+
+    if not summaries:
+        return {"inserted": 0, "existing": 0}
+
+    started = time.perf_counter()
+    try:
+        collection = get_collection()
+        documents = [build_summary_document(summary_data) for summary_data in summaries]
+        operations = [
+            UpdateOne({"date": document["date"]}, {"$setOnInsert": document}, upsert=True)
+            for document in documents
+        ]
+
+        result = collection.bulk_write(operations, ordered=False)
+        _record_write("bulk_upsert", len(operations), started)
+
+        for index in result.upserted_ids:
+            _on_summary_saved(documents[index]["date"], documents[index]["sections"], COLLECTION_NAME)
+
+        return {
+            "inserted": result.upserted_count,
+            "existing": len(operations) - result.upserted_count
+        }
+
+    except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+        raise Exception(f"MongoDB 연결 실패: {str(e)}")
+
+    except Exception as e:
+        raise Exception(f"예상치 못한 오류 발생: {str(e)}")
+
+# 기간 내 이미 저장된 요약본 날짜 목록 (date 인덱스 + 프로젝션)
+def find_existing_dates(start_date: date, end_date: date) -> List[date]:
+    from pymongo.errors import ConnectionFailure, PyMongoError, ServerSelectionTimeoutError
+
+    try:
+        collection = get_collection()
+        cursor = collection.find(
+            {
+                "date": {
+                    "$gte": datetime.combine(start_date, datetime_time.min),
+                    "$lte": datetime.combine(end_date, datetime_time.max)
+                }
+            },
+            {"date": 1, "_id": 0}
+        )
+        return [document["date"].date() for document in cursor]
+
+    except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+        raise Exception(f"MongoDB 연결 실패: {str(e)}")
+
+    except PyMongoError as e:
+        raise Exception(f"MongoDB 오류: {str(e)}")
+
+# 기간 내 가장 최근 요약본 (증분 실행 시 병합 대상)
+def find_summary_in_range(start_date: date, end_date: date, collection_name: str = COLLECTION_NAME) -> Optional[Dict[str, Any]]:
+    from pymongo import DESCENDING
+    from pymongo.errors import ConnectionFailure, PyMongoError, ServerSelectionTimeoutError
+
+    try:
+        collection = get_collection(collection_name)
+        return collection.find_one(
+            {
+                "date": {
+                    "$gte": datetime.combine(start_date, datetime_time.min),
+                    "$lte": datetime.combine(end_date, datetime_time.max)
+                }
+            },
+            sort=[("date", DESCENDING)]
+        )
+
+    except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+        raise Exception(f"MongoDB 연결 실패: {str(e)}")
+
+    except PyMongoError as e:
+        raise Exception(f"MongoDB 오류: {str(e)}")
+
+# 저장된 요약본의 섹션 교체 (증분 실행 병합 결과 반영, 트렌드 집계 / 기사 색인도 갱신)
+def update_summary_sections(
+    summary_date: datetime,
+    sections: List[Dict[str, Any]],
+    collection_name: str = COLLECTION_NAME,
+    last_edited_time: Optional[str] = None
+) -> bool:
+    from pymongo.errors import ConnectionFailure, PyMongoError, ServerSelectionTimeoutError
+
+    started = time.perf_counter()
+    try:
+        collection = get_collection(collection_name)
+        update: Dict[str, Any] = {"$set": {"sections": sections, "updatedAt": datetime.now()}}
+        if last_edited_time:
+            update["$max"] = {"lastEditedTime": last_edited_time}
+        result = collection.update_one({"date": summary_date}, update)
+        _record_write("update_sections", 1, started)
+        if result.matched_count == 0:
+            return False
+
+        _on_summary_saved(summary_date, sections, collection_name)
+        return True
+
+    except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+        raise Exception(f"MongoDB 연결 실패: {str(e)}")
+
+    except PyMongoError as e:
+        raise Exception(f"MongoDB 오류: {str(e)}")
+
+# 워터마크 키: 데이터베이스 + 요약본 컬렉션 + 주 시작일
+# (같은 DB 를 다른 컬렉션에 저장하는 작업끼리, 과거 주와 이번 주끼리 워터마크를 공유하지 않음)
+def watermark_id(database_id: str, collection_name: str, week_start: date) -> str:
+    return f"{database_id}:{collection_name}:{week_start:%Y-%m-%d}"
+
+# 작업 / 주별 워터마크 (그 주 요약본에 마지막으로 반영한 페이지의 last_edited_time)
+def get_watermark(database_id: str, collection_name: str, week_start: date) -> Optional[str]:
+    document = get_client()[DATABASE_NAME][WATERMARK_COLLECTION_NAME].find_one(
+        {"_id": watermark_id(database_id, collection_name, week_start)}
+    )
+    return document.get("last_edited_time") if document else None
+
+# 워터마크 갱신 ($max 라 같은 주를 다시 처리해도 뒤로 가지 않음)
+# 요약본을 새로 저장했거나 증분 병합을 마친 경우에만 호출 (이미 있던 요약본은 이번 실행 결과가 아니므로 제외)
+def set_watermark(database_id: str, collection_name: str, week_start: date, last_edited_time: Optional[str]) -> None:
+    if not last_edited_time:
+        return
+    get_client()[DATABASE_NAME][WATERMARK_COLLECTION_NAME].update_one(
+        {"_id": watermark_id(database_id, collection_name, week_start)},
+        {"$max": {"last_edited_time": last_edited_time}, "$set": {"updatedAt": datetime.now()}},
+        upsert=True
+    )
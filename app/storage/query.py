@@ -0,0 +1,183 @@
+import argparse
+import json
+import time
+from datetime import date, datetime, time as datetime_time
+from typing import Any, Dict, List, Optional
+
+from app.metrics.recorder import metrics
+from app.storage.mongo import COLLECTION_NAME, get_collection
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+CURSOR_FORMAT = "%Y-%m-%d"
+
+# 목록 조회 기본 프로젝션 (카테고리 구성만, 주제 본문 제외)
+SUMMARY_PROJECTION = {"_id": 0, "date": 1, "source": 1, "sections.emoji": 1, "sections.category": 1}
+FULL_PROJECTION = {"_id": 0, "date": 1, "source": 1, "sections": 1}
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+def _record_read(operation: str, documents: int, started: float) -> float:
+    elapsed = time.perf_counter() - started
+    metrics.observe("mongo_read", elapsed, operation=operation)
+    metrics.increment("mongo_read_documents", documents, operation=operation)
+    return round(elapsed * 1000, 2)
+
+# 기간 / 카테고리 / 커서 조건으로 조회 쿼리 구성 (모두 인덱스를 타는 조건)
+# 커서는 이전 페이지 마지막 요약본의 날짜 (date 가 유니크라 날짜 기준 keyset 페이지네이션)
+def build_query(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    category: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    date_filter: Dict[str, Any] = {}
+    if start_date:
+        date_filter["$gte"] = datetime.combine(start_date, datetime_time.min)
+    if end_date:
+        date_filter["$lte"] = datetime.combine(end_date, datetime_time.max)
+    if cursor:
+        try:
+            date_filter["$lt"] = datetime.strptime(cursor, CURSOR_FORMAT)
+        except ValueError:
+            raise ValueError(f"잘못된 커서: {cursor!r}")
+
+    query: Dict[str, Any] = {}
+    if date_filter:
+        query["date"] = date_filter
+    if category:
+        query["sections.category"] = category
+    return query
+
+def _check_limit(limit: int) -> None:
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit 은 1 ~ {MAX_PAGE_SIZE} 사이여야 합니다: {limit}")
+
+def _serialize(document: Dict[str, Any]) -> Dict[str, Any]:
+    return {**document, "date": document["date"].strftime("%Y-%m-%d")}
+
+# limit + 1 개를 읽어 다음 페이지 존재 여부 판단
+def _paginate(documents: List[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+    has_more = len(documents) > limit
+    documents = documents[:limit]
+    return {
+        "items": documents,
+        "next_cursor": documents[-1]["date"].strftime(CURSOR_FORMAT) if has_more else None
+    }
+
+# 요약본 목록 (최신순)
+# full=False 면 날짜 / 출처 / 카테고리만, True 면 주제 본문까지 반환
+def list_summaries(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    full: bool = False,
+    collection_name: str = COLLECTION_NAME
+) -> Dict[str, Any]:
+    from pymongo import DESCENDING
+
+    _check_limit(limit)
+    started = time.perf_counter()
+    collection = get_collection(collection_name)
+    documents = list(
+        collection.find(
+            build_query(start_date, end_date, category, cursor),
+            FULL_PROJECTION if full else SUMMARY_PROJECTION
+        ).sort("date", DESCENDING).limit(limit + 1)
+    )
+
+    page = _paginate(documents, limit)
+    page["items"] = [_serialize(document) for document in page["items"]]
+    page["elapsed_ms"] = _record_read("list", len(documents), started)
+    return page
+
+# 요약본 안에서 검색어가 들어간 주제만 추림 (텍스트 인덱스는 문서 단위로만 매칭하므로)
+def _matching_items(document: Dict[str, Any], terms: List[str]) -> List[Dict[str, Any]]:
+    matches = []
+    for section in document.get("sections", []):
+        for item in section.get("items", []):
+            haystack = " ".join([section.get("category", ""), item.get("title", ""), *item.get("bullets", [])]).casefold()
+            if any(term in haystack for term in terms):
+                matches.append({"emoji": section.get("emoji"), "category": section.get("category"), **item})
+    return matches
+
+# 카테고리 / 주제 제목 / 요약 문장 전문 검색 (최신순, 문서별로 검색어가 들어간 주제만 반환)
+# 검색어 문법은 MongoDB $text 와 같음 ("구절" 검색, -제외어)
+def search_summaries(
+    text: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    collection_name: str = COLLECTION_NAME
+) -> Dict[str, Any]:
+    from pymongo import DESCENDING
+
+    if not text.strip():
+        raise ValueError("검색어가 비어 있습니다")
+    _check_limit(limit)
+    started = time.perf_counter()
+    collection = get_collection(collection_name)
+    query = build_query(start_date, end_date, category, cursor)
+    query["$text"] = {"$search": text}
+    documents = list(
+        collection.find(query, {**FULL_PROJECTION, "score": {"$meta": "textScore"}})
+        .sort("date", DESCENDING)
+        .limit(limit + 1)
+    )
+
+    terms = [term.strip('"').casefold() for term in text.split() if term.strip('"') and not term.startswith("-")]
+    page = _paginate(documents, limit)
+    page["items"] = [
+        {
+            "date": document["date"].strftime("%Y-%m-%d"),
+            "source": document.get("source"),
+            "score": round(document.get("score", 0.0), 3),
+            "matches": _matching_items(document, terms)
+        }
+        for document in page["items"]
+    ]
+    page["elapsed_ms"] = _record_read("search", len(documents), started)
+    return page
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 커피챗 요약본 조회")
+    parser.add_argument("--collection", default=COLLECTION_NAME)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(subparser: argparse.ArgumentParser) -> None:
+        subparser.add_argument("--start", help="시작일 (YYYY-MM-DD)")
+        subparser.add_argument("--end", help="종료일 (YYYY-MM-DD)")
+        subparser.add_argument("--category", help="카테고리 이름 (정확히 일치)")
+        subparser.add_argument("--cursor", help="이전 결과의 next_cursor")
+        subparser.add_argument("--limit", type=int, default=DEFAULT_PAGE_SIZE)
+
+    list_parser = subparsers.add_parser("list", help="기간 / 카테고리별 요약본 목록 (최신순)")
+    add_common(list_parser)
+    list_parser.add_argument("--full", action="store_true", help="주제 본문까지 출력")
+
+    search_parser = subparsers.add_parser("search", help="주제 제목 / 요약 문장 전문 검색")
+    search_parser.add_argument("text", help="검색어")
+    add_common(search_parser)
+
+    args = parser.parse_args()
+    options = {
+        "start_date": _parse_date(args.start),
+        "end_date": _parse_date(args.end),
+        "category": args.category,
+        "cursor": args.cursor,
+        "limit": args.limit,
+        "collection_name": args.collection
+    }
+    if args.command == "list":
+        result = list_summaries(full=args.full, **options)
+    else:
+        result = search_summaries(args.text, **options)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
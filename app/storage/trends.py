@@ -0,0 +1,186 @@
+import argparse
+import json
+import logging
+import re
+import time
+from collections import Counter
+from datetime import date, datetime, time as datetime_time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from app.metrics.recorder import metrics
+from app.storage.mongo import COLLECTION_NAME, DATABASE_NAME, _indexed_collections, get_client, get_collection
+from app.summarizer.dedup import normalize_url
+
+if TYPE_CHECKING:
+    from pymongo.collection import Collection
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+TRENDS_COLLECTION_NAME = "summary_trends"
+
+# 집계 종류: 카테고리별 주제 수 / 제목 키워드 / 링크 / 링크 도메인
+TREND_KINDS = ["category", "keyword", "link", "domain"]
+
+KEYWORD_PATTERN = re.compile(r"[0-9A-Za-z가-힣][0-9A-Za-z가-힣+#.\-]*")
+KEYWORD_STOPWORDS = {
+    "the", "and", "for", "with", "from", "into", "new", "its", "are", "was", "how", "what", "why",
+    "발표", "출시", "공개", "도입", "지원", "관련", "소식", "업데이트", "계획", "예정", "및", "등"
+}
+REBUILD_BATCH_SIZE = 1000
+
+
+# 집계 컬렉션 (요약본 컬렉션별 / 날짜별 / 종류별 행)
+# 인덱스: 기간 + 종류로 상위 N 조회, 요약본 하나의 행 교체
+def get_trends_collection() -> "Collection":
+    from pymongo import ASCENDING
+
+    collection = get_client()[DATABASE_NAME][TRENDS_COLLECTION_NAME]
+    if collection.full_name not in _indexed_collections:
+        collection.create_index([("collection", ASCENDING), ("kind", ASCENDING), ("date", ASCENDING)], name="collection_kind_date")
+        collection.create_index([("collection", ASCENDING), ("date", ASCENDING)], name="collection_date")
+        _indexed_collections.add(collection.full_name)
+    return collection
+
+# 제목 키워드 (소문자, 2글자 이상, 글자가 없는 토큰(숫자, 버전)과 불용어 제외)
+def extract_keywords(title: str) -> List[str]:
+    keywords = []
+    for token in KEYWORD_PATTERN.findall(title or ""):
+        keyword = token.strip(".-").lower()
+        if len(keyword) < 2 or not any(char.isalpha() for char in keyword) or keyword in KEYWORD_STOPWORDS:
+            continue
+        keywords.append(keyword)
+    return keywords
+
+# 요약본 하나의 섹션에서 종류별 집계 (한 주제 안에서 같은 키워드는 한 번만 셈)
+def count_trends(sections: List[Dict[str, Any]]) -> Dict[str, Counter]:
+    counts = {kind: Counter() for kind in TREND_KINDS}
+    for section in sections:
+        category = (section.get("category") or "").strip()
+        for item in section.get("items", []):
+            if category:
+                counts["category"][category] += 1
+            counts["keyword"].update(set(extract_keywords(item.get("title", ""))))
+            if item.get("link"):
+                link = normalize_url(item["link"])
+                counts["link"][link] += 1
+                counts["domain"][urlsplit(link).netloc] += 1
+    return counts
+
+def build_trend_rows(collection_name: str, summary_date: datetime, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {"collection": collection_name, "date": summary_date, "kind": kind, "key": key, "count": count}
+        for kind, counter in count_trends(sections).items()
+        for key, count in counter.items()
+        if key
+    ]
+
+# 요약본 하나의 집계 행 교체 (저장 / 섹션 병합 시 호출, 같은 요약본을 다시 반영해도 중복 집계 없음)
+def refresh_trend_rollup(summary_date: datetime, sections: List[Dict[str, Any]], collection_name: str = COLLECTION_NAME) -> int:
+    started = time.perf_counter()
+    trends = get_trends_collection()
+    rows = build_trend_rows(collection_name, summary_date, sections)
+    trends.delete_many({"collection": collection_name, "date": summary_date})
+    if rows:
+        trends.insert_many(rows, ordered=False)
+    metrics.observe("trend_rollup", time.perf_counter() - started, operation="refresh")
+    return len(rows)
+
+# 저장된 요약본 전체로 집계 컬렉션 재생성 (최초 도입 시 1회)
+def rebuild_trend_rollups(collection_name: str = COLLECTION_NAME) -> Dict[str, int]:
+    started = time.perf_counter()
+    trends = get_trends_collection()
+    trends.delete_many({"collection": collection_name})
+
+    summaries = 0
+    rows_written = 0
+    batch: List[Dict[str, Any]] = []
+    for document in get_collection(collection_name).find({}, {"_id": 0, "date": 1, "sections": 1}):
+        summaries += 1
+        batch.extend(build_trend_rows(collection_name, document["date"], document.get("sections", [])))
+        if len(batch) >= REBUILD_BATCH_SIZE:
+            trends.insert_many(batch, ordered=False)
+            rows_written += len(batch)
+            batch = []
+    if batch:
+        trends.insert_many(batch, ordered=False)
+        rows_written += len(batch)
+
+    report = {"summaries": summaries, "rows": rows_written, "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+    logger.info(f"트렌드 집계 재생성 완료 ({collection_name}): {report}")
+    return report
+
+# 기간 내 상위 N 트렌드 (집계 컬렉션만 읽음)
+# 반환: [{"key", "count": 전체 횟수, "weeks": 등장한 요약본 수, "first", "last"}]
+def top_trends(
+    kind: str = "keyword",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    limit: int = 10,
+    collection_name: str = COLLECTION_NAME
+) -> List[Dict[str, Any]]:
+    if kind not in TREND_KINDS:
+        raise ValueError(f"알 수 없는 집계 종류: {kind} (가능한 값: {', '.join(TREND_KINDS)})")
+
+    match: Dict[str, Any] = {"collection": collection_name, "kind": kind}
+    date_filter: Dict[str, Any] = {}
+    if start_date:
+        date_filter["$gte"] = datetime.combine(start_date, datetime_time.min)
+    if end_date:
+        date_filter["$lte"] = datetime.combine(end_date, datetime_time.max)
+    if date_filter:
+        match["date"] = date_filter
+
+    started = time.perf_counter()
+    results = list(get_trends_collection().aggregate([
+        {"$match": match},
+        {"$group": {
+            "_id": "$key",
+            "count": {"$sum": "$count"},
+            "weeks": {"$sum": 1},
+            "first": {"$min": "$date"},
+            "last": {"$max": "$date"}
+        }},
+        {"$sort": {"count": -1, "weeks": -1, "_id": 1}},
+        {"$limit": limit}
+    ]))
+    metrics.observe("trend_query", time.perf_counter() - started, kind=kind)
+
+    return [
+        {
+            "key": result["_id"],
+            "count": result["count"],
+            "weeks": result["weeks"],
+            "first": result["first"].strftime("%Y-%m-%d"),
+            "last": result["last"].strftime("%Y-%m-%d")
+        }
+        for result in results
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주별 트렌드 집계 조회 / 재생성")
+    parser.add_argument("--collection", default=COLLECTION_NAME, help="요약본 컬렉션")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    top_parser = subparsers.add_parser("top", help="기간 내 상위 트렌드")
+    top_parser.add_argument("--kind", choices=TREND_KINDS, default="keyword")
+    top_parser.add_argument("--start", help="시작일 (YYYY-MM-DD)")
+    top_parser.add_argument("--end", help="종료일 (YYYY-MM-DD)")
+    top_parser.add_argument("--limit", type=int, default=10)
+
+    subparsers.add_parser("rebuild", help="저장된 요약본 전체로 집계 재생성")
+
+    args = parser.parse_args()
+    if args.command == "rebuild":
+        result: Any = rebuild_trend_rollups(args.collection)
+    else:
+        result = top_trends(
+            args.kind,
+            datetime.strptime(args.start, "%Y-%m-%d").date() if args.start else None,
+            datetime.strptime(args.end, "%Y-%m-%d").date() if args.end else None,
+            args.limit,
+            args.collection
+        )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
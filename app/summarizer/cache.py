@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.config.settings import LLM_CACHE_ENABLED, LLM_CACHE_MAX_MB, LLM_CACHE_PATH, LLM_CACHE_TTL_HOURS
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+# 캐시 키 생성: 프롬프트와 모델 파라미터의 해시 (내용 기반 주소)
+def build_cache_key(
+    prompts: Dict[str, str],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    response_format: Optional[Dict[str, Any]] = None
+) -> str:
+    key = {
+        "system": prompts["system"],
+        "user": prompts["user"],
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }
+    if response_format:
+        key["response_format"] = response_format
+    payload = json.dumps(key, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# LLM 응답 로컬 캐시 (SQLite)
+# - 만료(TTL)된 응답은 적중으로 보지 않고, 전체 크기가 max_bytes 를 넘으면 오래 사용되지 않은 것부터 삭제
+class ResponseCache:
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl_seconds: float = LLM_CACHE_TTL_HOURS * 3600,
+        max_bytes: int = LLM_CACHE_MAX_MB * 1024 * 1024
+    ):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS completions (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_completions_accessed ON completions (accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+
+    def get(self, cache_key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM completions WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE completions SET accessed_at = ? WHERE cache_key = ?", (now, cache_key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, cache_key: str, model: str, response: str) -> None:
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM completions WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (cache_key, model, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key, model, response, size, now, now)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(now)
+            self._conn.commit()
+
+    # 만료된 응답을 먼저 지우고, 그래도 크면 최대 크기의 90% 이하가 될 때까지 오래된 것부터 삭제
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM completions WHERE created_at < ?", (now - self.ttl_seconds,))
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM completions ORDER BY accessed_at ASC"
+        ).fetchall()
+        self._total_bytes = sum(size for _, size in rows)
+
+        target = int(self.max_bytes * 0.9)
+        evicted = []
+        for cache_key, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((cache_key,))
+            self._total_bytes -= size
+
+        self._conn.executemany("DELETE FROM completions WHERE cache_key = ?", evicted)
+        logger.info(f"LLM 응답 캐시 정리: {len(evicted)}개 엔트리 삭제")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size_bytes": self._total_bytes
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+# 프로세스 공용 LLM 응답 캐시 반환 (비활성화 시 None)
+def get_response_cache() -> Optional[ResponseCache]:
+    global _response_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+    return _response_cache
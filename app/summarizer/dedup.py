@@ -0,0 +1,240 @@
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.config.settings import DEDUP_SIMILARITY
+from app.notion.parser import extract_page_entries, render_page_entries
+from app.summarizer.tokens import estimate_tokens
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+SHINGLE_SIZE = 5
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# MinHash 순열 계수 (실행마다 같은 값이 나오도록 고정 시드로 생성)
+_PERMUTATIONS = [
+    (
+        int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % MERSENNE_PRIME or 1,
+        int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % MERSENNE_PRIME
+    )
+    for i in range(NUM_PERMUTATIONS)
+]
+
+# 너무 짧은 제목은 다른 기사와 겹치기 쉬워 제목 지문을 만들지 않음
+MIN_FINGERPRINT_TITLE_CHARS = 8
+
+TRACKING_PARAM_PATTERN = re.compile(r"^(utm_\w+|fbclid|gclid|ref|source)$", re.IGNORECASE)
+LIST_MARKER_PATTERN = re.compile(r"^(?:->)*\s*(?:-|\d+\.|>)?\s*")
+
+
+# URL 정규화: 스킴/호스트 소문자, www. 제거, 추적용 쿼리 / 프래그먼트 / 끝 슬래시 제거
+def normalize_url(url: str) -> str:
+    url = url.strip().strip("<>")
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAM_PATTERN.match(key)
+    ])
+    path = parts.path.rstrip("/")
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme.lower(), host, path, query, ""))
+
+# 제목 지문 (대소문자 / 기호 / 공백 차이를 무시한 제목의 해시, 짧은 제목은 None)
+def title_fingerprint(title: Optional[str]) -> Optional[str]:
+    normalized = " ".join(re.findall(r"\w+", (title or "").casefold()))
+    if len(normalized) < MIN_FINGERPRINT_TITLE_CHARS:
+        return None
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+# 이전 주 기사 색인 조회 / 저장에 쓰는 키 (정규화된 링크, 제목 지문)
+def coverage_keys(title: Optional[str], links: List[str]) -> List[str]:
+    keys = [f"link:{normalize_url(link)}" for link in links if link]
+    fingerprint = title_fingerprint(title)
+    if fingerprint:
+        keys.append(f"title:{fingerprint}")
+    return keys
+
+# 파싱된 페이지의 모든 기사 색인 키 (이전 주 기사 색인에서 이번 주 기사만 조회할 때 사용)
+def parsed_pages_coverage_keys(parsed_pages: List[Dict[str, Any]]) -> List[str]:
+    keys = {
+        key
+        for page in parsed_pages
+        for entry in extract_page_entries(page)
+        if entry["type"] == "article"
+        for key in coverage_keys(entry["title"], entry["links"])
+    }
+    return sorted(keys)
+
+# 이전 주에 이미 요약한 기사를 한 줄 참조로 축소 (본문 제거, 렌더링 시 [이미 다룬 기사] 한 줄)
+# covered: 색인 키 -> 처음 다룬 요약본 날짜, 반환값은 축소한 기사 수
+def mark_covered_articles(pages_entries: List[List[Dict[str, Any]]], covered: Dict[str, str]) -> int:
+    marked = 0
+    for entries in pages_entries:
+        for entry in entries:
+            if entry["type"] != "article":
+                continue
+            for key in coverage_keys(entry["title"], entry["links"]):
+                if key in covered:
+                    entry["covered"] = covered[key]
+                    entry["body"] = []
+                    marked += 1
+                    break
+    return marked
+
+# 본문 줄 비교용 정규화 (목록 기호와 공백 제거)
+def _normalize_line(line: str) -> str:
+    return re.sub(r"\s+", " ", LIST_MARKER_PATTERN.sub("", line)).strip().lower()
+
+def _shingles(text: str) -> Set[int]:
+    normalized = re.sub(r"\s+", " ", text).strip().lower()
+    if len(normalized) < SHINGLE_SIZE:
+        return set()
+    return {
+        int.from_bytes(hashlib.blake2b(normalized[i:i + SHINGLE_SIZE].encode(), digest_size=4).digest(), "big")
+        for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    }
+
+# MinHash 서명 생성
+def minhash_signature(text: str) -> Optional[List[int]]:
+    shingles = _shingles(text)
+    if not shingles:
+        return None
+    return [
+        min(((a * shingle + b) % MERSENNE_PRIME) & MAX_HASH for shingle in shingles)
+        for a, b in _PERMUTATIONS
+    ]
+
+def estimate_similarity(signature_a: List[int], signature_b: List[int]) -> float:
+    return sum(1 for a, b in zip(signature_a, signature_b) if a == b) / NUM_PERMUTATIONS
+
+def _article_text(article: Dict[str, Any]) -> str:
+    return "\n".join(_normalize_line(line) for line in article["body"])
+
+# 중복 기사를 원본 기사에 병합 (원본에 없는 링크와 본문 줄만 추가)
+def _merge_article(canonical: Dict[str, Any], duplicate: Dict[str, Any]) -> None:
+    known_links = {normalize_url(link) for link in canonical["links"]}
+    for link in duplicate["links"]:
+        if normalize_url(link) not in known_links:
+            canonical["links"].append(link)
+            known_links.add(normalize_url(link))
+
+    known_lines = {_normalize_line(line) for line in canonical["body"]}
+    for line in duplicate["body"]:
+        normalized = _normalize_line(line)
+        if normalized and normalized not in known_lines:
+            canonical["body"].append(line)
+            known_lines.add(normalized)
+
+    if not canonical["title"] and duplicate["title"]:
+        canonical["title"] = duplicate["title"]
+
+# 여러 페이지에 걸친 중복 기사 제거
+# - 정규화된 링크가 같으면 중복으로 판단
+# - 링크가 달라도 본문 MinHash 유사도(LSH 후보 검증)가 기준 이상이면 중복으로 판단
+# - 중복 기사는 처음 등장한 기사에 고유한 링크/본문 줄을 합친 뒤 제거
+def deduplicate_page_entries(
+    pages_entries: List[List[Dict[str, Any]]],
+    threshold: float = DEDUP_SIMILARITY
+) -> Tuple[List[List[Dict[str, Any]]], int]:
+    link_owner: Dict[str, Dict[str, Any]] = {}
+    signatures: Dict[int, List[int]] = {}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[Dict[str, Any]]] = defaultdict(list)
+    duplicates = 0
+    result = []
+
+    for entries in pages_entries:
+        kept = []
+        for entry in entries:
+            if entry["type"] != "article":
+                kept.append(entry)
+                continue
+
+            canonical = None
+            normalized_links = [normalize_url(link) for link in entry["links"]]
+            for link in normalized_links:
+                if link in link_owner:
+                    canonical = link_owner[link]
+                    break
+
+            signature = minhash_signature(_article_text(entry))
+            if canonical is None and signature is not None:
+                candidates = {
+                    id(candidate): candidate
+                    for band in range(LSH_BANDS)
+                    for candidate in buckets.get((band, tuple(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])), [])
+                }
+                for candidate in candidates.values():
+                    if estimate_similarity(signature, signatures[id(candidate)]) >= threshold:
+                        canonical = candidate
+                        break
+
+            if canonical is not None:
+                _merge_article(canonical, entry)
+                for link in normalized_links:
+                    link_owner.setdefault(link, canonical)
+                duplicates += 1
+                continue
+
+            kept.append(entry)
+            for link in normalized_links:
+                link_owner.setdefault(link, entry)
+            if signature is not None:
+                signatures[id(entry)] = signature
+                for band in range(LSH_BANDS):
+                    buckets[(band, tuple(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]))].append(entry)
+
+        result.append(kept)
+
+    return result, duplicates
+
+# 파싱된 페이지 목록의 기사 항목 중복 제거
+# - merge_duplicates: 이번 주 안의 중복 기사 병합
+# - covered: 이전 주 기사 색인 (있으면 이미 다룬 기사를 한 줄 참조로 축소)
+# 반환: (페이지별 항목, 리포트) / 리포트의 tokens_after, tokens_saved 는 호출하는 쪽에서 텍스트로 변환한 뒤 finish_dedup_report 로 채움
+def deduplicate_parsed_entries(
+    parsed_pages: List[Dict[str, Any]],
+    threshold: float = DEDUP_SIMILARITY,
+    covered: Optional[Dict[str, str]] = None,
+    merge_duplicates: bool = True
+) -> Tuple[List[List[Dict[str, Any]]], Dict[str, Any]]:
+    pages_entries = [extract_page_entries(page) for page in parsed_pages]
+    tokens_before = sum(estimate_tokens(render_page_entries(entries)) for entries in pages_entries)
+    articles = sum(1 for entries in pages_entries for entry in entries if entry["type"] == "article")
+
+    deduplicated, duplicates = deduplicate_page_entries(pages_entries, threshold) if merge_duplicates else (pages_entries, 0)
+    covered_articles = mark_covered_articles(deduplicated, covered) if covered else 0
+
+    report = {
+        "articles": articles,
+        "duplicates": duplicates,
+        "covered": covered_articles,
+        "tokens_before": tokens_before
+    }
+    return deduplicated, report
+
+def finish_dedup_report(report: Dict[str, Any], tokens_after: int) -> Dict[str, Any]:
+    report["tokens_after"] = tokens_after
+    report["tokens_saved"] = report["tokens_before"] - tokens_after
+    return report
+
+# 파싱된 페이지 목록을 중복 제거 후 페이지별 프롬프트용 텍스트로 변환
+def deduplicate_parsed_pages(
+    parsed_pages: List[Dict[str, Any]],
+    threshold: float = DEDUP_SIMILARITY,
+    covered: Optional[Dict[str, str]] = None,
+    merge_duplicates: bool = True
+) -> Tuple[List[str], Dict[str, Any]]:
+    deduplicated, report = deduplicate_parsed_entries(parsed_pages, threshold, covered, merge_duplicates)
+    texts = [render_page_entries(entries) for entries in deduplicated]
+    return texts, finish_dedup_report(report, sum(estimate_tokens(text) for text in texts))
@@ -1,9 +1,40 @@
 import re
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
 
 
+SECTION_EMOJIS = "🔵🟣🟡🟢🟠🟤"
+SECTION_HEADER_PATTERN = re.compile(rf"^([{SECTION_EMOJIS}])\s*(.+?)\s*$")
+
+
+# 섹션 본문을 주제 단위 항목으로 변환
+def parse_section(emoji: str, category: str, section_body: str) -> Dict:
+    #section_body 처리 -> 주제 기준으로 나누기
+    item_blocks = re.split(r"\n(?=\[)", section_body)
+    items = []
+    for block in item_blocks:
+        lines = block.strip().split("\n")
+        if not lines:
+            continue
+
+        # 타이틀, 링크, 포인트 분리
+        title_line = lines[0].strip()
+        link_lines = [line for line in lines[1:] if line.startswith("<http") or line.startswith("http")]
+        bullet_lines = [line.strip("- ").strip() for line in lines[1:] if not line.startswith("<http") and not line.startswith("http")]
+
+        items.append({
+            "title": title_line.strip("[]"),
+            "link": link_lines[0] if link_lines else None,
+            "bullets": bullet_lines
+        })
+
+    return {
+        "emoji": emoji,
+        "category": category,
+        "items": items
+    }
+
 # 커피챗 요약 텍스트를 JSON 형식으로 변환 (DB 저장용)
 def format_summary_to_json(raw_text: str) -> Dict:
     date_match = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", raw_text)
@@ -12,7 +43,7 @@ def format_summary_to_json(raw_text: str) -> Dict:
     year, month, day = map(int, date_match.groups())
     date_str = f"{year:04d}-{month:02d}-{day:02d}"
 
-    sections_raw = re.split(r"\n([🔵🟣🟡🟢🟠🟤])\s*(.+?)\n", raw_text)
+    sections_raw = re.split(rf"\n([{SECTION_EMOJIS}])\s*(.+?)\n", raw_text)
     # split 결과: [prefix, emoji, section_title, section_body, emoji, section_title, section_body, ...]
 
     #emoji 부분부터 section_body 부분까지 처리 반복
@@ -21,31 +52,7 @@ def format_summary_to_json(raw_text: str) -> Dict:
         emoji = sections_raw[i].strip()
         category = sections_raw[i + 1].strip()
         section_body = sections_raw[i + 2].strip()
-
-        #section_body 처리 -> 주제 기준으로 나누기
-        item_blocks = re.split(r"\n(?=\[)", section_body)
-        items = []
-        for block in item_blocks:
-            lines = block.strip().split("\n")
-            if not lines:
-                continue
-
-            # 타이틀, 링크, 포인트 분리
-            title_line = lines[0].strip()
-            link_lines = [line for line in lines[1:] if line.startswith("<http") or line.startswith("http")]
-            bullet_lines = [line.strip("- ").strip() for line in lines[1:] if not line.startswith("<http") and not line.startswith("http")]
-
-            items.append({
-                "title": title_line.strip("[]"),
-                "link": link_lines[0] if link_lines else None,
-                "bullets": bullet_lines
-            })
-
-        sections.append({
-            "emoji": emoji,
-            "category": category,
-            "items": items
-        })
+        sections.append(parse_section(emoji, category, section_body))
 
     return {
         "date": date_str,
@@ -54,6 +61,71 @@ def format_summary_to_json(raw_text: str) -> Dict:
         "createdAt": datetime.now().isoformat()
     }
 
+# 스트리밍 요약 텍스트의 증분 파서
+# - 조각(delta)을 받을 때마다 완성된 줄만 처리하고, 다음 섹션 헤더가 도착하면 직전 섹션을 완료로 반환
+# - 중간에 스트림이 끊겨도 completed_text 에는 완료된 섹션까지의 텍스트가 남음
+class SectionStreamParser:
+    def __init__(self):
+        self.text = ""
+        self.completed_text = ""
+        self.sections: List[Dict] = []
+        self._pending = ""
+        self._offset = 0
+        self._current: Optional[Dict] = None
+
+    def feed(self, delta: str) -> List[Dict]:
+        self.text += delta
+        self._pending += delta
+
+        completed = []
+        while "\n" in self._pending:
+            line, self._pending = self._pending.split("\n", 1)
+            section = self._consume_line(line, self._offset)
+            self._offset += len(line) + 1
+            if section:
+                completed.append(section)
+        return completed
+
+    # 스트림 정상 종료: 마지막 줄과 마지막 섹션을 마무리
+    def finish(self) -> List[Dict]:
+        completed = []
+        if self._pending:
+            section = self._consume_line(self._pending, self._offset)
+            self._offset += len(self._pending)
+            self._pending = ""
+            if section:
+                completed.append(section)
+
+        section = self._close_current(len(self.text))
+        if section:
+            completed.append(section)
+        return completed
+
+    def _consume_line(self, line: str, line_start: int) -> Optional[Dict]:
+        match = SECTION_HEADER_PATTERN.match(line)
+        if match and line_start > 0:
+            finished = self._close_current(line_start)
+            self._current = {"emoji": match.group(1), "category": match.group(2), "lines": []}
+            return finished
+
+        if self._current is not None:
+            self._current["lines"].append(line)
+        return None
+
+    def _close_current(self, end_offset: int) -> Optional[Dict]:
+        if self._current is None:
+            return None
+
+        section = parse_section(
+            self._current["emoji"],
+            self._current["category"],
+            "\n".join(self._current["lines"]).strip()
+        )
+        self.sections.append(section)
+        self.completed_text = self.text[:end_offset]
+        self._current = None
+        return section
+
 # JSON 파일로 저장 (테스트용)
 def save_json_to_file(json_data: dict, file_path = "formatted_summary.json"):
     try:
@@ -64,13 +136,13 @@ def save_json_to_file(json_data: dict, file_path = "formatted_summary.json"):
         print(f"저장 오류: {str(e)}")
 
 
-# 커피챗 요약 텍스트를 슬랙 메시지 형식으로 변환
-def format_summary_to_slack_message(summary_json: dict) -> str:
+# 커피챗 요약 텍스트를 슬랙 메시지 형식으로 변환 (증분 실행의 추가분 전송 시 title="업데이트")
+def format_summary_to_slack_message(summary_json: dict, title: str = "요약") -> str:
     lines = []
 
     date = summary_json.get("date", "")
     source = summary_json.get("source", "")
-    header = f"☕️ {date} {source} 요약"
+    header = f"☕️ {date} {source} {title}"
     lines.append(header)
     lines.append("")
 
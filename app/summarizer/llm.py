@@ -1,23 +1,57 @@
-from openai import OpenAI
-from openai import OpenAIError
 import time
 import logging
-from typing import Dict
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from app.config.settings import OPENAI_API_KEY
+from app.config.settings import (
+    OPENAI_API_KEY, OPENAI_BASE_URL, SUMMARY_MODE, SUMMARY_CHUNK_TOKENS, SUMMARY_MAX_PARALLEL, SUMMARY_STREAM, LLM_CACHE_FORCE_REFRESH,
+    LLM_ROUTING_ENABLED, LLM_MODEL_LARGE, LLM_MODEL_SMALL, LLM_LIGHT_MAX_TOKENS, LLM_LIGHT_MAX_ARTICLES, LLM_MODEL_PRICES
+)
+from app.metrics.recorder import metrics
+from app.summarizer.cache import build_cache_key, get_response_cache
+from app.summarizer.formatter import SectionStreamParser
+from app.summarizer.tokens import estimate_tokens
 
 
 logger = logging.getLogger('tech_trend_bot')
 
-# Openai 클라이언트 초기화
+# 프로세스 공용 OpenAI 클라이언트 (여러 작업 / 주가 커넥션 풀 공유)
+_client = None
+_client_lock = threading.Lock()
+
+# 출력 토큰 한도 (라우팅 시 입력 크기에 비례해 이 범위 안에서 결정)
+MAX_OUTPUT_TOKENS = 8000
+MIN_OUTPUT_TOKENS = 1024
+
+# 모델별 100만 토큰당 가격 (USD, 입력 / 출력)
+MODEL_PRICES = LLM_MODEL_PRICES
+
+ARTICLE_LINE_PATTERN = re.compile(r"^\[(?:제목|이미 다룬 기사)\]", re.MULTILINE)
+
+
+# Openai 클라이언트 초기화 (openai 패키지는 import 가 무거워 실제로 사용할 때 불러옴)
 def initialize_client():
-    api_key = OPENAI_API_KEY
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY가 환경 변수에 없습니다")
-    return OpenAI(api_key=api_key, timeout=60.0)
+    global _client
+    with _client_lock:
+        if _client is None:
+            from openai import OpenAI
 
-# 프롬프트 생성
-def generate_prompt(content: str) -> Dict[str, str]:
+            api_key = OPENAI_API_KEY
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY가 환경 변수에 없습니다")
+            _client = OpenAI(api_key=api_key, base_url=OPENAI_BASE_URL, timeout=60.0)
+    return _client
+
+# 작업별 추가 지침을 시스템 프롬프트 끝에 덧붙임
+def _with_instructions(system_prompt: str, instructions: Optional[str]) -> str:
+    if not instructions:
+        return system_prompt
+    return f"{system_prompt}\n\n[추가 지침]\n{instructions.strip()}"
+
+# 프롬프트 생성 (instructions: 작업별 추가 지침)
+def generate_prompt(content: str, instructions: Optional[str] = None) -> Dict[str, str]:
     SYSTEM_PROMPT = """
 [역할]
 당신은 '테크 트렌드 커피챗' 내용을 요약하는 전문가야. 아래 요약 규칙을 따르며 정보를 구조화해서 정리해.
@@ -43,6 +77,9 @@ def generate_prompt(content: str) -> Dict[str, str]:
    - 구체적 수치/사례 (예: "현재 100개 기업이 도입 중임")
    - 시장 영향/전망 (예: "클라우드 시장 성장이 예상됨")
 
+   [이미 다룬 기사] 로 표시된 줄은 이전 커피챗에서 이미 요약한 기사야. 다시 요약하지 말고 제목과 링크 아래에
+   "- YYYY-MM-DD 커피챗에서 다룬 주제임" 한 줄만 붙여서 해당 카테고리에 넣어줘.
+
 3. 문장 작성 규칙:
    - 모든 문장은 "~됨", "~함", "~임" 형식으로 끝나도록 작성
    - 구어체 표현 ("~야", "~네", "~어") 사용 금지
@@ -78,36 +115,124 @@ def generate_prompt(content: str) -> Dict[str, str]:
     """.strip()
 
     return {
-        "system": SYSTEM_PROMPT,
+        "system": _with_instructions(SYSTEM_PROMPT, instructions),
         "user": USER_PROMPT
     }
 
+# 호출 종류(route)와 입력 크기로 모델 / 출력 토큰 한도 선택
+# - route: single(한 번에 요약) / chunk(청크별 부분 요약) / merge(부분 요약 병합) / repair(섹션 수정)
+# - chunk 와 가벼운 single(추정 입력 토큰, 기사 수가 LIGHT 이하)은 작은 모델, 나머지는 큰 모델
+# - 출력 한도는 입력 토큰에 비례 (병합 / 수정은 입력과 비슷한 길이, 요약은 입력보다 짧음)
+def route_request(prompts: Dict[str, str], route: str = "single") -> Dict[str, Any]:
+    input_tokens = estimate_tokens(prompts["user"])
+    if not LLM_ROUTING_ENABLED:
+        return {"model": LLM_MODEL_LARGE, "max_tokens": MAX_OUTPUT_TOKENS}
+
+    articles = len(ARTICLE_LINE_PATTERN.findall(prompts["user"]))
+    light = route == "chunk" or (
+        route == "single" and input_tokens <= LLM_LIGHT_MAX_TOKENS and articles <= LLM_LIGHT_MAX_ARTICLES
+    )
+    ratio = 1.0 if route in ("merge", "repair") else 0.6
+    return {
+        "model": LLM_MODEL_SMALL if light else LLM_MODEL_LARGE,
+        "max_tokens": min(MAX_OUTPUT_TOKENS, max(MIN_OUTPUT_TOKENS, int(input_tokens * ratio) + 512))
+    }
+
+# 토큰 사용량으로 비용 계산 (가격표에 없는 모델은 0)
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    input_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+# LLM 호출 한 건을 실행 리포트에 기록 (모델 / 종류 / 토큰 / 지연 / 비용, 캐시 적중은 토큰 0)
+def _record_call(route: str, model: str, usage: Any, seconds: float, cached: bool = False) -> None:
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    cost = estimate_cost(model, prompt_tokens, completion_tokens)
+    if cost:
+        metrics.increment("llm_cost_usd", cost, model=model)
+    metrics.record_call(
+        "llm",
+        route=route,
+        model=model,
+        cached=cached,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        latency_ms=round(seconds * 1000, 1),
+        cost_usd=round(cost, 6)
+    )
+
 # GPT 호출 / 요약 생성
-def get_summary(client, prompts: Dict[str, str]) -> str:
+# 같은 프롬프트/모델 파라미터의 응답은 로컬 캐시에서 바로 반환 (force_refresh=True 면 새로 생성)
+# model / max_tokens 를 생략하면 route_request 로 결정, 라우팅한 한도에서 응답이 잘리면 최대 한도로 다시 요청
+def get_summary(
+    client,
+    prompts: Dict[str, str],
+    model: Optional[str] = None,
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    response_format: Optional[Dict[str, Any]] = None,
+    route: str = "single"
+) -> str:
+    from openai import OpenAIError
+
+    routed = route_request(prompts, route)
+    model = model or routed["model"]
+    max_tokens = max_tokens or routed["max_tokens"]
+
+    cache = get_response_cache()
+    cache_key = build_cache_key(prompts, model, temperature, max_tokens, response_format)
+    if cache and not force_refresh:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"LLM 응답 캐시 적중 ({cache_key[:12]})")
+            metrics.increment("llm_cache_hits", model=model)
+            _record_call(route, model, None, 0.0, cached=True)
+            return cached
+
     retry_count = 0
     max_retries = 3
     base_delay = 1
 
+    request_options = {"response_format": response_format} if response_format else {}
+
     while retry_count < max_retries:
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": prompts["system"]},
-                    {"role": "user", "content": prompts["user"]}
-                ],
-                temperature=0.3,
-                max_tokens=8000,
-                timeout=60
-            )
+            started = time.perf_counter()
+            with metrics.span("llm_request", model=model, route=route):
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": prompts["system"]},
+                        {"role": "user", "content": prompts["user"]}
+                    ],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=60,
+                    **request_options
+                )
+            metrics.increment("llm_requests", model=model)
+            metrics.record_token_usage(model, getattr(response, "usage", None))
+            _record_call(route, model, getattr(response, "usage", None), time.perf_counter() - started)
             
             if not response.choices:
                 raise ValueError("API 응답에 선택된 결과가 없습니다.")
             
-            return response.choices[0].message.content
+            if response.choices[0].finish_reason == "length" and max_tokens < MAX_OUTPUT_TOKENS:
+                logger.warning(f"출력 한도({max_tokens})에서 응답이 잘려 최대 한도({MAX_OUTPUT_TOKENS})로 다시 요청")
+                max_tokens = MAX_OUTPUT_TOKENS
+                continue
+            
+            content = response.choices[0].message.content
+            if response.choices[0].finish_reason == "length":
+                logger.warning(f"최대 출력 한도({max_tokens})에서 응답이 잘림 (캐시하지 않음)")
+            elif cache and content:
+                cache.set(cache_key, model, content)
+            return content
 
         except OpenAIError as e:
             wait_time = base_delay * (2 ** retry_count)
+            metrics.increment("llm_retries", model=model)
             if "rate_limit" in str(e).lower():
                 logger.warning(f"Rate limit 도달. {wait_time}초 후 재시도... ({retry_count + 1}/{max_retries})")
             else:
@@ -121,3 +246,320 @@ def get_summary(client, prompts: Dict[str, str]) -> str:
             raise
     
     raise Exception("최대 재시도 횟수를 초과했습니다.")
+
+
+# GPT 스트리밍 호출: 응답 텍스트 조각을 도착하는 대로 반환
+# (마지막 청크의 usage 로 토큰 사용량 기록, 소요 시간은 스트림 종료까지)
+# outcome 을 넘기면 스트림 종료 시 "finish_reason" 을 채움 (length 면 출력 한도에서 잘린 응답)
+def stream_completion(
+    client,
+    prompts: Dict[str, str],
+    model: str = LLM_MODEL_LARGE,
+    temperature: float = 0.3,
+    max_tokens: int = MAX_OUTPUT_TOKENS,
+    route: str = "single",
+    outcome: Optional[Dict[str, Any]] = None
+) -> Iterator[str]:
+    started = time.perf_counter()
+    usage = None
+    with metrics.span("llm_request", model=model, route=route):
+        stream = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompts["system"]},
+                {"role": "user", "content": prompts["user"]}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=60,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        metrics.increment("llm_requests", model=model)
+        for chunk in stream:
+            if getattr(chunk, "usage", None):
+                usage = chunk.usage
+                metrics.record_token_usage(model, usage)
+            if not chunk.choices:
+                continue
+            if chunk.choices[0].finish_reason and outcome is not None:
+                outcome["finish_reason"] = chunk.choices[0].finish_reason
+            if chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    _record_call(route, model, usage, time.perf_counter() - started)
+
+# GPT 스트리밍 요약 생성
+# - 이모지 섹션이 완성될 때마다 on_section 콜백 호출 (파이프라인에서는 진행 로그만 남김, 이후 단계는 전체 요약을 받은 뒤 시작)
+# - 스트림이 중간에 끊기면 완료된 섹션까지의 텍스트를 반환하고, 완료된 섹션이 없을 때만 재시도
+#   (openai SDK 는 스트림을 읽는 중의 httpx 오류(ReadTimeout 등)를 감싸지 않으므로 함께 처리, 일부 결과는 캐시하지 않음)
+# - 라우팅한 출력 한도에서 잘리면(finish_reason=length) 최대 한도로 다시 요청하고, 이미 전달한 섹션은 다시 전달하지 않음
+# - 최대 한도에서도 잘리면 완료된 섹션까지만 반환 (캐시하지 않음)
+def get_summary_streaming(
+    client,
+    prompts: Dict[str, str],
+    on_section: Optional[Callable[[Dict[str, Any]], None]] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    route: str = "single"
+) -> str:
+    import httpx
+    from openai import OpenAIError
+
+    routed = route_request(prompts, route)
+    model = model or routed["model"]
+    max_tokens = max_tokens or routed["max_tokens"]
+
+    delivered = 0
+
+    # 아직 전달하지 않은 완료 섹션만 콜백으로 전달 (출력 한도 재요청 시 중복 방지)
+    def emit(parser: SectionStreamParser) -> None:
+        nonlocal delivered
+        if on_section:
+            for section in parser.sections[delivered:]:
+                on_section(section)
+        delivered = max(delivered, len(parser.sections))
+
+    cache = get_response_cache()
+    cache_key = build_cache_key(prompts, model, temperature, max_tokens)
+    if cache and not force_refresh:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"LLM 응답 캐시 적중 ({cache_key[:12]})")
+            metrics.increment("llm_cache_hits", model=model)
+            _record_call(route, model, None, 0.0, cached=True)
+            parser = SectionStreamParser()
+            parser.feed(cached)
+            parser.finish()
+            emit(parser)
+            return cached
+
+    retry_count = 0
+    max_retries = 3
+    base_delay = 1
+
+    while retry_count < max_retries:
+        parser = SectionStreamParser()
+        outcome: Dict[str, Any] = {}
+        try:
+            for delta in stream_completion(client, prompts, model, temperature, max_tokens, route, outcome):
+                if parser.feed(delta):
+                    emit(parser)
+
+            if outcome.get("finish_reason") == "length":
+                if max_tokens < MAX_OUTPUT_TOKENS:
+                    logger.warning(f"출력 한도({max_tokens})에서 응답이 잘려 최대 한도({MAX_OUTPUT_TOKENS})로 다시 요청")
+                    max_tokens = MAX_OUTPUT_TOKENS
+                    continue
+                if parser.sections:
+                    logger.warning(f"최대 출력 한도에서 응답이 잘림, 완료된 섹션 {len(parser.sections)}개만 사용 (캐시하지 않음)")
+                    return parser.completed_text
+                raise ValueError("최대 출력 한도에서 응답이 잘렸습니다.")
+
+            parser.finish()
+            emit(parser)
+
+            if not parser.text:
+                raise ValueError("API 응답에 선택된 결과가 없습니다.")
+
+            if cache:
+                cache.set(cache_key, model, parser.text)
+            return parser.text
+
+        except (OpenAIError, httpx.TransportError, TimeoutError) as e:
+            if parser.sections:
+                logger.warning(f"스트리밍 중단, 완료된 섹션 {len(parser.sections)}개만 사용 (일부 결과): {str(e)}")
+                return parser.completed_text
+
+            wait_time = base_delay * (2 ** retry_count)
+            metrics.increment("llm_retries", model=model)
+            logger.warning(f"API 오류 발생. {wait_time}초 후 재시도... ({retry_count + 1}/{max_retries}): {str(e)}")
+            time.sleep(wait_time)
+            retry_count += 1
+
+        except Exception as e:
+            if parser.sections:
+                logger.warning(f"스트리밍 중 예상치 못한 오류, 완료된 섹션 {len(parser.sections)}개만 사용 (일부 결과): {str(e)}")
+                return parser.completed_text
+            logger.error(f"예상치 못한 오류 발생: {str(e)}")
+            raise
+
+    raise Exception("최대 재시도 횟수를 초과했습니다.")
+
+# 병합용 프롬프트 생성 (청크별 부분 요약 -> 하나의 최종 요약)
+def generate_merge_prompt(partial_summaries: List[str], instructions: Optional[str] = None) -> Dict[str, str]:
+    system_prompt = generate_prompt("", instructions)["system"] + """
+
+[병합 규칙]
+- 입력은 같은 커피챗 원문을 여러 부분으로 나누어 위 규칙대로 요약한 결과들이야.
+- 부분 요약들을 하나로 합쳐 전체를 다시 5~6개의 카테고리로 분류해.
+- 부분 요약에 있는 주제와 링크, 핵심 내용은 빠뜨리지 말고 그대로 옮기되, 같은 주제는 하나로 합쳐.
+- 날짜 헤더(☕️ ...)는 한 번만 작성해.
+""".rstrip()
+
+    joined = "\n\n".join(
+        f"[부분 요약 {i + 1}/{len(partial_summaries)}]\n{summary.strip()}"
+        for i, summary in enumerate(partial_summaries)
+    )
+    user_prompt = f"""
+다음은 커피챗 원문을 나누어 요약한 부분 요약들이야. 위 가이드에 따라 하나의 최종 요약으로 병합해줘. 수치와 사실 관계는 그대로 유지해:
+
+{joined}
+    """.strip()
+
+    return {
+        "system": system_prompt,
+        "user": user_prompt
+    }
+
+# 원문 텍스트를 기사([제목] / [이미 다룬 기사]) 단위로 분리
+# 각 기사에는 직전의 [날짜] / [작성자] 헤더를 함께 기록해 청크가 나뉘어도 문맥이 유지되도록 함
+def split_articles(content: str) -> List[Dict[str, Any]]:
+    articles: List[Dict[str, Any]] = []
+    current_date = None
+    current_author = None
+    current_lines: List[str] = []
+    current_header = (None, None)
+
+    def flush_article():
+        nonlocal current_lines
+        text = "\n".join(current_lines).strip()
+        if text:
+            articles.append({
+                "date": current_header[0],
+                "author": current_header[1],
+                "text": text
+            })
+        current_lines = []
+
+    for line in content.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("[날짜]"):
+            flush_article()
+            current_date = stripped
+        elif stripped.startswith("[작성자]"):
+            flush_article()
+            current_author = stripped
+        elif ARTICLE_LINE_PATTERN.match(stripped):
+            # [제목] 또는 [이미 다룬 기사] (이전 주에 다룬 기사는 한 줄짜리 기사로 유지)
+            flush_article()
+            current_header = (current_date, current_author)
+            current_lines.append(stripped)
+        elif current_lines:
+            current_lines.append(line)
+
+    flush_article()
+    return articles
+
+# 기사 경계를 유지하면서 토큰 예산 이하의 청크로 분할
+def chunk_content(content: str, max_tokens: int = SUMMARY_CHUNK_TOKENS) -> List[str]:
+    chunks: List[str] = []
+    chunk_lines: List[str] = []
+    chunk_tokens = 0
+    last_header = (None, None)
+
+    def flush_chunk():
+        nonlocal chunk_lines, chunk_tokens, last_header
+        if chunk_lines:
+            chunks.append("\n".join(chunk_lines).strip())
+        chunk_lines = []
+        chunk_tokens = 0
+        last_header = (None, None)
+
+    for article in split_articles(content):
+        article_tokens = estimate_tokens(article["text"])
+        # 기사 하나가 예산을 넘더라도 쪼개지 않고 단독 청크로 보냄
+        if chunk_lines and chunk_tokens + article_tokens > max_tokens:
+            flush_chunk()
+
+        header = (article["date"], article["author"])
+        if header != last_header:
+            for i, header_line in enumerate(header):
+                if header_line and header_line != last_header[i]:
+                    chunk_lines.append(f"\n{header_line}")
+                    chunk_tokens += estimate_tokens(header_line)
+            last_header = header
+
+        chunk_lines.append(article["text"])
+        chunk_lines.append("")
+        chunk_tokens += article_tokens
+
+    flush_chunk()
+    return chunks
+
+# 요약 전 프롬프트 크기 점검 결과
+def build_prompt_report(content: str, max_tokens: int = SUMMARY_CHUNK_TOKENS) -> Dict[str, Any]:
+    prompts = generate_prompt(content)
+    chunks = chunk_content(content, max_tokens)
+    return {
+        "chars": len(content),
+        "articles": len(split_articles(content)),
+        "system_tokens": estimate_tokens(prompts["system"]),
+        "user_tokens": estimate_tokens(prompts["user"]),
+        "chunk_budget": max_tokens,
+        "chunks": len(chunks),
+        "chunk_tokens": [estimate_tokens(chunk) for chunk in chunks]
+    }
+
+# 청크별 부분 요약을 동시에 생성 (입력 순서 유지)
+def summarize_chunks(
+    client,
+    chunks: List[str],
+    max_workers: int = SUMMARY_MAX_PARALLEL,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    instructions: Optional[str] = None
+) -> List[str]:
+    logger.info(f"청크 {len(chunks)}개 동시 요약 중 (최대 {max_workers}개 병렬)...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda chunk: get_summary(client, generate_prompt(chunk, instructions), force_refresh=force_refresh, route="chunk"),
+            chunks
+        ))
+
+# 청크별 요약을 동시에 생성한 뒤 하나로 병합 (map-reduce)
+def get_summary_map_reduce(
+    client,
+    content: str,
+    max_tokens: int = SUMMARY_CHUNK_TOKENS,
+    max_workers: int = SUMMARY_MAX_PARALLEL,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    on_section: Optional[Callable[[Dict[str, Any]], None]] = None,
+    instructions: Optional[str] = None
+) -> str:
+    chunks = chunk_content(content, max_tokens)
+    if len(chunks) <= 1:
+        return _final_summary(client, generate_prompt(content, instructions), force_refresh, on_section)
+
+    partial_summaries = summarize_chunks(client, chunks, max_workers, force_refresh, instructions)
+    logger.info("부분 요약 병합 중...")
+    return _final_summary(client, generate_merge_prompt(partial_summaries, instructions), force_refresh, on_section, route="merge")
+
+# 최종 요약 호출 (on_section 콜백이 있으면 스트리밍)
+def _final_summary(client, prompts: Dict[str, str], force_refresh: bool, on_section, route: str = "single") -> str:
+    if on_section:
+        return get_summary_streaming(client, prompts, on_section=on_section, force_refresh=force_refresh, route=route)
+    return get_summary(client, prompts, force_refresh=force_refresh, route=route)
+
+def _log_section(section: Dict[str, Any]) -> None:
+    logger.info(f"섹션 수신: {section['emoji']} {section['category']} ({len(section['items'])}개 주제)")
+
+# 설정된 모드에 따라 요약 생성
+# on_section 을 넘기면 (또는 SUMMARY_STREAM=true 면) 최종 요약을 스트리밍으로 받아 섹션 단위로 전달
+# (SUMMARY_STREAM 의 효과는 중간에 끊긴 스트림에서 완료된 섹션을 살리는 것, 반환은 전체 요약이 끝난 뒤)
+# instructions 는 작업별 추가 지침 (jobs.json 의 prompt)
+def summarize_content(
+    client,
+    content: str,
+    mode: Optional[str] = None,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    on_section: Optional[Callable[[Dict[str, Any]], None]] = None,
+    instructions: Optional[str] = None
+) -> str:
+    mode = mode or SUMMARY_MODE
+    if on_section is None and SUMMARY_STREAM:
+        on_section = _log_section
+
+    if mode == "map_reduce" or (mode == "auto" and estimate_tokens(content) > SUMMARY_CHUNK_TOKENS):
+        return get_summary_map_reduce(client, content, force_refresh=force_refresh, on_section=on_section, instructions=instructions)
+    return _final_summary(client, generate_prompt(content, instructions), force_refresh, on_section)
@@ -0,0 +1,93 @@
+import copy
+import re
+from typing import Any, Dict, List, Tuple
+
+from app.notion.parser import extract_page_entries
+from app.summarizer.dedup import normalize_url, title_fingerprint
+
+
+# 링크 없는 주제를 원문 기사에 연결할 때 필요한 최소 겹침 비율 (주제 글자 bigram 중 원문에 있는 비율)
+MIN_SOURCE_OVERLAP = 0.3
+
+
+# 카테고리 비교용 정규화 (공백 / 기호 차이 무시)
+def _category_key(category: str) -> str:
+    return re.sub(r"[\W_]+", "", category or "").casefold()
+
+# 주제 비교용 키
+# - 링크가 있으면 정규화된 링크
+# - 링크가 없으면 원문 기사 키(sourceKey, Notion 페이지 + 원문 제목): LLM 이 만든 제목은 실행마다 달라질 수 있음
+# - 둘 다 없으면 정규화된 제목
+def _item_key(item: Dict[str, Any]) -> str:
+    link = item.get("link")
+    if link:
+        return "link:" + normalize_url(link)
+    if item.get("sourceKey"):
+        return "source:" + item["sourceKey"]
+    return "title:" + re.sub(r"\s+", " ", (item.get("title") or "").strip("[] ")).casefold()
+
+def _bigrams(text: str) -> set:
+    compact = "".join(re.findall(r"\w+", text.casefold()))
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+# 링크 없는 주제에 원문 기사 키(sourceKey) 연결
+# 주제 제목 + 요약 문장의 글자 bigram 이 가장 많이 겹치는 원문 기사를 고름 (한국어 조사 차이에 덜 민감)
+# 키는 "<page_id>:<원문 제목 지문>" (제목이 짧거나 없으면 페이지 안 기사 순서), 반환값은 연결한 주제 수
+def attach_item_sources(sections: List[Dict[str, Any]], parsed_pages: List[Dict[str, Any]]) -> int:
+    articles = []
+    for page in parsed_pages:
+        page_articles = [entry for entry in extract_page_entries(page) if entry["type"] == "article"]
+        for index, article in enumerate(page_articles):
+            key = f"{page.get('page_id')}:{title_fingerprint(article['title']) or f'#{index}'}"
+            articles.append((key, _bigrams(" ".join([article["title"] or "", *article["body"]]))))
+
+    attached = 0
+    for section in sections:
+        for item in section.get("items", []):
+            if item.get("link") or item.get("sourceKey"):
+                continue
+            item_grams = _bigrams(" ".join([item.get("title") or "", *item.get("bullets", [])]))
+            if not item_grams:
+                continue
+            best_key, best_overlap = None, 0.0
+            for key, article_grams in articles:
+                overlap = len(item_grams & article_grams) / len(item_grams)
+                if overlap > best_overlap:
+                    best_key, best_overlap = key, overlap
+            if best_key and best_overlap >= MIN_SOURCE_OVERLAP:
+                item["sourceKey"] = best_key
+                attached += 1
+    return attached
+
+# 증분 요약 섹션을 기존 요약 섹션에 병합
+# - 같은 카테고리 섹션이 있으면 그 섹션 끝에, 없으면 새 섹션으로 추가
+# - 이미 있는 주제(같은 링크 또는 제목)는 추가하지 않음
+# 반환: (병합된 전체 섹션, 새로 추가된 주제만 담은 섹션)
+def merge_summary_sections(
+    existing_sections: List[Dict[str, Any]],
+    delta_sections: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    merged = copy.deepcopy(existing_sections)
+    by_category = {_category_key(section.get("category")): section for section in merged}
+    known_items = {_item_key(item) for section in merged for item in section.get("items", [])}
+    added: Dict[str, Dict[str, Any]] = {}
+
+    for delta_section in delta_sections:
+        key = _category_key(delta_section.get("category"))
+        for item in delta_section.get("items", []):
+            item_key = _item_key(item)
+            if item_key in known_items:
+                continue
+            known_items.add(item_key)
+
+            if key not in by_category:
+                by_category[key] = {**delta_section, "items": []}
+                merged.append(by_category[key])
+            by_category[key]["items"].append(item)
+
+            if key not in added:
+                target = by_category[key]
+                added[key] = {"emoji": target.get("emoji"), "category": target.get("category"), "items": []}
+            added[key]["items"].append(item)
+
+    return merged, list(added.values())
@@ -0,0 +1,244 @@
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config.settings import LLM_CACHE_FORCE_REFRESH, SUMMARY_CHUNK_TOKENS, SUMMARY_MODE
+from app.summarizer.formatter import SECTION_EMOJIS
+from app.summarizer.llm import chunk_content, generate_merge_prompt, generate_prompt, get_summary, summarize_chunks
+from app.summarizer.tokens import estimate_tokens
+
+
+logger = logging.getLogger('tech_trend_bot')
+
+ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "link": {"type": ["string", "null"]},
+        "bullets": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["title", "link", "bullets"],
+    "additionalProperties": False
+}
+
+SECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "emoji": {"type": "string", "enum": list(SECTION_EMOJIS)},
+        "category": {"type": "string"},
+        "items": {"type": "array", "items": ITEM_SCHEMA}
+    },
+    "required": ["emoji", "category", "items"],
+    "additionalProperties": False
+}
+
+SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "date": {"type": "string", "description": "커피챗 날짜 (YYYY-MM-DD)"},
+        "sections": {"type": "array", "items": SECTION_SCHEMA}
+    },
+    "required": ["date", "sections"],
+    "additionalProperties": False
+}
+
+SUMMARY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "coffee_chat_summary", "strict": True, "schema": SUMMARY_SCHEMA}
+}
+
+SECTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "coffee_chat_section", "strict": True, "schema": SECTION_SCHEMA}
+}
+
+JSON_OUTPUT_RULES = """
+
+[출력 형식]
+- 위 예시 텍스트 포맷 대신 주어진 JSON 스키마에 맞춰 출력해.
+- date: 커피챗 날짜를 YYYY-MM-DD 형식으로 작성해.
+- sections: 카테고리별로 emoji(🔵 🟣 🟡 🟢 🟠 🟤 중 하나, 카테고리마다 다르게), category(카테고리 이름), items 를 작성해.
+- items: title(주제 제목, 대괄호 없이), link(원문 링크 URL, 없으면 null), bullets(핵심 내용 문장 목록, "- " 기호 없이)를 작성해.
+""".rstrip()
+
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+MAX_DOCUMENT_ATTEMPTS = 3
+MAX_SECTION_REPAIRS = 2
+
+
+def _with_json_rules(prompts: Dict[str, str]) -> Dict[str, str]:
+    return {
+        "system": prompts["system"] + JSON_OUTPUT_RULES,
+        "user": prompts["user"]
+    }
+
+# 섹션 하나의 오류 목록 (스키마 제약 외 의미 검증 포함)
+def validate_section(section: Any) -> List[str]:
+    if not isinstance(section, dict):
+        return ["섹션이 객체가 아님"]
+
+    errors = []
+    if section.get("emoji") not in list(SECTION_EMOJIS):
+        errors.append(f"허용되지 않은 emoji: {section.get('emoji')!r}")
+    if not isinstance(section.get("category"), str) or not section["category"].strip():
+        errors.append("category 가 비어 있음")
+
+    items = section.get("items")
+    if not isinstance(items, list) or not items:
+        errors.append("items 가 비어 있음")
+        return errors
+
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append(f"items[{i}] 가 객체가 아님")
+            continue
+        if not isinstance(item.get("title"), str) or not item["title"].strip():
+            errors.append(f"items[{i}].title 이 비어 있음")
+        link = item.get("link")
+        if link is not None and (not isinstance(link, str) or not link.strip().strip("<>").startswith("http")):
+            errors.append(f"items[{i}].link 가 URL 이 아님: {link!r}")
+        bullets = item.get("bullets")
+        if not isinstance(bullets, list) or not all(isinstance(bullet, str) for bullet in bullets):
+            errors.append(f"items[{i}].bullets 가 문자열 목록이 아님")
+    return errors
+
+# 문서 전체 오류와 섹션별 오류를 나누어 반환
+def validate_summary(data: Any) -> Dict[str, Any]:
+    if not isinstance(data, dict):
+        return {"document": ["응답이 객체가 아님"], "sections": {}}
+
+    document_errors = []
+    if not isinstance(data.get("date"), str) or not DATE_PATTERN.match(data["date"]):
+        document_errors.append(f"date 형식 오류: {data.get('date')!r}")
+    else:
+        try:
+            datetime.strptime(data["date"], "%Y-%m-%d")
+        except ValueError:
+            document_errors.append(f"존재하지 않는 날짜: {data['date']}")
+
+    sections = data.get("sections")
+    if not isinstance(sections, list) or not sections:
+        document_errors.append("sections 가 비어 있음")
+        return {"document": document_errors, "sections": {}}
+
+    section_errors = {}
+    for i, section in enumerate(sections):
+        errors = validate_section(section)
+        if errors:
+            section_errors[i] = errors
+    return {"document": document_errors, "sections": section_errors}
+
+# 깨진 섹션 하나만 다시 생성
+def repair_section(
+    client,
+    source_prompts: Dict[str, str],
+    section: Any,
+    errors: List[str],
+    force_refresh: bool = False
+) -> Dict[str, Any]:
+    prompts = {
+        "system": source_prompts["system"] + JSON_OUTPUT_RULES + """
+
+[섹션 수정]
+- 이전 응답의 섹션 하나가 검증에 실패했어. 원문을 참고해서 그 섹션 하나만 스키마에 맞게 다시 작성해.
+- 카테고리와 주제 구성은 유지하고, 오류가 난 부분만 바로잡아.
+""".rstrip(),
+        "user": f"""
+{source_prompts["user"]}
+
+[검증 실패한 섹션]
+{json.dumps(section, ensure_ascii=False, indent=2)}
+
+[오류]
+{chr(10).join(f"- {error}" for error in errors)}
+        """.strip()
+    }
+
+    for attempt in range(MAX_SECTION_REPAIRS):
+        raw = get_summary(
+            client,
+            prompts,
+            max_tokens=4000,
+            response_format=SECTION_RESPONSE_FORMAT,
+            force_refresh=force_refresh or attempt > 0,
+            route="repair"
+        )
+        try:
+            repaired = json.loads(raw)
+        except json.JSONDecodeError as e:
+            errors = [f"JSON 파싱 실패: {str(e)}"]
+            continue
+
+        errors = validate_section(repaired)
+        if not errors:
+            return repaired
+
+    raise ValueError(f"섹션 재생성 실패: {errors}")
+
+# 스키마 기반 JSON 요약 생성
+# - 문서 수준 오류(파싱 실패, 날짜 누락 등)만 전체 재생성하고, 섹션 오류는 해당 섹션만 다시 요청
+# - 반환값은 format_summary_to_json 과 같은 형태라 Slack / DB 단계에서 그대로 사용 가능
+def get_structured_summary(
+    client,
+    prompts: Dict[str, str],
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    route: str = "single"
+) -> Dict[str, Any]:
+    structured_prompts = _with_json_rules(prompts)
+    errors: Any = None
+
+    for attempt in range(MAX_DOCUMENT_ATTEMPTS):
+        raw = get_summary(
+            client,
+            structured_prompts,
+            response_format=SUMMARY_RESPONSE_FORMAT,
+            force_refresh=force_refresh or attempt > 0,
+            route=route
+        )
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            errors = f"JSON 파싱 실패: {str(e)}"
+            logger.warning(f"구조화 요약 {errors} ({attempt + 1}/{MAX_DOCUMENT_ATTEMPTS})")
+            continue
+
+        validation = validate_summary(data)
+        if validation["document"]:
+            errors = validation["document"]
+            logger.warning(f"구조화 요약 검증 실패: {errors} ({attempt + 1}/{MAX_DOCUMENT_ATTEMPTS})")
+            continue
+
+        for index, section_errors in validation["sections"].items():
+            logger.warning(f"섹션 {index} 검증 실패, 해당 섹션만 재요청: {section_errors}")
+            data["sections"][index] = repair_section(
+                client, prompts, data["sections"][index], section_errors, force_refresh
+            )
+
+        return {
+            "date": data["date"],
+            "source": "테크 트렌드 커피챗",
+            "sections": data["sections"],
+            "createdAt": datetime.now().isoformat()
+        }
+
+    raise ValueError(f"구조화 요약 생성 실패: {errors}")
+
+# 설정된 모드에 따라 JSON 요약 생성 (큰 입력은 청크별 텍스트 요약 후 병합 단계만 JSON 으로 요청)
+def summarize_content_to_json(
+    client,
+    content: str,
+    mode: Optional[str] = None,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    instructions: Optional[str] = None
+) -> Dict[str, Any]:
+    mode = mode or SUMMARY_MODE
+    if mode == "map_reduce" or (mode == "auto" and estimate_tokens(content) > SUMMARY_CHUNK_TOKENS):
+        chunks = chunk_content(content)
+        if len(chunks) > 1:
+            partial_summaries = summarize_chunks(client, chunks, force_refresh=force_refresh, instructions=instructions)
+            logger.info("부분 요약 병합 중 (JSON)...")
+            return get_structured_summary(client, generate_merge_prompt(partial_summaries, instructions), force_refresh, route="merge")
+
+    return get_structured_summary(client, generate_prompt(content, instructions), force_refresh)
@@ -0,0 +1,12 @@
+import math
+
+
+# 토큰 수 추정 (토크나이저 없이 빠르게 계산하는 보수적 근사치)
+# - ASCII 문자: 약 4자당 1토큰
+# - 한글 등 비 ASCII 문자: 약 1자당 1토큰
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / 4 + other_chars)
@@ -0,0 +1,166 @@
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from main import logger, build_summary, parse_week, setup_logging
+from app.storage.mongo import find_existing_dates, insert_summaries_to_db
+from app.metrics.recorder import metrics
+from app.config.settings import BACKFILL_MAX_WORKERS, LLM_CACHE_FORCE_REFRESH, CHECKPOINT_DIR, METRICS_TEXTFILE_PATH, CROSS_WEEK_DEDUP_ENABLED
+
+
+# 기간을 주 단위(월 - 금) 구간으로 분할
+def split_weekly_windows(start_date: date, end_date: date) -> List[Tuple[date, date]]:
+    windows = []
+    monday = start_date - timedelta(days=start_date.weekday())
+    while monday <= end_date:
+        friday = monday + timedelta(days=4)
+        window_start = max(monday, start_date)
+        window_end = min(friday, end_date)
+        if window_start <= window_end:
+            windows.append((window_start, window_end))
+        monday += timedelta(days=7)
+    return windows
+
+# 이미 요약본이 저장된 주 제외
+def filter_existing_weeks(windows: List[Tuple[date, date]]) -> Tuple[List[Tuple[date, date]], List[Tuple[date, date]]]:
+    if not windows:
+        return [], []
+    existing_dates = find_existing_dates(windows[0][0], windows[-1][1])
+
+    pending, skipped = [], []
+    for window_start, window_end in windows:
+        if any(window_start <= existing <= window_end for existing in existing_dates):
+            skipped.append((window_start, window_end))
+        else:
+            pending.append((window_start, window_end))
+    return pending, skipped
+
+# 여러 주를 요약해 저장
+# - ordered=False: 여러 주를 동시에 요약한 뒤 한 번에 저장
+# - ordered=True (이전 주 기사 축소가 켜져 있으면 기본값): Notion 조회는 최대 max_workers 주 앞서 동시에 진행하고,
+#   기사 색인 조회 / 요약 / 저장은 날짜 순서대로 한 주씩 진행
+#   (저장된 주가 기사 색인에 반영되어야 다음 주가 그 기사를 한 줄 참조로 축소하므로, 동시 실행 시 결과가 실행 순서에 좌우됨)
+def backfill(
+    start_date: date,
+    end_date: date,
+    max_workers: int = BACKFILL_MAX_WORKERS,
+    skip_existing: bool = True,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    ordered: bool = CROSS_WEEK_DEDUP_ENABLED
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    metrics.reset()
+    windows = split_weekly_windows(start_date, end_date)
+    if skip_existing:
+        pending, skipped = filter_existing_weeks(windows)
+    else:
+        pending, skipped = windows, []
+
+    mode = f"Notion 조회 동시 {max_workers}주, 요약은 날짜 순서대로 1주씩" if ordered else f"동시 {max_workers}주"
+    logger.info(f"백필 시작: 전체 {len(windows)}주, 처리 대상 {len(pending)}주, 기존 {len(skipped)}주 건너뜀 ({mode})")
+
+    summaries: List[Dict[str, Any]] = []
+    empty: List[Tuple[date, date]] = []
+    failed: List[Tuple[date, date]] = []
+    saved = {"inserted": 0, "existing": 0}
+    save_error = None
+
+    def record(done: int, window: Tuple[date, date], run) -> None:
+        try:
+            json_data = run()
+            if json_data is None:
+                empty.append(window)
+                status = "데이터 없음"
+            else:
+                # 날짜 순서 모드는 저장까지 성공해야 요약 완료로 집계
+                if ordered:
+                    for key, value in insert_summaries_to_db([json_data]).items():
+                        saved[key] += value
+                summaries.append(json_data)
+                status = f"요약 완료 ({json_data['date']})"
+        except Exception as e:
+            failed.append(window)
+            status = f"실패: {str(e)}"
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"[{done}/{len(pending)}] {window[0]} ~ {window[1]} {status} (경과 {elapsed:.1f}초)")
+
+    if ordered:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetches = {}
+
+            def prefetch(index: int) -> None:
+                if index < len(pending):
+                    fetches[index] = executor.submit(parse_week, *pending[index])
+
+            for index in range(max_workers):
+                prefetch(index)
+            for index, window in enumerate(pending):
+                fetch = fetches.pop(index)
+                prefetch(index + max_workers)
+                record(index + 1, window, lambda: build_summary(window[0], window[1], force_refresh, parsed_result=fetch.result()))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(build_summary, window_start, window_end, force_refresh): (window_start, window_end)
+                for window_start, window_end in pending
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                record(done, futures[future], future.result)
+        try:
+            saved = insert_summaries_to_db(summaries)
+        except Exception as e:
+            save_error = str(e)
+            logger.error(f"MongoDB 저장 실패: {save_error}")
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "weeks": len(windows),
+        "skipped": len(skipped),
+        "summarized": len(summaries),
+        "empty": len(empty),
+        "failed": [f"{window_start}~{window_end}" for window_start, window_end in failed],
+        "inserted": saved["inserted"],
+        "existing": saved["existing"],
+        "save_error": save_error,
+        "elapsed_seconds": round(elapsed, 1),
+        "weeks_per_minute": round(len(pending) / elapsed * 60, 2) if elapsed > 0 else 0.0
+    }
+    logger.info(f"백필 완료: {report}")
+
+    # 주별 실행 지표를 합산한 리포트 저장
+    metrics.export(
+        os.path.join(CHECKPOINT_DIR, f"backfill_{start_date}_{end_date}", "metrics.json"),
+        METRICS_TEXTFILE_PATH or None
+    )
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여러 주의 커피챗 요약본을 한 번에 생성하여 저장")
+    parser.add_argument("start_date", help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("end_date", help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=BACKFILL_MAX_WORKERS, help="동시에 처리할 주 수 (날짜 순서 모드에서는 Notion 조회만 동시에 진행)")
+    parser.add_argument("--include-existing", action="store_true", help="이미 저장된 주도 다시 요약")
+    parser.add_argument("--force-refresh", action="store_true", help="LLM 응답 캐시를 사용하지 않음")
+    parser.add_argument("--unordered", action="store_true", help="이전 주 기사 축소가 켜져 있어도 여러 주를 동시에 요약 (같은 백필의 앞선 주는 축소 대상에서 빠짐)")
+    args = parser.parse_args()
+    setup_logging()
+
+    try:
+        report = backfill(
+            datetime.strptime(args.start_date, "%Y-%m-%d").date(),
+            datetime.strptime(args.end_date, "%Y-%m-%d").date(),
+            max_workers=args.workers,
+            skip_existing=not args.include_existing,
+            force_refresh=args.force_refresh or LLM_CACHE_FORCE_REFRESH,
+            ordered=CROSS_WEEK_DEDUP_ENABLED and not args.unordered
+        )
+        if report["failed"] or report["save_error"]:
+            exit(1)
+    except Exception as e:
+        logger.error("백필 종료 with 에러", exc_info=True)
+        exit(1)
@@ -0,0 +1,196 @@
+import argparse
+import io
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from app.notion.parser import convert_all_parsed_pages_to_text, parse_notion_blocks, write_parsed_pages_text
+
+
+# 비교 기준: 명시적 스택 도입 전의 재귀 파서 (단계마다 목록을 새로 만들고 부모에 extend)
+def legacy_parse_notion_blocks(blocks: List[Dict[str, Any]], indent_level: int = 0) -> List[str]:
+    parsed_blocks = []
+    list_buffer = []
+    list_type = None
+
+    def flush_list():
+        nonlocal list_buffer, list_type
+        if not list_buffer:
+            return
+        if list_type == "bulleted_list_item":
+            for item in list_buffer:
+                marker = "->" * indent_level + "" if indent_level > 0 else "-"
+                parsed_blocks.append(f"{marker} {item}")
+        elif list_type == "numbered_list_item":
+            for i, item in enumerate(list_buffer):
+                if indent_level == 0:
+                    parsed_blocks.append(f"{i + 1}. {item}")
+                else:
+                    marker = "->" * indent_level
+                    parsed_blocks.append(f"{marker} {i + 1}. {item}")
+        list_buffer = []
+        list_type = None
+
+    def extract_text(block: Dict[str, Any]) -> str:
+        text_objects = block.get("rich_text", [])
+        return " ".join(t.get("plain_text", "") for t in text_objects if isinstance(t, dict)).strip()
+
+    for block in blocks:
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get("type")
+        content = extract_text(block.get(block_type, {}))
+        if not content:
+            continue
+        if block_type in ["paragraph", "quote"]:
+            flush_list()
+            parsed_blocks.append(f"> {content}" if block_type == "quote" else content)
+        elif block_type in ["bulleted_list_item", "numbered_list_item"]:
+            if list_type is None:
+                list_type = block_type
+            elif list_type != block_type:
+                flush_list()
+                list_type = block_type
+            list_buffer.append(content)
+        elif block_type in ["heading_1", "heading_2", "heading_3"]:
+            flush_list()
+            heading_prefix = {"heading_1": "#", "heading_2": "##", "heading_3": "###"}.get(block_type, "##")
+            parsed_blocks.append(f"{heading_prefix} {content}")
+        if block.get("has_children"):
+            child_parsed = legacy_parse_notion_blocks(block.get("children", []), indent_level + 1)
+            flush_list()
+            parsed_blocks.extend(child_parsed)
+
+    flush_list()
+    return parsed_blocks
+
+
+BLOCK_TYPES = ["paragraph", "quote", "bulleted_list_item", "numbered_list_item", "heading_2", "heading_3", "toggle", "to_do"]
+
+
+def _block(block_type: str, text: str, children: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    return {
+        "type": block_type,
+        "has_children": bool(children),
+        "children": children or [],
+        block_type: {"rich_text": [{"plain_text": text}] if text else []}
+    }
+
+# 임의 구조의 블록 트리 (빈 블록, 리스트 종류 전환, 하위 블록이 있는 토글 등 포함)
+def build_random_tree(rng: random.Random, width: int, depth: int) -> List[Dict[str, Any]]:
+    blocks = []
+    for i in range(width):
+        children = build_random_tree(rng, rng.randint(1, width), depth - 1) if depth > 0 and rng.random() < 0.3 else None
+        text = "" if rng.random() < 0.05 else f"내용 {i} " * rng.randint(1, 8)
+        blocks.append(_block(rng.choice(BLOCK_TYPES), text, children))
+    return blocks
+
+# 한 줄로 depth 단계까지 중첩된 리스트 (재귀 파서의 최대 깊이 확인용)
+def build_deep_chain(depth: int) -> List[Dict[str, Any]]:
+    block = _block("bulleted_list_item", f"항목 {depth}")
+    for level in range(depth - 1, -1, -1):
+        block = _block("bulleted_list_item", f"항목 {level}", [block])
+    return [block]
+
+# 넓고 적당히 깊은 트리 (페이지당 기사 수가 많은 주)
+def build_wide_tree(items: int, depth: int) -> List[Dict[str, Any]]:
+    def nested(level: int) -> Dict[str, Any]:
+        children = [nested(level + 1) for _ in range(2)] if level < depth else None
+        return _block("bulleted_list_item" if level % 2 else "numbered_list_item", f"{level}단계 내용 " * 4, children)
+
+    blocks = []
+    for i in range(items):
+        blocks.append(_block("heading_2", f"주제 {i}"))
+        blocks.append(_block("paragraph", f"https://example.com/{i}"))
+        blocks.append(nested(0))
+    return blocks
+
+def check_equivalence(cases: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for case in range(cases):
+        tree = build_random_tree(rng, rng.randint(1, 8), rng.randint(0, 6))
+        expected = legacy_parse_notion_blocks(tree)
+        actual = parse_notion_blocks(tree)
+        if expected != actual:
+            raise AssertionError(f"출력 불일치 (case {case})")
+    print(f"무작위 트리 {cases}개에서 기존 파서와 출력 동일")
+
+# 소요 시간(최솟값)과 최대 메모리 사용량 측정
+def measure(parser: Callable[[List[Dict[str, Any]]], List[str]], blocks: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            lines = parser(blocks)
+            best = min(best, time.perf_counter() - started)
+
+        tracemalloc.start()
+        parser(blocks)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    except RecursionError:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return {"error": "RecursionError"}
+    return {"ms": best * 1000, "lines": len(lines), "lines_per_sec": len(lines) / best, "peak_kb": peak / 1024}
+
+# 비교 기준: 페이지별 문자열을 만든 뒤 이어 붙이던 기존 텍스트 변환 (재귀 파서 + 목록 + join)
+def legacy_build_text(pages: List[List[Dict[str, Any]]]) -> str:
+    parsed_pages = [{"parsed_content": legacy_parse_notion_blocks(blocks)} for blocks in pages]
+    return "".join(convert_all_parsed_pages_to_text(parsed_pages))
+
+# 명시적 스택 파서 + 하나의 텍스트 버퍼
+def streaming_build_text(pages: List[List[Dict[str, Any]]]) -> str:
+    out = io.StringIO()
+    write_parsed_pages_text(({"parsed_content": parse_notion_blocks(blocks)} for blocks in pages), out)
+    return out.getvalue()
+
+def check_text_equivalence(cases: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for case in range(cases):
+        pages = [build_random_tree(rng, rng.randint(1, 8), rng.randint(0, 4)) for _ in range(rng.randint(1, 4))]
+        if legacy_build_text(pages) != streaming_build_text(pages):
+            raise AssertionError(f"텍스트 출력 불일치 (case {case})")
+    print(f"무작위 페이지 묶음 {cases}개에서 기존 텍스트 변환과 출력 동일")
+
+def run(repeat: int) -> None:
+    scenarios = [
+        ("wide (200 items, depth 4)", build_wide_tree(200, 4)),
+        ("wide (2000 items, depth 3)", build_wide_tree(2000, 3)),
+        ("deep chain (500)", build_deep_chain(500)),
+        ("deep chain (5000)", build_deep_chain(5000)),
+    ]
+    print(f"{'scenario':<28} {'parser':<8} {'ms':>10} {'lines/s':>12} {'peak KB':>10}")
+    for name, blocks in scenarios:
+        for label, parser in (("legacy", legacy_parse_notion_blocks), ("stack", parse_notion_blocks)):
+            result = measure(parser, blocks, repeat)
+            if "error" in result:
+                print(f"{name:<28} {label:<8} {result['error']:>10}")
+                continue
+            print(f"{name:<28} {label:<8} {result['ms']:>10.2f} {result['lines_per_sec']:>12,.0f} {result['peak_kb']:>10.1f}")
+
+    # 파싱부터 프롬프트 텍스트까지 (lines 대신 문자 수 기준)
+    text_scenarios = [
+        ("text (20 pages x 100 items)", [build_wide_tree(100, 3) for _ in range(20)]),
+        ("text (5 pages x 1000 items)", [build_wide_tree(1000, 2) for _ in range(5)]),
+    ]
+    print(f"\n{'scenario':<28} {'builder':<8} {'ms':>10} {'chars/s':>12} {'peak KB':>10}")
+    for name, pages in text_scenarios:
+        for label, builder in (("legacy", legacy_build_text), ("stream", streaming_build_text)):
+            result = measure(builder, pages, repeat)
+            print(f"{name:<28} {label:<8} {result['ms']:>10.2f} {result['lines_per_sec']:>12,.0f} {result['peak_kb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Notion 블록 파서 성능 / 메모리 비교 (재귀 vs 명시적 스택)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cases", type=int, default=2000, help="출력 동일성 확인용 무작위 트리 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(1000)
+    check_equivalence(args.cases, args.seed)
+    check_text_equivalence(args.cases // 4, args.seed)
+    run(args.repeat)
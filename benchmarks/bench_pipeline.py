@@ -0,0 +1,185 @@
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_services import FakeServices, InMemoryMongoClient
+from benchmarks.synthetic import SyntheticDatabase
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_DIR, "benchmarks", "results")
+
+
+# 커밋 간 비교를 위한 현재 커밋 정보 (작업 트리에 변경이 있으면 dirty)
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": False}
+    return {"commit": commit, "dirty": dirty}
+
+# 설정 모듈이 읽기 전에 모든 외부 서비스를 로컬 가짜 서버로 연결
+# (app 모듈은 이 함수 호출 이후에 import 해야 함)
+def configure_environment(services: FakeServices, database: SyntheticDatabase, workdir: str, args: argparse.Namespace) -> None:
+    os.environ.update({
+        "NOTION_API_KEY": "bench",
+        "NOTION_DATABASE_ID": database.database_id,
+        "NOTION_BASE_URL": services.url,
+        "NOTION_RATE_LIMIT_PER_SEC": str(args.notion_rate),
+        "NOTION_RATE_LIMIT_BURST": str(max(1, int(args.notion_rate))),
+        "NOTION_CACHE_ENABLED": str(args.with_cache).lower(),
+        "NOTION_CACHE_PATH": os.path.join(workdir, "notion_blocks.sqlite3"),
+        "OPENAI_API_KEY": "bench",
+        "OPENAI_BASE_URL": f"{services.url}/v1",
+        "LLM_CACHE_ENABLED": str(args.with_cache).lower(),
+        "LLM_CACHE_PATH": os.path.join(workdir, "llm_responses.sqlite3"),
+        "SLACK_WEBHOOK_TARGETS": f"{services.url}/slack/bench",
+        "MONGODB_CONNECTION_STRING": "mongodb://bench",
+        "CHECKPOINT_DIR": os.path.join(workdir, "runs"),
+        "METRICS_TEXTFILE_PATH": ""
+    })
+
+# repeat 번 실행하여 소요 시간(ms)과 실행당 가짜 서버 요청 수 기록
+def measure(services: FakeServices, func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    before = dict(services.requests)
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "runs": repeat,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.mean(timings), 3),
+        "requests_per_run": {
+            service: (services.requests[service] - before[service]) / repeat
+            for service in services.requests
+        }
+    }
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    database = SyntheticDatabase(
+        pages=args.pages,
+        articles_per_page=args.articles,
+        blocks_per_article=args.blocks,
+        depth=args.depth,
+        duplicate_rate=args.duplicate_rate,
+        seed=args.seed
+    )
+    start_date = database.meeting_date - timedelta(days=database.meeting_date.weekday())
+    end_date = start_date + timedelta(days=4)
+
+    with tempfile.TemporaryDirectory() as workdir, FakeServices(
+        database,
+        notion_latency_ms=args.notion_latency,
+        openai_latency_ms=args.openai_latency,
+        slack_latency_ms=args.slack_latency
+    ) as services:
+        configure_environment(services, database, workdir, args)
+
+        import main
+        from app.notion.parser import parse_notion_blocks_by_date, convert_all_parsed_pages_to_text
+        from app.summarizer.formatter import format_summary_to_json, format_summary_to_slack_message
+        from app.slack.notifier import format_blocks_from_text
+        from app.storage import mongo
+
+        logging.getLogger('tech_trend_bot').setLevel(logging.WARNING)
+        mongo._client = InMemoryMongoClient(latency_ms=args.mongo_latency)
+
+        parsed_pages = parse_notion_blocks_by_date(database.database_id, start_date, end_date)
+        summary_json = format_summary_to_json(services.summary_text)
+        slack_text = format_summary_to_slack_message(summary_json)
+
+        def end_to_end() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                main.main(start_date, end_date)
+
+        benchmarks = {
+            "parse_notion_blocks_by_date": measure(
+                services, lambda: parse_notion_blocks_by_date(database.database_id, start_date, end_date), args.repeat
+            ),
+            "convert_all_parsed_pages_to_text": measure(
+                services, lambda: convert_all_parsed_pages_to_text(parsed_pages), args.repeat
+            ),
+            "format_summary_to_json": measure(
+                services, lambda: format_summary_to_json(services.summary_text), args.repeat
+            ),
+            "format_blocks_from_text": measure(
+                services, lambda: format_blocks_from_text(slack_text), args.repeat
+            ),
+            "main.main": measure(services, end_to_end, args.repeat)
+        }
+
+        dataset = {
+            "pages": len(database.pages),
+            "blocks": database.block_count(),
+            "articles": len(database.articles),
+            "summary_chars": len(services.summary_text)
+        }
+
+    return {
+        **git_revision(),
+        "createdAt": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {key: value for key, value in vars(args).items() if key != "output"},
+        "dataset": dataset,
+        "benchmarks": benchmarks
+    }
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"commit {report['commit']}{' (dirty)' if report['dirty'] else ''} / dataset {report['dataset']}")
+    print(f"{'benchmark':<36} {'min ms':>10} {'median ms':>10} {'notion':>8} {'openai':>8} {'slack':>7}")
+    for name, result in report["benchmarks"].items():
+        requests = result["requests_per_run"]
+        print(
+            f"{name:<36} {result['min_ms']:>10.2f} {result['median_ms']:>10.2f} "
+            f"{requests['notion']:>8.1f} {requests['openai']:>8.1f} {requests['slack']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="외부 서비스 없이 파이프라인 단계별 성능 측정 (로컬 가짜 Notion / OpenAI / Slack / Mongo)")
+    parser.add_argument("--pages", type=int, default=20, help="Notion 페이지 수")
+    parser.add_argument("--articles", type=int, default=5, help="페이지당 기사 수")
+    parser.add_argument("--blocks", type=int, default=6, help="기사당 최상위 리스트 블록 수")
+    parser.add_argument("--depth", type=int, default=2, help="리스트 블록 중첩 깊이")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1, help="다른 작성자가 다시 올린 기사 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--notion-latency", type=float, default=20.0, help="Notion 요청당 지연 (ms)")
+    parser.add_argument("--openai-latency", type=float, default=200.0, help="OpenAI 요청당 지연 (ms)")
+    parser.add_argument("--slack-latency", type=float, default=20.0, help="Slack 요청당 지연 (ms)")
+    parser.add_argument("--mongo-latency", type=float, default=5.0, help="Mongo 요청당 지연 (ms)")
+    parser.add_argument("--notion-rate", type=float, default=1000.0, help="Notion 초당 요청 제한 (실제 한도는 3)")
+    parser.add_argument("--with-cache", action="store_true", help="Notion 블록 / LLM 응답 캐시 사용")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="리포트 저장 경로 (기본: benchmarks/results/<시각>_<커밋>.json)")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}_{report['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"리포트 저장: {output}")
@@ -0,0 +1,52 @@
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from app.summarizer.formatter import format_summary_to_slack_message
+from app.slack.notifier import format_messages_from_text
+
+
+EMOJIS = "🔵🟣🟡🟢🟠🟤"
+
+
+# 카테고리 6개에 주제를 고르게 나눈 가상 요약본 생성
+def build_summary(items: int, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    sections: List[Dict[str, Any]] = [
+        {"emoji": emoji, "category": f"카테고리 {i + 1}", "items": []}
+        for i, emoji in enumerate(EMOJIS)
+    ]
+    for i in range(items):
+        sections[i % len(sections)]["items"].append({
+            "title": f"주제 {i}",
+            "link": f"https://example.com/articles/{i}",
+            "bullets": [
+                "핵심 내용이 발표됨 " * rng.randint(2, 30)
+                for _ in range(rng.randint(1, 5))
+            ]
+        })
+    return {"date": "2025-06-04", "source": "테크 트렌드 커피챗", "sections": sections}
+
+# 주제 수를 늘려가며 format_messages_from_text 소요 시간 측정 (주제당 시간이 일정하면 선형)
+def run(sizes: List[int], repeat: int) -> None:
+    print(f"{'items':>8} {'chars':>10} {'messages':>9} {'blocks':>7} {'ms':>9} {'us/item':>9}")
+    for size in sizes:
+        text = format_summary_to_slack_message(build_summary(size))
+
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            messages = format_messages_from_text(text)
+            best = min(best, time.perf_counter() - started)
+
+        blocks = sum(len(message["blocks"]) for message in messages)
+        print(f"{size:>8} {len(text):>10} {len(messages):>9} {blocks:>7} {best * 1000:>9.2f} {best / size * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Slack 메시지 분할 성능 측정")
+    parser.add_argument("--sizes", default="100,1000,10000,50000", help="주제 수 목록 (쉼표로 구분)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(",")], args.repeat)
@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import 만으로 불러오면 안 되는 무거운 패키지 (실제 호출 시점에 import)
+HEAVY_MODULES = ["openai", "pymongo", "notion_client", "requests", "httpx"]
+
+PROBE = """
+import json, sys
+import {module}
+print(json.dumps([name for name in {heavy!r} if name in sys.modules]))
+"""
+
+
+# 빈 작업 디렉토리에서 새 프로세스로 import 하고 (소요 시간, 불러온 무거운 패키지, 생성된 파일) 반환
+def probe_import(module: str) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, PYTHONPATH=REPO_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=workdir, env=env, capture_output=True, text=True
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if result.returncode != 0:
+            raise RuntimeError(f"{module} import 실패:\n{result.stderr}")
+        return {
+            "elapsed_ms": elapsed_ms,
+            "heavy_modules": json.loads(result.stdout.strip().splitlines()[-1]),
+            "created_files": sorted(os.listdir(workdir))
+        }
+
+def measure_startup(module: str, repeat: int) -> Dict[str, Any]:
+    baseline = statistics.median(
+        probe_import("sys")["elapsed_ms"] for _ in range(repeat)
+    )
+    probes: List[Dict[str, Any]] = [probe_import(module) for _ in range(repeat)]
+    median_ms = statistics.median(probe["elapsed_ms"] for probe in probes)
+    return {
+        "module": module,
+        "interpreter_ms": round(baseline, 1),
+        "median_ms": round(median_ms, 1),
+        "import_ms": round(median_ms - baseline, 1),
+        "heavy_modules": probes[-1]["heavy_modules"],
+        "created_files": probes[-1]["created_files"]
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="콜드 스타트 시 모듈 import 시간 및 부수 효과 점검")
+    parser.add_argument("--modules", default="main,app.slack.notifier,app.summarizer.formatter", help="점검할 모듈 (쉼표로 구분)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=250.0, help="모듈별 import 시간 한도 (인터프리터 기동 시간 제외)")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<28} {'import ms':>10} {'total ms':>10}  heavy modules / created files")
+    for module in args.modules.split(","):
+        result = measure_startup(module.strip(), args.repeat)
+        over_budget = result["import_ms"] > args.budget_ms
+        failed = failed or over_budget or bool(result["heavy_modules"]) or bool(result["created_files"])
+        print(
+            f"{result['module']:<28} {result['import_ms']:>10.1f} {result['median_ms']:>10.1f}  "
+            f"{result['heavy_modules'] or '-'} / {result['created_files'] or '-'}"
+            f"{'  <- 한도 초과' if over_budget else ''}"
+        )
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,50 @@
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+# 두 bench_pipeline 리포트의 벤치마크별 중앙값 비교 (threshold % 이상 느려지면 회귀로 표시)
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    rows = []
+    for name, head_result in head["benchmarks"].items():
+        base_result = base["benchmarks"].get(name)
+        if base_result is None:
+            continue
+        base_ms = base_result["median_ms"]
+        head_ms = head_result["median_ms"]
+        change = (head_ms - base_ms) / base_ms * 100 if base_ms else 0.0
+        rows.append({
+            "name": name,
+            "base_ms": base_ms,
+            "head_ms": head_ms,
+            "change_pct": round(change, 1),
+            "regression": change > threshold
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="bench_pipeline 리포트 두 개 비교")
+    parser.add_argument("base", help="기준 리포트 (JSON)")
+    parser.add_argument("head", help="비교할 리포트 (JSON)")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 중앙값 증가율 (%%)")
+    args = parser.parse_args()
+
+    base, head = load_report(args.base), load_report(args.head)
+    if base.get("params") != head.get("params"):
+        print("경고: 두 리포트의 측정 조건(params)이 다릅니다.")
+
+    rows = compare(base, head, args.threshold)
+    print(f"{base['commit']} -> {head['commit']}")
+    print(f"{'benchmark':<36} {'base ms':>10} {'head ms':>10} {'change':>9}")
+    for row in rows:
+        marker = "  <- 회귀" if row["regression"] else ""
+        print(f"{row['name']:<36} {row['base_ms']:>10.2f} {row['head_ms']:>10.2f} {row['change_pct']:>+8.1f}%{marker}")
+
+    if any(row["regression"] for row in rows):
+        sys.exit(1)
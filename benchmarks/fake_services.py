@@ -0,0 +1,292 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import SyntheticDatabase
+
+
+BLOCK_CHILDREN_PATH = re.compile(r"^/v1/blocks/([^/]+)/children$")
+DATABASE_QUERY_PATH = re.compile(r"^/v1/databases/([^/]+)/query$")
+
+
+def _paginate(items: List[Dict[str, Any]], cursor: Optional[str], page_size: int) -> Dict[str, Any]:
+    start = int(cursor) if cursor else 0
+    end = start + page_size
+    has_more = end < len(items)
+    return {
+        "object": "list",
+        "results": items[start:end],
+        "next_cursor": str(end) if has_more else None,
+        "has_more": has_more
+    }
+
+# 로컬 HTTP 서버 하나로 Notion / OpenAI / Slack 웹훅 API 를 흉내냄
+# - /v1/databases/{id}/query, /v1/blocks/{id}/children : SyntheticDatabase 를 페이지네이션하여 반환
+# - /v1/chat/completions : 미리 만든 요약 텍스트 반환 (stream=true 면 SSE 청크로 나누어 전송)
+# - /slack/{name} : 웹훅 메시지 수신 후 "ok"
+# 서비스별 지연 시간(ms)을 주어 네트워크 왕복 시간을 재현
+class FakeServices:
+    def __init__(
+        self,
+        database: SyntheticDatabase,
+        notion_latency_ms: float = 0.0,
+        openai_latency_ms: float = 0.0,
+        slack_latency_ms: float = 0.0
+    ):
+        self.database = database
+        self.summary_text = database.summary_text()
+        self.latency = {
+            "notion": notion_latency_ms / 1000,
+            "openai": openai_latency_ms / 1000,
+            "slack": slack_latency_ms / 1000
+        }
+        self.requests = {"notion": 0, "openai": 0, "slack": 0}
+        self.slack_messages: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeServices":
+        services = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 요청마다 지연 ACK 대기(~40ms)가 생김
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                services._handle(self, "GET")
+
+            def do_POST(self) -> None:
+                services._handle(self, "POST")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeServices":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _count(self, service: str) -> None:
+        with self._lock:
+            self.requests[service] += 1
+        if self.latency[service]:
+            time.sleep(self.latency[service])
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        parsed = urlparse(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length) or b"{}") if length else {}
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        match = BLOCK_CHILDREN_PATH.match(parsed.path)
+        if match and method == "GET":
+            self._count("notion")
+            children = self.database.children.get(match.group(1), [])
+            return self._send_json(handler, _paginate(children, query.get("start_cursor"), int(query.get("page_size", 100))))
+
+        match = DATABASE_QUERY_PATH.match(parsed.path)
+        if match and method == "POST":
+            self._count("notion")
+            return self._send_json(handler, _paginate(self.database.pages, body.get("start_cursor"), int(body.get("page_size", 100))))
+
+        if parsed.path.endswith("/chat/completions") and method == "POST":
+            self._count("openai")
+            if body.get("stream"):
+                return self._send_completion_stream(handler, body)
+            return self._send_json(handler, self._completion(body))
+
+        if parsed.path.startswith("/slack/") and method == "POST":
+            self._count("slack")
+            with self._lock:
+                self.slack_messages.append(body)
+            return self._send(handler, 200, b"ok", "text/plain")
+
+        self._send_json(handler, {"object": "error", "status": 404, "code": "object_not_found", "message": parsed.path}, 404)
+
+    def _usage(self, body: Dict[str, Any]) -> Dict[str, int]:
+        prompt_chars = sum(len(message.get("content", "")) for message in body.get("messages", []))
+        prompt_tokens = prompt_chars // 2
+        completion_tokens = len(self.summary_text) // 2
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+
+    def _completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4o"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": self.summary_text},
+                "finish_reason": "stop"
+            }],
+            "usage": self._usage(body)
+        }
+
+    def _send_completion_stream(self, handler: BaseHTTPRequestHandler, body: Dict[str, Any]) -> None:
+        def event(choices: List[Dict[str, Any]], usage: Optional[Dict[str, int]] = None) -> bytes:
+            chunk = {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model", "gpt-4o"),
+                "choices": choices,
+                "usage": usage
+            }
+            return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8")
+
+        pieces = [self.summary_text[i:i + 200] for i in range(0, len(self.summary_text), 200)]
+        events = [event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}]) for piece in pieces]
+        events.append(event([{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+        if body.get("stream_options", {}).get("include_usage"):
+            events.append(event([], self._usage(body)))
+        events.append(b"data: [DONE]\n\n")
+        self._send(handler, 200, b"".join(events), "text/event-stream")
+
+    def _send_json(self, handler: BaseHTTPRequestHandler, payload: Dict[str, Any], status: int = 200) -> None:
+        self._send(handler, status, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json")
+
+    def _send(self, handler: BaseHTTPRequestHandler, status: int, payload: bytes, content_type: str) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+# pymongo MongoClient 대용 (app.storage.mongo 가 사용하는 최소 기능만 메모리에서 처리)
+class InMemoryMongoClient:
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000
+        self._databases: Dict[str, "_InMemoryDatabase"] = {}
+
+    def __getitem__(self, name: str) -> "_InMemoryDatabase":
+        return self._databases.setdefault(name, _InMemoryDatabase(name, self.latency))
+
+    def close(self) -> None:
+        pass
+
+
+class _InMemoryDatabase:
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+        self._collections: Dict[str, "_InMemoryCollection"] = {}
+
+    def __getitem__(self, name: str) -> "_InMemoryCollection":
+        return self._collections.setdefault(name, _InMemoryCollection(f"{self.name}.{name}", self.latency))
+
+
+class _InMemoryCollection:
+    def __init__(self, full_name: str, latency: float):
+        self.full_name = full_name
+        self.latency = latency
+        self.documents: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    @staticmethod
+    def _matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+        for key, condition in query.items():
+            value = document.get(key)
+            if isinstance(condition, dict):
+                if "$gte" in condition and not value >= condition["$gte"]:
+                    return False
+                if "$lte" in condition and not value <= condition["$lte"]:
+                    return False
+                if "$lt" in condition and not value < condition["$lt"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def create_index(self, keys, **kwargs) -> str:
+        return kwargs.get("name", "index")
+
+    def update_one(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool = False) -> SimpleNamespace:
+        self._wait()
+        with self._lock:
+            return self._update_one(query, update, upsert)
+
+    def _update_one(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool) -> SimpleNamespace:
+        for document in self.documents:
+            if self._matches(document, query):
+                document.update(update.get("$set", {}))
+                for key, value in update.get("$min", {}).items():
+                    document[key] = min(document.get(key, value), value)
+                for key, value in update.get("$max", {}).items():
+                    document[key] = max(document.get(key, value), value)
+                return SimpleNamespace(matched_count=1, upserted_id=None)
+        if not upsert:
+            return SimpleNamespace(matched_count=0, upserted_id=None)
+
+        document = dict(query)
+        document.update(update.get("$setOnInsert", {}))
+        document.update(update.get("$set", {}))
+        document.update(update.get("$min", {}))
+        document.update(update.get("$max", {}))
+        document.setdefault("_id", len(self.documents) + 1)
+        self.documents.append(document)
+        return SimpleNamespace(matched_count=0, upserted_id=document["_id"])
+
+    def bulk_write(self, operations, ordered: bool = True) -> SimpleNamespace:
+        self._wait()
+        upserted_ids = {}
+        with self._lock:
+            for index, operation in enumerate(operations):
+                document = operation._doc
+                result = self._update_one(operation._filter, document, operation._upsert)
+                if result.upserted_id is not None:
+                    upserted_ids[index] = result.upserted_id
+        return SimpleNamespace(upserted_count=len(upserted_ids), upserted_ids=upserted_ids)
+
+    def insert_many(self, documents: List[Dict[str, Any]], ordered: bool = True) -> SimpleNamespace:
+        self._wait()
+        with self._lock:
+            self.documents.extend(dict(document) for document in documents)
+        return SimpleNamespace(inserted_ids=list(range(len(documents))))
+
+    def delete_many(self, query: Dict[str, Any]) -> SimpleNamespace:
+        self._wait()
+        with self._lock:
+            kept = [document for document in self.documents if not self._matches(document, query)]
+            deleted = len(self.documents) - len(kept)
+            self.documents = kept
+        return SimpleNamespace(deleted_count=deleted)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        self._wait()
+        with self._lock:
+            return [dict(document) for document in self.documents if self._matches(document, query or {})]
@@ -0,0 +1,120 @@
+import random
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+EMOJIS = "🔵🟣🟡🟢🟠🟤"
+WORDS = [
+    "모델", "출시됨", "발표함", "성능이", "향상됨", "클라우드", "에이전트", "데이터센터", "투자", "유치함",
+    "규제", "강화됨", "오픈소스", "공개됨", "사용자", "증가함", "GPU", "API", "latency", "benchmark"
+]
+
+
+def _rich_text(text: str) -> Dict[str, Any]:
+    return {"rich_text": [{"type": "text", "plain_text": text, "text": {"content": text}}]}
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+# 가상 Notion 데이터베이스 (페이지 목록 + 블록 ID 별 하위 블록)
+# - 페이지마다 날짜(heading_1), 작성자, 기사(제목 heading_2 + 링크 + depth 단계로 중첩된 리스트)를 생성
+# - duplicate_rate 비율의 기사는 이전 기사를 다른 작성자가 다시 올린 것처럼 같은 링크 / 본문을 사용
+class SyntheticDatabase:
+    def __init__(
+        self,
+        pages: int = 20,
+        articles_per_page: int = 5,
+        blocks_per_article: int = 6,
+        depth: int = 2,
+        duplicate_rate: float = 0.1,
+        meeting_date: date = date(2025, 6, 4),
+        seed: int = 0
+    ):
+        self.database_id = "00000000-0000-0000-0000-000000000000"
+        self.meeting_date = meeting_date
+        self.pages: List[Dict[str, Any]] = []
+        self.children: Dict[str, List[Dict[str, Any]]] = {}
+        self.articles: List[Dict[str, Any]] = []
+
+        rng = random.Random(seed)
+        edited = datetime(meeting_date.year, meeting_date.month, meeting_date.day, tzinfo=timezone.utc)
+        self.last_edited_time = edited.isoformat().replace("+00:00", ".000Z")
+        self._next_id = 0
+
+        for page_index in range(pages):
+            page_id = self._new_id()
+            self.pages.append({
+                "object": "page",
+                "id": page_id,
+                "last_edited_time": self.last_edited_time,
+                "properties": {"회의일자": {"type": "date", "date": {"start": meeting_date.isoformat()}}}
+            })
+
+            blocks = [
+                self._block("heading_1", meeting_date.isoformat()),
+                self._block("paragraph", f"@member{page_index}")
+            ]
+            for _ in range(articles_per_page):
+                if self.articles and rng.random() < duplicate_rate:
+                    article = rng.choice(self.articles)
+                else:
+                    number = len(self.articles)
+                    article = {
+                        "title": f"주제 {number}: {_sentence(rng, 3)}",
+                        "link": f"https://example.com/news/{number}",
+                        "bullets": [_sentence(rng, rng.randint(6, 18)) for _ in range(blocks_per_article)]
+                    }
+                    self.articles.append(article)
+
+                blocks.append(self._block("heading_2", article["title"]))
+                blocks.append(self._block("paragraph", article["link"]))
+                for bullet in article["bullets"]:
+                    blocks.append(self._nested_list(bullet, depth, rng))
+
+            self.children[page_id] = blocks
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return f"{self._next_id:08x}-0000-0000-0000-000000000000"
+
+    def _block(self, block_type: str, text: str, children: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        block = {
+            "object": "block",
+            "id": self._new_id(),
+            "type": block_type,
+            "has_children": bool(children),
+            "last_edited_time": self.last_edited_time,
+            block_type: _rich_text(text)
+        }
+        if children:
+            self.children[block["id"]] = children
+        return block
+
+    # depth 단계까지 하위 리스트를 가진 리스트 블록
+    def _nested_list(self, text: str, depth: int, rng: random.Random) -> Dict[str, Any]:
+        children = None
+        if depth > 0:
+            children = [
+                self._nested_list(_sentence(rng, rng.randint(4, 10)), depth - 1, rng)
+                for _ in range(rng.randint(1, 2))
+            ]
+        block_type = rng.choice(["bulleted_list_item", "numbered_list_item"])
+        return self._block(block_type, text, children)
+
+    def block_count(self) -> int:
+        return sum(len(blocks) for blocks in self.children.values())
+
+    # LLM 응답 형식(이모지 카테고리 + [제목] / <링크> / - 핵심 내용)의 가상 요약 텍스트
+    def summary_text(self) -> str:
+        lines = [
+            f"☕️ {self.meeting_date.year}년 {self.meeting_date.month}월 {self.meeting_date.day}일 테크 트렌드 커피챗 요약",
+            ""
+        ]
+        for section_index, emoji in enumerate(EMOJIS):
+            lines.append(f"{emoji} 카테고리 {section_index + 1}")
+            for article in self.articles[section_index::len(EMOJIS)]:
+                lines.append(f"[{article['title']}]")
+                lines.append(f"<{article['link']}>")
+                lines.extend(f"- {bullet}" for bullet in article["bullets"][:3])
+            lines.append("")
+        return "\n".join(lines)
@@ -0,0 +1,210 @@
+import argparse
+import json
+import signal
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+import main
+from main import logger, setup_logging
+from run_jobs import run_jobs
+from app.config.jobs import load_jobs
+from app.scheduler.cron import CronSchedule, parse_schedules
+from app.config.settings import DAEMON_SCHEDULE, DAEMON_TIMEZONE, DAEMON_HOST, DAEMON_PORT, JOBS_MAX_WORKERS
+
+
+# 상주 실행 모드
+# - cron 스케줄에 맞춰 파이프라인 실행 (jobs 가 있으면 run_jobs, 없으면 main.main)
+# - 시작 시 Notion / OpenAI / Mongo / Slack 클라이언트를 미리 만들어 두고 실행마다 재사용
+# - 실행은 한 번에 하나만 (실행 중에 온 스케줄 / 즉시 실행 요청은 건너뜀)
+# - /health (GET): 상태 확인, /run (POST): 즉시 실행
+class PipelineDaemon:
+    def __init__(
+        self,
+        schedules: List[CronSchedule],
+        timezone: str = DAEMON_TIMEZONE,
+        jobs: Optional[List[Dict[str, Any]]] = None,
+        incremental: bool = False,
+        max_workers: int = JOBS_MAX_WORKERS
+    ):
+        self.schedules = schedules
+        self.timezone = ZoneInfo(timezone)
+        self.jobs = jobs
+        self.incremental = incremental
+        self.max_workers = max_workers
+        self.started_at = self.now()
+        self.last_run: Optional[Dict[str, Any]] = None
+        self.running_since: Optional[datetime] = None
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def now(self) -> datetime:
+        return datetime.now(self.timezone)
+
+    def next_run(self) -> Optional[datetime]:
+        if not self.schedules:
+            return None
+        now = self.now()
+        return min(schedule.next_after(now) for schedule in self.schedules)
+
+    # 클라이언트 생성 및 SDK import 를 미리 수행 (실패해도 실행 시점에 다시 시도)
+    # Notion 은 블록 조회에 쓰는 공용 이벤트 루프 / AsyncClient 를 준비 (실행마다 같은 커넥션 풀 사용)
+    def warm_up(self) -> None:
+        from app.notion.fetcher import get_async_notion_client, get_notion_loop
+        from app.summarizer.llm import initialize_client
+        from app.storage.mongo import get_client
+        from app.slack.notifier import get_session
+
+        started = time.perf_counter()
+        for name, warm in (
+            ("notion", lambda: (get_notion_loop(), get_async_notion_client())),
+            ("openai", initialize_client),
+            ("mongo", lambda: get_client().admin.command("ping")),
+            ("slack", get_session)
+        ):
+            try:
+                warm()
+            except Exception as e:
+                logger.warning(f"{name} 클라이언트 준비 실패 (실행 시 다시 시도): {str(e)}")
+        logger.info(f"클라이언트 준비 완료 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    # 백그라운드 스레드로 실행 시작 (이미 실행 중이면 False)
+    def trigger(self, reason: str) -> bool:
+        if not self._run_lock.acquire(blocking=False):
+            logger.warning(f"이전 실행이 끝나지 않아 {reason} 실행을 건너뜁니다.")
+            return False
+        self.running_since = self.now()
+        threading.Thread(target=self._run, args=(reason,), name=f"pipeline-{reason}", daemon=True).start()
+        return True
+
+    def _run(self, reason: str) -> None:
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"reason": reason, "startedAt": self.running_since.isoformat()}
+        try:
+            logger.info(f"파이프라인 실행 시작 ({reason})")
+            if self.jobs:
+                report = run_jobs(self.jobs, max_workers=self.max_workers, incremental=self.incremental)
+                result["ok"] = not report["failed"]
+                result["results"] = report["results"]
+            else:
+                main.main(incremental=self.incremental)
+                result["ok"] = True
+        except Exception as e:
+            logger.error(f"파이프라인 실행 실패 ({reason}): {str(e)}", exc_info=True)
+            result["ok"] = False
+            result["error"] = str(e)
+        finally:
+            result["elapsed_seconds"] = round(time.perf_counter() - started, 1)
+            self.last_run = result
+            self.running_since = None
+            self._run_lock.release()
+
+    def status(self) -> Dict[str, Any]:
+        next_run = self.next_run()
+        return {
+            "status": "ok",
+            "startedAt": self.started_at.isoformat(),
+            "running": self.running_since is not None,
+            "runningSince": self.running_since.isoformat() if self.running_since else None,
+            "nextRun": next_run.isoformat() if next_run else None,
+            "schedules": [schedule.expression for schedule in self.schedules],
+            "jobs": [job["name"] for job in self.jobs] if self.jobs else None,
+            "lastRun": self.last_run
+        }
+
+    def start_http_server(self, host: str, port: int) -> None:
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args) -> None:
+                logger.debug(format % args)
+
+            def do_GET(self) -> None:
+                if self.path == "/health":
+                    return self._send(200, daemon.status())
+                self._send(404, {"error": "not found"})
+
+            def do_POST(self) -> None:
+                if self.path == "/run":
+                    started = daemon.trigger("http")
+                    return self._send(202 if started else 409, {"started": started, **daemon.status()})
+                self._send(404, {"error": "not found"})
+
+            def _send(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="daemon-http", daemon=True).start()
+        logger.info(f"상태 확인 / 즉시 실행 엔드포인트: http://{host}:{self._server.server_address[1]}")
+
+    # 종료 요청이 올 때까지 다음 스케줄 시각마다 실행
+    def serve_forever(self) -> None:
+        while not self._stop.is_set():
+            next_run = self.next_run()
+            if next_run is None:
+                self._stop.wait()
+                break
+            logger.info(f"다음 실행 예정: {next_run.isoformat()}")
+
+            # 시스템 시계 변경에 대비해 최대 60초씩 나누어 대기
+            while not self._stop.is_set() and self.now() < next_run:
+                self._stop.wait(min(60.0, (next_run - self.now()).total_seconds()))
+            if not self._stop.is_set():
+                self.trigger("schedule")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # 공용 Notion 클라이언트 / 루프 정리 (실행 중인 파이프라인이 있으면 끝날 때까지 대기)
+    def close(self) -> None:
+        from app.notion.fetcher import close_async_notion_client
+
+        with self._run_lock:
+            close_async_notion_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="cron 스케줄에 맞춰 파이프라인을 실행하는 상주 프로세스")
+    parser.add_argument("--schedule", default=DAEMON_SCHEDULE, help="cron 표현식 (분 시 일 월 요일, 세미콜론으로 여러 개)")
+    parser.add_argument("--timezone", default=DAEMON_TIMEZONE, help="스케줄 기준 시간대")
+    parser.add_argument("--config", help="작업 설정 파일 (지정 시 run_jobs 로 모든 작업 실행)")
+    parser.add_argument("--workers", type=int, default=JOBS_MAX_WORKERS, help="동시에 실행할 작업 수")
+    parser.add_argument("--incremental", action="store_true", help="마지막 실행 이후 수정된 페이지만 요약해 기존 요약본에 병합")
+    parser.add_argument("--host", default=DAEMON_HOST)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT)
+    args = parser.parse_args()
+    setup_logging()
+
+    try:
+        daemon = PipelineDaemon(
+            parse_schedules(args.schedule),
+            args.timezone,
+            jobs=load_jobs(args.config) if args.config else None,
+            incremental=args.incremental,
+            max_workers=args.workers
+        )
+        daemon.warm_up()
+        daemon.start_http_server(args.host, args.port)
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: daemon.stop())
+        daemon.serve_forever()
+        daemon.close()
+        logger.info("데몬 종료")
+    except Exception as e:
+        logger.error("데몬 종료 with 에러", exc_info=True)
+        exit(1)
@@ -1,46 +1,62 @@
+import argparse
+import io
 import logging
+import threading
 from logging.handlers import RotatingFileHandler
 import os
-from datetime import date, datetime, timedelta
-from typing import Optional, Union
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
 
-from app.notion.client import DATABASE_ID
-from app.notion.parser import parse_notion_blocks_by_date, convert_all_parsed_pages_to_text
-from app.summarizer.llm import initialize_client, generate_prompt, get_summary
+from app.config.jobs import default_job
+from app.notion.parser import parse_notion_blocks_by_date, write_pages_entries_text, write_parsed_pages_text, latest_edited_time
+from app.summarizer.llm import initialize_client, build_prompt_report, summarize_content
+from app.summarizer.dedup import deduplicate_parsed_entries, finish_dedup_report, parsed_pages_coverage_keys
+from app.summarizer.structured import summarize_content_to_json
+from app.summarizer.tokens import estimate_tokens
 from app.summarizer.formatter import format_summary_to_json, format_summary_to_slack_message
-from app.storage.mongo import insert_summary_to_db
-from app.slack.notifier import format_blocks_from_text, post_to_slack
-from app.config.settings import SLACK_WEBHOOK_JARVIS_TEST
+from app.summarizer.merge import attach_item_sources, merge_summary_sections
+from app.storage.coverage import load_covered_index
+from app.storage.mongo import insert_summary_to_db, find_summary_in_range, update_summary_sections, get_watermark, set_watermark
+from app.storage.checkpoint import STAGES, RunCheckpoint, hash_inputs, run_stage
+from app.metrics.recorder import metrics
+from app.slack.notifier import format_messages_from_text, post_to_webhooks
+from app.config.settings import SLACK_WEBHOOKS, SLACK_WEBHOOKS_UNSET, LLM_CACHE_FORCE_REFRESH, DEDUP_ENABLED, DEDUP_SIMILARITY, CROSS_WEEK_DEDUP_ENABLED, SUMMARY_MODE, SUMMARY_OUTPUT, METRICS_TEXTFILE_PATH
 
 
-# 로그 디렉토리 생성
-if not os.path.exists('logs'):
-    os.makedirs('logs')
+logger = logging.getLogger('tech_trend_bot')
 
 # 로거 설정 (INFO, WARNING, ERRoR)
-logger = logging.getLogger('tech_trend_bot')
-logger.setLevel(logging.INFO)
+# import 시점이 아니라 실행 진입점에서 호출 (import 만 하는 경우 logs/ 생성이나 핸들러 추가 없음)
+def setup_logging() -> None:
+    if logger.handlers:
+        return
+
+    # 로그 디렉토리 생성
+    if not os.path.exists('logs'):
+        os.makedirs('logs')
+
+    logger.setLevel(logging.INFO)
 
-# 파일 핸들러 설정 (7일간 로그 보관, 최대 10MB)
-file_handler = RotatingFileHandler(
-    'logs/tech_trend_bot.log',
-    maxBytes=10*1024*1024,  # 10MB
-    backupCount=7
-)
-file_handler.setLevel(logging.INFO)
+    # 파일 핸들러 설정 (7일간 로그 보관, 최대 10MB)
+    file_handler = RotatingFileHandler(
+        'logs/tech_trend_bot.log',
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=7
+    )
+    file_handler.setLevel(logging.INFO)
 
-# 콘솔 핸들러 설정
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
+    # 콘솔 핸들러 설정
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
 
-# 로그 포맷 설정
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
+    # 로그 포맷 설정
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
 
-# 핸들러 로거 연결
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+    # 핸들러 로거 연결
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
 
 def get_this_week_dates() -> tuple[date, date]:
     """
@@ -51,67 +67,244 @@ def get_this_week_dates() -> tuple[date, date]:
     friday = monday + timedelta(days=4)
     return monday, friday
 
-def main(start_date: Optional[Union[str, date]] = None, end_date: Optional[Union[str, date]] = None) -> None:
+# 날짜 설정 (지정값 없으면 이번주 월 - 금 설정)
+def resolve_date_range(
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None
+) -> tuple[date, date]:
+    if start_date is None or end_date is None:
+        return get_this_week_dates()
+
+    # 문자열을 date 객체로 변환
+    if isinstance(start_date, str):
+        start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+    if isinstance(end_date, str):
+        end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+    return start_date, end_date
+
+# 이번 주 기사 중 이전 주에 다룬 기사 (꺼져 있거나 조회에 실패하면 빈 색인으로 계속 진행)
+def load_previous_coverage(parsed_result: List[Dict[str, Any]], start_date: date, collection_name: str) -> Dict[str, str]:
+    if not CROSS_WEEK_DEDUP_ENABLED:
+        return {}
+    try:
+        return load_covered_index(parsed_pages_coverage_keys(parsed_result), start_date, collection_name)
+    except Exception as e:
+        logger.warning(f"이전 주 기사 색인 조회 실패 (계속 진행): {str(e)}")
+        return {}
+
+# 파싱 결과를 프롬프트용 텍스트 하나로 변환 (중복 기사는 하나로 병합, 이전 주에 다룬 기사는 한 줄 참조로 축소)
+# 모든 페이지를 하나의 텍스트 버퍼에 기록 (페이지별 문자열을 만들어 이어 붙이지 않음)
+def convert_parsed_pages(parsed_result: List[Dict[str, Any]], covered: Optional[Dict[str, str]] = None) -> str:
+    out = io.StringIO()
+    if not DEDUP_ENABLED and not covered:
+        write_parsed_pages_text(parsed_result, out)
+        return out.getvalue()
+
+    pages_entries, dedup_report = deduplicate_parsed_entries(parsed_result, covered=covered, merge_duplicates=DEDUP_ENABLED)
+    write_pages_entries_text(pages_entries, out)
+    content = out.getvalue()
+    logger.info(f"중복 기사 병합: {finish_dedup_report(dedup_report, estimate_tokens(content))}")
+    return content
+
+# 1. Notion에서 데이터 가져오기 (파이프라인의 parse 단계, 백필은 이 단계만 여러 주를 동시에 실행)
+def parse_week(
+    start_date: date,
+    end_date: date,
+    checkpoint: Optional[RunCheckpoint] = None,
+    edited_after: Optional[str] = None,
+    job: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    database_id = (job or default_job())["database_id"]
+    logger.info("1. Notion 데이터 파싱 중...")
+    return run_stage(
+        checkpoint, "parse", [database_id, start_date, end_date, edited_after],
+        lambda: parse_notion_blocks_by_date(database_id, start_date, end_date, edited_after=edited_after)
+    )
+
+# Notion 파싱 -> 텍스트 변환 -> 요약 -> JSON 포맷팅 (저장 / 전송 제외)
+# checkpoint 가 있으면 단계별 결과를 저장하고, 재개 시 입력이 같은 단계는 건너뜀
+# job 은 작업 설정 (Notion DB / 추가 지침 / 출처 이름, 없으면 환경 변수 기본 작업)
+# edited_after 가 있으면 그 시각 이후 수정된 페이지만 요약 (증분 실행)
+# parsed_result 를 넘기면 Notion 조회 없이 이미 파싱한 결과를 사용
+# 결과의 lastEditedTime 은 요약에 포함된 페이지 중 가장 최근 수정 시각 (워터마크 갱신용)
+# 해당 기간 데이터가 없으면 None 반환
+def build_summary(
+    start_date: date,
+    end_date: date,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    checkpoint: Optional[RunCheckpoint] = None,
+    edited_after: Optional[str] = None,
+    job: Optional[Dict[str, Any]] = None,
+    parsed_result: Optional[List[Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
+    job = job or default_job()
+    instructions = job["prompt"]
+
+    if parsed_result is None:
+        parsed_result = parse_week(start_date, end_date, checkpoint, edited_after, job)
+    if not parsed_result:
+        logger.warning("해당 기간의 커피챗 데이터가 없습니다.")
+        return None
     
-    logger.info("테크 트렌드 커피챗 파이프라인 시작...")
+    # 2. 파싱된 데이터 텍스트로 변환
+    covered = load_previous_coverage(parsed_result, start_date, job["collection"])
+    content = run_stage(
+        checkpoint, "text", [parsed_result, DEDUP_ENABLED, DEDUP_SIMILARITY, covered],
+        lambda: convert_parsed_pages(parsed_result, covered)
+    )
+    if not content:
+        logger.warning("파싱된 텍스트가 없습니다.")
+        return None
     
-    try:
-        # 날짜 설정 (지정값 없으면 이번주 월 - 금 설정)
-        if start_date is None or end_date is None:
-            start_date, end_date = get_this_week_dates()
-        else:
-            # 문자열을 date 객체로 변환
-            if isinstance(start_date, str):
-                start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-            if isinstance(end_date, str):
-                end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-        
-        logger.info(f"처리 기간: {start_date} ~ {end_date}")
-        
-        # 1. Notion에서 데이터 가져오기
-        logger.info("1. Notion 데이터 파싱 중...")
-        parsed_result = parse_notion_blocks_by_date(DATABASE_ID, start_date, end_date)
-        if not parsed_result:
-            logger.warning("해당 기간의 커피챗 데이터가 없습니다.")
-            return
-        
-        # 2. 파싱된 데이터 텍스트로 변환
-        parsed_texts = convert_all_parsed_pages_to_text(parsed_result)
-        if not parsed_texts:
-            logger.warning("파싱된 텍스트가 없습니다.")
-            return
-        
-        # 3. GPT-4o로 요약 생성
-        logger.info("2. GPT-4o로 요약 생성 중...")
-        client = initialize_client()
-        prompts = generate_prompt("".join(parsed_texts))
-        summary = get_summary(client, prompts)
+    # 3. GPT-4o로 요약 생성
+    logger.info("2. GPT-4o로 요약 생성 중...")
+    logger.info(f"프롬프트 크기 점검: {build_prompt_report(content)}")
+    summary_inputs = [content, SUMMARY_MODE, SUMMARY_OUTPUT, instructions]
+    if SUMMARY_OUTPUT == "json":
+        # 스키마 기반 JSON 요약 (검증 실패 시 해당 섹션만 재요청, 정규식 파싱 불필요)
+        json_data = run_stage(
+            checkpoint, "summary", summary_inputs,
+            lambda: summarize_content_to_json(initialize_client(), content, force_refresh=force_refresh, instructions=instructions)
+        )
+    else:
+        summary = run_stage(
+            checkpoint, "summary", summary_inputs,
+            lambda: summarize_content(initialize_client(), content, force_refresh=force_refresh, instructions=instructions)
+        )
         if not summary:
             logger.warning("GPT-4o 요약 생성 실패")
-            return
+            return None
         
         # 4. 요약본 포맷팅
         logger.info("3. 요약본 포맷팅 중...")
         try:
-            json_data = format_summary_to_json(summary)
+            json_data = run_stage(checkpoint, "json", [summary], lambda: format_summary_to_json(summary))
         except ValueError as e:
             logger.error(f"JSON 변환 실패: {str(e)}")
             raise
-        
-        # 5. MongoDB에 저장
-        logger.info("4. MongoDB에 저장 시도 중...")
+
+    if json_data:
+        attach_item_sources(json_data.get("sections", []), parsed_result)
+        json_data["lastEditedTime"] = latest_edited_time(parsed_result)
+        if job["source"]:
+            json_data["source"] = job["source"]
+    return json_data
+
+# 저장된 요약본 기준 워터마크 (주별 워터마크가 없을 때 사용: 요약본의 lastEditedTime, 없으면 저장 시각)
+def summary_watermark(summary: Dict[str, Any]) -> Optional[str]:
+    if summary.get("lastEditedTime"):
+        return summary["lastEditedTime"]
+    if summary.get("createdAt"):
+        return summary["createdAt"].astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:00.000Z")
+    return None
+
+# 워터마크 이후 수정된 페이지만 요약해 기존 요약본에 병합하고, Slack 에는 새로 추가된 주제만 전송
+# 워터마크는 주별로 저장 (없으면 기존 요약본 기준), 기존 요약본이 없으면 False 반환 (전체 실행 필요)
+# MongoDB 오류 처리 (전체 실행의 저장 단계처럼 실행을 중단하지 않음)
+# - 기존 요약본 / 워터마크 조회 실패: False 반환 (전체 실행으로 진행)
+# - 병합 결과 저장 실패: Slack 전송과 워터마크 갱신을 건너뜀 (다음 실행에서 같은 변경분을 다시 병합)
+# - Slack 전송 후 워터마크 갱신 실패: 로그만 남김 (다음 실행의 변경분은 이미 저장된 주제와 병합되어 다시 전송되지 않음)
+def run_incremental_update(start_date: date, end_date: date, force_refresh: bool, job: Dict[str, Any]) -> bool:
+    try:
+        existing = find_summary_in_range(start_date, end_date, job["collection"])
+        watermark = get_watermark(job["database_id"], job["collection"], start_date) or (summary_watermark(existing) if existing else None)
+    except Exception as e:
+        logger.warning(f"MongoDB 조회 실패, 전체 실행으로 진행합니다: {str(e)}")
+        return False
+    if watermark is None or existing is None:
+        logger.info("워터마크 또는 기존 요약본이 없어 전체 실행으로 진행합니다.")
+        return False
+
+    logger.info(f"증분 실행: {watermark} 이후 수정된 페이지만 조회")
+    delta = build_summary(start_date, end_date, force_refresh, edited_after=watermark, job=job)
+    if delta is None:
+        logger.info("새로 수정된 페이지가 없습니다.")
+        return True
+
+    merged_sections, added_sections = merge_summary_sections(existing.get("sections", []), delta.get("sections", []))
+    if added_sections:
+        logger.info(f"4. 기존 요약본에 주제 {sum(len(section['items']) for section in added_sections)}개 추가 중...")
         try:
-            insert_summary_to_db(json_data)
+            update_summary_sections(existing["date"], merged_sections, job["collection"], delta.get("lastEditedTime"))
         except Exception as e:
-            logger.warning(f"MongoDB 저장 실패 (계속 진행): {str(e)}")
+            logger.warning(f"MongoDB 저장 실패, Slack 전송과 워터마크 갱신을 건너뜁니다: {str(e)}")
+            return True
+
+        logger.info("5. Slack 업데이트 메시지 전송 중...")
+        slack_text = format_summary_to_slack_message({
+            "date": existing["date"].strftime("%Y-%m-%d"),
+            "source": existing.get("source", ""),
+            "sections": added_sections
+        }, title="업데이트")
+        deliver_slack_messages(format_messages_from_text(slack_text), job["webhooks"])
+    else:
+        logger.info("수정된 페이지에 새로운 주제가 없습니다.")
+
+    try:
+        set_watermark(job["database_id"], job["collection"], start_date, delta.get("lastEditedTime"))
+    except Exception as e:
+        logger.warning(f"워터마크 갱신 실패 (계속 진행): {str(e)}")
+    return True
+
+# 작업 하나의 파이프라인 실행 (요약 -> 저장 -> 전송), 처리 결과를 문자열로 반환
+# 지표 초기화 / 저장은 호출하는 쪽(main, run_jobs)에서 담당
+def run_pipeline(
+    start_date: date,
+    end_date: date,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    checkpoint: Optional[RunCheckpoint] = None,
+    incremental: bool = False,
+    job: Optional[Dict[str, Any]] = None
+) -> str:
+    job = job or default_job()
+    if incremental and run_incremental_update(start_date, end_date, force_refresh, job):
+        return "증분 처리 완료"
+    
+    json_data = build_summary(start_date, end_date, force_refresh, checkpoint, job=job)
+    if json_data is None:
+        return "데이터 없음"
+    
+    # 5. MongoDB에 저장 (날짜 기준 upsert 라 재실행해도 중복 저장 없음)
+    logger.info("4. MongoDB에 저장 시도 중...")
+    try:
+        # 이미 있던 요약본이면 이번 결과가 저장되지 않았으므로 워터마크를 올리지 않음
+        if insert_summary_to_db(json_data, job["collection"]):
+            set_watermark(job["database_id"], job["collection"], start_date, json_data.get("lastEditedTime"))
+    except Exception as e:
+        logger.warning(f"MongoDB 저장 실패 (계속 진행): {str(e)}")
+    
+    # 6. Slack 메시지 전송 (재개 시 같은 메시지를 이미 보냈다면 건너뜀)
+    logger.info("5. Slack 메시지 전송 중...")
+    slack_text = format_summary_to_slack_message(json_data)
+    slack_messages = format_messages_from_text(slack_text)
+    run_stage(
+        checkpoint, "slack", [slack_messages, job["webhooks"]],
+        lambda: deliver_slack_messages(slack_messages, job["webhooks"], checkpoint)
+    )
+    return f"요약 완료 ({json_data['date']})"
+
+def main(
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    resume: bool = False,
+    from_stage: Optional[str] = None,
+    incremental: bool = False
+) -> None:
+    
+    logger.info("테크 트렌드 커피챗 파이프라인 시작...")
+    metrics.reset()
+    checkpoint = None
+    
+    try:
+        start_date, end_date = resolve_date_range(start_date, end_date)
+        logger.info(f"처리 기간: {start_date} ~ {end_date}")
+        checkpoint = RunCheckpoint(start_date, end_date, resume=resume, from_stage=from_stage)
         
-        # 6. Slack 메시지 전송
-        logger.info("5. Slack 메시지 전송 중...")
-        slack_text = format_summary_to_slack_message(json_data)
-        slack_message = format_blocks_from_text(slack_text)
-        post_to_slack(SLACK_WEBHOOK_JARVIS_TEST, slack_message)
+        with metrics.span("pipeline_run"):
+            status = run_pipeline(start_date, end_date, force_refresh, checkpoint, incremental)
         
-        logger.info("모든 처리가 완료되었습니다!")
+        logger.info(f"모든 처리가 완료되었습니다! ({status})")
         
     except ValueError as e:
         logger.error(f"입력값 오류: {str(e)}")
@@ -119,13 +312,75 @@ def main(start_date: Optional[Union[str, date]] = None, end_date: Optional[Union
     except Exception as e:
         logger.error(f"처리 중 오류 발생: {str(e)}", exc_info=True)
         raise
+    finally:
+        # 실패한 실행도 어느 단계에서 시간이 걸렸는지 볼 수 있도록 항상 지표 저장
+        export_run_metrics(checkpoint)
+
+# 실행 지표를 체크포인트 디렉토리(metrics.json)와 Prometheus 텍스트 파일로 저장
+def export_run_metrics(checkpoint: Optional[RunCheckpoint]) -> None:
+    report_path = os.path.join(checkpoint.directory, "metrics.json") if checkpoint else None
+    try:
+        metrics.export(report_path, METRICS_TEXTFILE_PATH or None)
+    except OSError as e:
+        logger.warning(f"실행 지표 저장 실패: {str(e)}")
+
+# 모든 웹훅으로 전송하고 하나라도 실패하면 예외 발생 (webhooks 를 생략하면 SLACK_WEBHOOKS)
+# checkpoint 가 있으면 웹훅별로 보낸 메시지 수를 slack 단계 진행 상황으로 기록하고, 재개 시 보내지 않은 메시지부터 전송
+def deliver_slack_messages(
+    slack_messages: List[Dict[str, Any]],
+    webhooks: Optional[List[str]] = None,
+    checkpoint: Optional[RunCheckpoint] = None
+) -> List[Dict[str, Any]]:
+    webhooks = webhooks or SLACK_WEBHOOKS
+    if not all(webhooks):
+        unset = ", ".join(f"SLACK_WEBHOOK_{name}" for name in SLACK_WEBHOOKS_UNSET) or "빈 웹훅"
+        raise ValueError(f"전송 대상 웹훅이 설정되지 않았습니다: {unset} (SLACK_WEBHOOK_TARGETS 확인)")
+
+    progress: Dict[str, int] = {}
+    on_progress = None
+    if checkpoint:
+        # run_stage 의 slack 단계와 같은 입력 해시 (메시지나 대상이 바뀌면 처음부터 전송)
+        input_hash = hash_inputs([slack_messages, webhooks])
+        progress = checkpoint.load_progress("slack", input_hash)
+        if progress:
+            logger.info(f"Slack 전송 이어서 진행: {progress}")
+        progress_lock = threading.Lock()
+
+        def on_progress(key: str, sent: int) -> None:
+            with progress_lock:
+                progress[key] = sent
+                checkpoint.save_progress("slack", input_hash, dict(progress))
+
+    delivery_results = post_to_webhooks(webhooks, slack_messages, dict(progress), on_progress)
+    for result in delivery_results:
+        logger.info(f"Slack 전송 결과: {result}")
+    failed = [result["webhook"] for result in delivery_results if not result["ok"]]
+    if failed:
+        raise Exception(f"Slack 전송 실패: {failed}")
+    return delivery_results
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="테크 트렌드 커피챗 요약 파이프라인")
+    parser.add_argument("start_date", nargs="?", help="시작일 (YYYY-MM-DD, 생략 시 이번주 월요일)")
+    parser.add_argument("end_date", nargs="?", help="종료일 (YYYY-MM-DD, 생략 시 이번주 금요일)")
+    parser.add_argument("--resume", action="store_true", help="입력이 바뀌지 않은 단계는 저장된 결과를 재사용")
+    parser.add_argument("--from-stage", choices=STAGES, help="지정한 단계부터 강제로 다시 실행")
+    parser.add_argument("--force-refresh", action="store_true", help="LLM 응답 캐시를 사용하지 않음")
+    parser.add_argument("--incremental", action="store_true", help="마지막 실행 이후 수정된 페이지만 요약해 기존 요약본에 병합")
+    args = parser.parse_args()
+    setup_logging()
+
     try:
         # 기본: 이번주 데이터
-        # 특정 날짜 설정시 main("YYYY-MM-DD", "YYYY-MM-DD")
-        # main("2025-03-18", "2025-03-20")
-        main()
+        # 특정 날짜 설정시 python main.py YYYY-MM-DD YYYY-MM-DD
+        main(
+            args.start_date,
+            args.end_date,
+            force_refresh=args.force_refresh or LLM_CACHE_FORCE_REFRESH,
+            resume=args.resume,
+            from_stage=args.from_stage,
+            incremental=args.incremental
+        )
         
     except Exception as e:
         logger.error("프로그램 종료 with 에러", exc_info=True)
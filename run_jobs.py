@@ -0,0 +1,112 @@
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+
+from main import logger, resolve_date_range, run_pipeline, setup_logging
+from app.config.jobs import load_jobs
+from app.storage.checkpoint import RunCheckpoint
+from app.metrics.recorder import metrics
+from app.config.settings import JOBS_CONFIG_PATH, JOBS_MAX_WORKERS, LLM_CACHE_FORCE_REFRESH, CHECKPOINT_DIR, METRICS_TEXTFILE_PATH
+
+
+# 작업 하나 실행 (체크포인트는 작업별 디렉토리 runs/<작업명>/<기간> 에 저장)
+def run_job(
+    job: Dict[str, Any],
+    start_date: date,
+    end_date: date,
+    force_refresh: bool,
+    resume: bool,
+    incremental: bool
+) -> str:
+    checkpoint = RunCheckpoint(start_date, end_date, resume=resume, root=os.path.join(CHECKPOINT_DIR, job["name"]))
+    with metrics.span("pipeline_run", job=job["name"]):
+        return run_pipeline(start_date, end_date, force_refresh, checkpoint, incremental, job)
+
+# 설정 파일의 작업들을 한 프로세스에서 동시에 실행
+# Notion 요청 속도 제한, Notion / OpenAI / Mongo / Slack 클라이언트는 프로세스 공용이라 작업 간 공유됨
+# 작업 하나가 실패해도 나머지는 계속 진행
+def run_jobs(
+    jobs: List[Dict[str, Any]],
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    max_workers: int = JOBS_MAX_WORKERS,
+    force_refresh: bool = LLM_CACHE_FORCE_REFRESH,
+    resume: bool = False,
+    incremental: bool = False
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    metrics.reset()
+    start_date, end_date = resolve_date_range(start_date, end_date)
+    logger.info(f"작업 {len(jobs)}개 시작: {start_date} ~ {end_date} (동시 {max_workers}개)")
+
+    results: Dict[str, str] = {}
+    failed: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_job, job, start_date, end_date, force_refresh, resume, incremental): job["name"]
+            for job in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error(f"작업 {name} 실패: {str(e)}", exc_info=True)
+                failed.append(name)
+                results[name] = f"실패: {str(e)}"
+
+            elapsed = time.perf_counter() - started
+            logger.info(f"[{done}/{len(jobs)}] {name} {results[name]} (경과 {elapsed:.1f}초)")
+
+    report = {
+        "jobs": len(jobs),
+        "results": results,
+        "failed": failed,
+        "elapsed_seconds": round(time.perf_counter() - started, 1)
+    }
+    logger.info(f"작업 실행 완료: {report}")
+
+    # 작업별 지표(pipeline_run 의 job 라벨)를 합산한 리포트 저장
+    try:
+        metrics.export(
+            os.path.join(CHECKPOINT_DIR, f"jobs_{start_date}_{end_date}", "metrics.json"),
+            METRICS_TEXTFILE_PATH or None
+        )
+    except OSError as e:
+        logger.warning(f"실행 지표 저장 실패: {str(e)}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="설정 파일의 여러 작업(Notion DB / Slack 채널)을 한 프로세스에서 실행")
+    parser.add_argument("start_date", nargs="?", help="시작일 (YYYY-MM-DD, 생략 시 이번주 월요일)")
+    parser.add_argument("end_date", nargs="?", help="종료일 (YYYY-MM-DD, 생략 시 이번주 금요일)")
+    parser.add_argument("--config", default=JOBS_CONFIG_PATH, help="작업 설정 파일 (JSON)")
+    parser.add_argument("--jobs", help="실행할 작업 이름 (쉼표로 구분, 생략 시 전체)")
+    parser.add_argument("--workers", type=int, default=JOBS_MAX_WORKERS, help="동시에 실행할 작업 수")
+    parser.add_argument("--resume", action="store_true", help="입력이 바뀌지 않은 단계는 저장된 결과를 재사용")
+    parser.add_argument("--incremental", action="store_true", help="마지막 실행 이후 수정된 페이지만 요약해 기존 요약본에 병합")
+    parser.add_argument("--force-refresh", action="store_true", help="LLM 응답 캐시를 사용하지 않음")
+    args = parser.parse_args()
+    setup_logging()
+
+    try:
+        jobs = load_jobs(args.config, args.jobs.split(",") if args.jobs else None)
+        report = run_jobs(
+            jobs,
+            args.start_date,
+            args.end_date,
+            max_workers=args.workers,
+            force_refresh=args.force_refresh or LLM_CACHE_FORCE_REFRESH,
+            resume=args.resume,
+            incremental=args.incremental
+        )
+        if report["failed"]:
+            exit(1)
+    except Exception as e:
+        logger.error("작업 실행 종료 with 에러", exc_info=True)
+        exit(1)
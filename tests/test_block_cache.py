@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+from app.notion import cache as cache_module
+from app.notion.cache import BlockCache
+
+
+# 호출할 때마다 1초씩 가는 시계 (accessed_at 순서를 결정적으로 만듦)
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        self.now += 1
+        return self.now
+
+
+def children(block_id, size=100):
+    return [{"id": f"{block_id}-child", "type": "paragraph", "text": "x" * size}]
+
+def new_cache(tmp_path, monkeypatch, max_bytes=10 ** 6):
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=Clock().time))
+    return BlockCache(str(tmp_path / "blocks.sqlite"), max_bytes=max_bytes)
+
+
+def test_hit_requires_same_last_edited_time(tmp_path, monkeypatch):
+    cache = new_cache(tmp_path, monkeypatch)
+    cache.set("a", "t1", children("a"))
+
+    assert cache.get("a", "t1") == children("a")
+    assert cache.get("a", "t2") is None
+    assert cache.get("a", None) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+def test_nested_children_are_not_stored(tmp_path, monkeypatch):
+    cache = new_cache(tmp_path, monkeypatch)
+    block = {"id": "c", "type": "toggle", "has_children": True, "children": children("c")}
+    cache.set("a", "t1", [block])
+
+    assert cache.get("a", "t1") == [{"id": "c", "type": "toggle", "has_children": True}]
+
+def test_missing_validator_is_not_stored(tmp_path, monkeypatch):
+    cache = new_cache(tmp_path, monkeypatch)
+    cache.set("a", None, children("a"))
+
+    assert cache.stats()["size_bytes"] == 0
+
+def test_overwrite_updates_total_size(tmp_path, monkeypatch):
+    cache = new_cache(tmp_path, monkeypatch)
+    cache.set("a", "t1", children("a", size=500))
+    cache.set("a", "t2", children("a", size=100))
+    cache.close()
+
+    # 다시 열어도 같은 크기에서 시작
+    reopened = BlockCache(cache.path, max_bytes=cache.max_bytes)
+    assert reopened.stats()["size_bytes"] == cache.stats()["size_bytes"]
+    assert reopened.get("a", "t2") == children("a", size=100)
+
+def test_evicts_least_recently_used_until_under_ninety_percent(tmp_path, monkeypatch):
+    probe = new_cache(tmp_path / "probe", monkeypatch)
+    probe.set("a", "t", children("a"))
+    entry_size = probe.stats()["size_bytes"]
+
+    # 네 번째 엔트리에서 한도를 넘고, 하나만 지우면 90% 아래로 내려가는 크기
+    cache = new_cache(tmp_path, monkeypatch, max_bytes=entry_size * 7 // 2)
+    for block_id in ("a", "b", "c"):
+        cache.set(block_id, "t", children(block_id))
+    # a 를 다시 사용해 b 가 가장 오래된 엔트리가 됨
+    assert cache.get("a", "t") is not None
+    cache.set("d", "t", children("d"))
+
+    assert cache.get("b", "t") is None
+    assert all(cache.get(block_id, "t") is not None for block_id in ("a", "c", "d"))
+    assert cache.stats()["size_bytes"] <= int(cache.max_bytes * 0.9)
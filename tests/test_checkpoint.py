@@ -0,0 +1,108 @@
+import json
+import os
+from datetime import date
+
+import pytest
+
+from app.storage.checkpoint import RunCheckpoint, hash_inputs, run_stage
+
+
+START, END = date(2024, 6, 3), date(2024, 6, 7)
+
+
+class Counter:
+    def __init__(self, output):
+        self.output = output
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.output
+
+
+def test_hash_inputs_is_stable_and_order_independent_for_dicts():
+    assert hash_inputs([{"b": 1, "a": 2}, START]) == hash_inputs([{"a": 2, "b": 1}, START])
+    assert hash_inputs(["a"]) != hash_inputs(["b"])
+
+def test_saves_stage_output_under_period_directory(tmp_path):
+    checkpoint = RunCheckpoint(START, END, root=str(tmp_path))
+    assert run_stage(checkpoint, "parse", ["db"], Counter([{"page_id": "p"}])) == [{"page_id": "p"}]
+
+    path = tmp_path / "2024-06-03_2024-06-07" / "parse.json"
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["input_hash"] == hash_inputs(["db"])
+    assert saved["output"] == [{"page_id": "p"}]
+    assert not os.path.exists(str(path) + ".tmp")
+
+def test_resume_reuses_stage_with_same_inputs(tmp_path):
+    run_stage(RunCheckpoint(START, END, root=str(tmp_path)), "summary", ["content"], Counter("요약"))
+
+    resumed = RunCheckpoint(START, END, resume=True, root=str(tmp_path))
+    func = Counter("새 요약")
+    assert run_stage(resumed, "summary", ["content"], func) == "요약"
+    assert func.calls == 0
+    assert resumed.reused == ["summary"]
+
+def test_resume_reruns_stage_when_inputs_change(tmp_path):
+    run_stage(RunCheckpoint(START, END, root=str(tmp_path)), "summary", ["content"], Counter("요약"))
+
+    func = Counter("새 요약")
+    assert run_stage(RunCheckpoint(START, END, resume=True, root=str(tmp_path)), "summary", ["changed"], func) == "새 요약"
+    assert func.calls == 1
+
+def test_without_resume_stages_always_run(tmp_path):
+    run_stage(RunCheckpoint(START, END, root=str(tmp_path)), "text", ["a"], Counter("텍스트"))
+
+    func = Counter("텍스트")
+    run_stage(RunCheckpoint(START, END, root=str(tmp_path)), "text", ["a"], func)
+    assert func.calls == 1
+
+def test_from_stage_reruns_that_stage_and_later(tmp_path):
+    first = RunCheckpoint(START, END, root=str(tmp_path))
+    for stage in ("parse", "text", "summary"):
+        run_stage(first, stage, [stage], Counter(stage))
+
+    resumed = RunCheckpoint(START, END, resume=True, from_stage="text", root=str(tmp_path))
+    funcs = {stage: Counter(stage) for stage in ("parse", "text", "summary")}
+    for stage, func in funcs.items():
+        run_stage(resumed, stage, [stage], func)
+    assert {stage: func.calls for stage, func in funcs.items()} == {"parse": 0, "text": 1, "summary": 1}
+
+def test_unknown_from_stage_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        RunCheckpoint(START, END, from_stage="deploy", root=str(tmp_path))
+
+def test_empty_output_is_not_saved(tmp_path):
+    checkpoint = RunCheckpoint(START, END, resume=True, root=str(tmp_path))
+    run_stage(checkpoint, "parse", ["db"], Counter([]))
+
+    func = Counter([{"page_id": "p"}])
+    run_stage(checkpoint, "parse", ["db"], func)
+    assert func.calls == 1
+
+def test_corrupt_checkpoint_is_ignored(tmp_path):
+    checkpoint = RunCheckpoint(START, END, resume=True, root=str(tmp_path))
+    os.makedirs(checkpoint.directory)
+    with open(os.path.join(checkpoint.directory, "json.json"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    assert run_stage(checkpoint, "json", ["summary"], Counter({"date": "2024-06-05"})) == {"date": "2024-06-05"}
+
+def test_without_checkpoint_runs_directly():
+    func = Counter("결과")
+    assert run_stage(None, "summary", ["content"], func) == "결과"
+    assert func.calls == 1
+
+def test_progress_is_kept_for_same_inputs_on_resume(tmp_path):
+    RunCheckpoint(START, END, root=str(tmp_path)).save_progress("slack", "hash-a", {"webhook": 2})
+
+    resumed = RunCheckpoint(START, END, resume=True, root=str(tmp_path))
+    assert resumed.load_progress("slack", "hash-a") == {"webhook": 2}
+    assert resumed.load_progress("slack", "hash-b") == {}
+
+def test_progress_is_ignored_without_resume_or_when_forced(tmp_path):
+    RunCheckpoint(START, END, root=str(tmp_path)).save_progress("slack", "hash-a", {"webhook": 2})
+
+    assert RunCheckpoint(START, END, root=str(tmp_path)).load_progress("slack", "hash-a") == {}
+    forced = RunCheckpoint(START, END, resume=True, from_stage="json", root=str(tmp_path))
+    assert forced.load_progress("slack", "hash-a") == {}
@@ -0,0 +1,93 @@
+from app.notion.parser import render_page_entries
+from app.summarizer.llm import build_prompt_report, chunk_content, split_articles
+from app.summarizer.tokens import estimate_tokens
+
+
+def page_text(*articles, date="2024-06-03", author="@민수"):
+    entries = [{"type": "date", "value": date}, {"type": "author", "value": author}]
+    entries.extend(articles)
+    return render_page_entries(entries)
+
+def article(title, link, body=(), covered=None):
+    entry = {"type": "article", "title": title, "links": [link], "body": list(body)}
+    if covered:
+        entry["covered"] = covered
+    return entry
+
+
+COVERED = article("OpenAI 새 모델 발표", "https://openai.com/news", covered="2024-05-27")
+NEW = article("쿠버네티스 릴리스", "https://k8s.example.com", ["- 사이드카 컨테이너 정식 지원"])
+
+
+def test_covered_article_after_header_is_kept():
+    articles = split_articles(page_text(COVERED, NEW))
+
+    assert [item["text"].split("\n")[0] for item in articles] == [
+        "[이미 다룬 기사] OpenAI 새 모델 발표 | https://openai.com/news | 2024-05-27 커피챗",
+        "[제목] 쿠버네티스 릴리스",
+    ]
+    assert articles[0]["text"].count("\n") == 0
+    assert articles[0]["date"] == "[날짜] 2024-06-03"
+    assert articles[0]["author"] == "[작성자] @민수"
+
+def test_covered_article_is_not_appended_to_previous_article():
+    articles = split_articles(page_text(NEW, COVERED))
+
+    assert len(articles) == 2
+    assert "[이미 다룬 기사]" not in articles[0]["text"]
+    assert articles[1]["text"].startswith("[이미 다룬 기사] OpenAI 새 모델 발표")
+
+def test_chunk_content_keeps_covered_article_with_page_header():
+    content = page_text(NEW) + page_text(COVERED, date="2024-06-04", author="@지은")
+    chunks = chunk_content(content, max_tokens=1)
+
+    assert len(chunks) == 2
+    assert chunks[1].split("\n") == [
+        "[날짜] 2024-06-04",
+        "",
+        "[작성자] @지은",
+        "[이미 다룬 기사] OpenAI 새 모델 발표 | https://openai.com/news | 2024-05-27 커피챗",
+    ]
+
+def test_prompt_report_counts_covered_articles():
+    assert build_prompt_report(page_text(COVERED, NEW))["articles"] == 2
+
+def test_split_articles_records_page_header_per_article():
+    content = page_text(NEW) + page_text(COVERED, date="2024-06-04", author="@지은")
+    headers = [(item["date"], item["author"]) for item in split_articles(content)]
+
+    assert headers == [("[날짜] 2024-06-03", "[작성자] @민수"), ("[날짜] 2024-06-04", "[작성자] @지은")]
+
+def test_chunk_content_repeats_header_when_page_is_split():
+    articles = [article(f"기사 {i}", f"https://example.com/{i}", ["- 본문 " * 20]) for i in range(4)]
+    chunks = chunk_content(page_text(*articles), max_tokens=1)
+
+    assert len(chunks) == 4
+    for i, chunk in enumerate(chunks):
+        lines = chunk.split("\n")
+        assert lines[:3] == ["[날짜] 2024-06-03", "", "[작성자] @민수"]
+        assert lines[3] == f"[제목] 기사 {i}"
+
+def test_chunk_content_packs_articles_within_budget_in_order():
+    articles = [article(f"기사 {i}", f"https://example.com/{i}", ["- 본문 " * 20]) for i in range(6)]
+    content = page_text(*articles)
+    texts = [item["text"] for item in split_articles(content)]
+    # 페이지 헤더 + 기사 두 개가 딱 맞는 예산
+    header_tokens = estimate_tokens("[날짜] 2024-06-03") + estimate_tokens("[작성자] @민수")
+    budget = header_tokens + sum(estimate_tokens(text) for text in texts[:2])
+
+    chunks = chunk_content(content, max_tokens=budget)
+
+    assert len(chunks) == 3
+    # 페이지 헤더는 청크마다 한 번만, 기사는 원문 순서 그대로
+    assert all(chunk.count("[날짜]") == 1 for chunk in chunks)
+    titles = [line for chunk in chunks for line in chunk.split("\n") if line.startswith("[제목]")]
+    assert titles == [f"[제목] 기사 {i}" for i in range(6)]
+
+def test_oversized_article_is_sent_as_its_own_chunk():
+    big = article("긴 기사", "https://example.com/big", ["- 아주 긴 본문 " * 200])
+    chunks = chunk_content(page_text(NEW, big, COVERED), max_tokens=50)
+
+    assert len(chunks) == 3
+    assert "[제목] 긴 기사" in chunks[1]
+    assert chunks[1].count("아주 긴 본문") == 200
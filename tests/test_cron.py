@@ -0,0 +1,93 @@
+from datetime import datetime
+
+import pytest
+
+from app.scheduler.cron import CronSchedule, parse_schedules
+
+
+def run_times(expression: str, after: datetime, count: int):
+    schedule = CronSchedule(expression)
+    times = []
+    for _ in range(count):
+        after = schedule.next_after(after)
+        times.append(after)
+    return times
+
+
+def test_every_fifteen_minutes():
+    times = run_times("*/15 * * * *", datetime(2024, 6, 3, 9, 7), 3)
+    assert times == [datetime(2024, 6, 3, 9, 15), datetime(2024, 6, 3, 9, 30), datetime(2024, 6, 3, 9, 45)]
+
+def test_next_after_skips_the_same_minute():
+    schedule = CronSchedule("0 9 * * *")
+    assert schedule.next_after(datetime(2024, 6, 3, 9, 0, 30)) == datetime(2024, 6, 4, 9, 0)
+
+def test_list_and_range_fields():
+    # 평일 9시, 18시
+    times = run_times("0 9,18 * * 1-5", datetime(2024, 6, 7, 12, 0), 3)
+    assert times == [datetime(2024, 6, 7, 18, 0), datetime(2024, 6, 10, 9, 0), datetime(2024, 6, 10, 18, 0)]
+
+def test_sunday_as_zero_or_seven():
+    assert CronSchedule("0 0 * * 0").weekdays == CronSchedule("0 0 * * 7").weekdays == {0}
+    assert CronSchedule("0 0 * * 7").next_after(datetime(2024, 6, 3)) == datetime(2024, 6, 9)
+
+def test_day_and_weekday_both_restricted_match_either():
+    # 매월 1일 또는 월요일
+    times = run_times("0 0 1 * 1", datetime(2024, 6, 25), 3)
+    assert times == [datetime(2024, 7, 1), datetime(2024, 7, 8), datetime(2024, 7, 15)]
+    assert run_times("0 0 1 * 1", datetime(2024, 7, 29), 2) == [datetime(2024, 8, 1), datetime(2024, 8, 5)]
+
+def test_step_on_day_is_unrestricted_for_or_rule():
+    # "*/2" 는 "*" 로 시작하므로 요일과 AND: 홀수 일이면서 월요일
+    schedule = CronSchedule("0 0 */2 * 1")
+    assert not schedule.day_restricted
+    assert schedule.weekday_restricted
+    times = run_times("0 0 */2 * 1", datetime(2024, 6, 1), 3)
+    assert times == [datetime(2024, 6, 3), datetime(2024, 6, 17), datetime(2024, 7, 1)]
+    assert all(moment.day % 2 == 1 and moment.weekday() == 0 for moment in times)
+
+def test_step_on_weekday_is_unrestricted_for_or_rule():
+    # "*/2" 요일(일, 화, 목, 토) 이면서 15일
+    schedule = CronSchedule("0 0 15 * */2")
+    assert schedule.day_restricted
+    assert not schedule.weekday_restricted
+    times = run_times("0 0 15 * */2", datetime(2024, 6, 1), 2)
+    assert times == [datetime(2024, 6, 15), datetime(2024, 8, 15)]
+
+def test_range_with_step_stays_restricted():
+    schedule = CronSchedule("0 0 1-31/2 * 1")
+    assert schedule.day_restricted
+    # 일 / 요일 OR: 6월 1일(토, 홀수 일) 다음은 6월 3일(월, 홀수 일), 그다음 5일(홀수 일)
+    assert run_times("0 0 1-31/2 * 1", datetime(2024, 6, 1, 12), 2) == [datetime(2024, 6, 3), datetime(2024, 6, 5)]
+
+def test_month_field():
+    assert CronSchedule("30 8 1 1,7 *").next_after(datetime(2024, 2, 1)) == datetime(2024, 7, 1, 8, 30)
+
+def test_keeps_tzinfo():
+    from datetime import timezone
+    moment = CronSchedule("0 0 * * *").next_after(datetime(2024, 6, 3, 12, tzinfo=timezone.utc))
+    assert moment == datetime(2024, 6, 4, tzinfo=timezone.utc)
+    assert moment.tzinfo is timezone.utc
+
+@pytest.mark.parametrize("expression", [
+    "* * * *",
+    "60 * * * *",
+    "* 24 * * *",
+    "* * 0 * *",
+    "* * * 13 *",
+    "* * * * 8",
+    "*/0 * * * *",
+    "5-1 * * * *",
+    "a * * * *",
+])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+def test_impossible_date_raises():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 31 2 *").next_after(datetime(2024, 1, 1))
+
+def test_parse_schedules():
+    schedules = parse_schedules(" 0 9 * * 1 ; ;0 18 * * 5")
+    assert [schedule.expression for schedule in schedules] == ["0 9 * * 1", "0 18 * * 5"]
@@ -0,0 +1,117 @@
+from app.summarizer.dedup import (
+    coverage_keys,
+    deduplicate_page_entries,
+    deduplicate_parsed_pages,
+    estimate_similarity,
+    mark_covered_articles,
+    minhash_signature,
+    normalize_url,
+    parsed_pages_coverage_keys,
+    title_fingerprint,
+)
+
+
+BODY = [
+    "- 새로운 언어 모델이 공개되어 긴 문맥 처리 성능이 크게 향상되었다",
+    "- 추론 비용은 이전 세대 대비 절반 수준으로 줄었다",
+    "- 오픈소스 가중치도 함께 배포된다",
+]
+
+
+def article(title, links=(), body=()):
+    return {"type": "article", "title": title, "links": list(links), "body": list(body)}
+
+
+def test_normalize_url_drops_tracking_and_cosmetic_differences():
+    assert normalize_url("HTTP://WWW.Example.com/post/?utm_source=x&id=3#top") == "https://example.com/post?id=3"
+    assert normalize_url("<https://example.com/post/>") == "https://example.com/post"
+    assert normalize_url("https://example.com/a?fbclid=1") == normalize_url("http://example.com/a")
+
+def test_normalize_url_keeps_meaningful_query():
+    assert normalize_url("https://example.com/a?id=1") != normalize_url("https://example.com/a?id=2")
+
+def test_title_fingerprint_ignores_case_and_symbols():
+    assert title_fingerprint("GPT-5 출시 소식!") == title_fingerprint("gpt 5  출시 소식")
+    assert title_fingerprint("GPT-5 출시 소식") != title_fingerprint("GPT-4 출시 소식")
+
+def test_title_fingerprint_skips_short_titles():
+    assert title_fingerprint("AI") is None
+    assert title_fingerprint(None) is None
+
+def test_coverage_keys():
+    keys = coverage_keys("긴 문맥 언어 모델 공개", ["https://www.example.com/llm/"])
+    assert keys == ["link:https://example.com/llm", f"title:{title_fingerprint('긴 문맥 언어 모델 공개')}"]
+    assert coverage_keys("짧음", []) == []
+
+def test_parsed_pages_coverage_keys_are_unique_and_sorted():
+    page = {"parsed_content": ["## 긴 문맥 언어 모델 공개", "https://example.com/llm", "## 두 번째 기사 제목", "https://example.com/llm/"]}
+    keys = parsed_pages_coverage_keys([page, page])
+    assert keys == sorted(set(keys))
+    assert keys.count("link:https://example.com/llm") == 1
+    assert len(keys) == 3
+
+def test_minhash_similarity():
+    signature = minhash_signature("\n".join(BODY))
+    assert estimate_similarity(signature, minhash_signature("\n".join(BODY))) == 1.0
+    other = minhash_signature("쿠버네티스 새 버전에서 사이드카 컨테이너가 정식 기능이 되었다")
+    assert estimate_similarity(signature, other) < 0.3
+    assert minhash_signature("abc") is None
+
+def test_duplicate_links_are_merged_into_first_article():
+    pages = [
+        [{"type": "date", "value": "2024-06-03"}, article("모델 공개", ["https://example.com/llm?utm_source=a"], BODY[:2])],
+        [article(None, ["http://www.example.com/llm/", "https://blog.example.com/llm"], BODY[1:])],
+    ]
+    result, duplicates = deduplicate_page_entries(pages, threshold=0.8)
+
+    assert duplicates == 1
+    assert result[1] == []
+    canonical = result[0][1]
+    assert canonical["links"] == ["https://example.com/llm?utm_source=a", "https://blog.example.com/llm"]
+    assert canonical["body"] == BODY
+    assert result[0][0] == {"type": "date", "value": "2024-06-03"}
+
+def test_similar_bodies_without_shared_links_are_merged():
+    rewritten = [line.replace("- ", "-> ") for line in BODY] + ["- 출시일은 다음 달이다"]
+    pages = [
+        [article("모델 공개", ["https://a.example.com/1"], BODY)],
+        [article("모델 공개 소식", ["https://b.example.com/2"], rewritten)],
+    ]
+    result, duplicates = deduplicate_page_entries(pages, threshold=0.6)
+
+    assert duplicates == 1
+    assert result[1] == []
+    assert result[0][0]["links"] == ["https://a.example.com/1", "https://b.example.com/2"]
+    assert result[0][0]["body"][-1] == "- 출시일은 다음 달이다"
+
+def test_different_articles_are_kept():
+    pages = [[
+        article("모델 공개", ["https://a.example.com/1"], BODY),
+        article("쿠버네티스 릴리스", ["https://k8s.example.com"], ["- 사이드카 컨테이너가 정식 기능이 되었다"]),
+    ]]
+    result, duplicates = deduplicate_page_entries(pages, threshold=0.8)
+    assert duplicates == 0
+    assert [entry["title"] for entry in result[0]] == ["모델 공개", "쿠버네티스 릴리스"]
+
+def test_mark_covered_articles():
+    title = "긴 문맥 언어 모델 공개"
+    pages = [[
+        article(title, [], BODY),
+        article("다른 기사", ["https://www.example.com/other/"], BODY),
+        article("새 기사", ["https://example.com/new"], BODY),
+    ]]
+    covered = {f"title:{title_fingerprint(title)}": "2024-05-27", "link:https://example.com/other": "2024-05-20"}
+
+    assert mark_covered_articles(pages, covered) == 2
+    assert [entry.get("covered") for entry in pages[0]] == ["2024-05-27", "2024-05-20", None]
+    assert pages[0][0]["body"] == [] and pages[0][2]["body"] == BODY
+
+def test_deduplicate_parsed_pages_report():
+    page = {"parsed_content": ["# 2024-06-03", "@작성자", "## 모델 공개", "https://example.com/llm", *BODY]}
+    texts, report = deduplicate_parsed_pages([page, page], threshold=0.8)
+
+    assert report["articles"] == 2
+    assert report["duplicates"] == 1
+    assert report["tokens_saved"] > 0
+    assert "[제목] 모델 공개" in texts[0]
+    assert "[제목]" not in texts[1]
@@ -0,0 +1,74 @@
+from app.summarizer.formatter import SectionStreamParser, format_summary_to_json
+
+
+SUMMARY = """☕️ 2024년 6월 5일 테크 트렌드 커피챗
+
+🔵 AI / LLM
+[모델 공개]
+<https://example.com/llm>
+- 긴 문맥 처리
+- 비용 절반
+[에이전트 프레임워크]
+- 도구 호출 표준화
+
+🟢 Cloud
+[쿠버네티스 릴리스]
+https://k8s.example.com
+- 사이드카 정식 지원
+"""
+
+
+def feed_in_pieces(parser: SectionStreamParser, text: str, size: int):
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return completed
+
+
+def test_section_is_completed_when_next_header_arrives():
+    parser = SectionStreamParser()
+    head, tail = SUMMARY.split("🟢 Cloud")
+
+    assert parser.feed(head) == []
+    completed = parser.feed("🟢 Cloud\n")
+    assert [section["category"] for section in completed] == ["AI / LLM"]
+    assert parser.completed_text == head
+
+def test_finish_closes_last_section():
+    parser = SectionStreamParser()
+    parser.feed(SUMMARY.rstrip("\n"))
+    assert [section["category"] for section in parser.finish()] == ["Cloud"]
+    assert parser.completed_text == SUMMARY.rstrip("\n")
+
+def test_streamed_sections_match_batch_parsing():
+    expected = format_summary_to_json(SUMMARY)["sections"]
+    for size in (1, 3, 17, len(SUMMARY)):
+        parser = SectionStreamParser()
+        completed = feed_in_pieces(parser, SUMMARY, size) + parser.finish()
+        assert completed == expected
+        assert parser.sections == expected
+
+def test_section_items():
+    parser = SectionStreamParser()
+    parser.feed(SUMMARY)
+    parser.finish()
+    items = parser.sections[0]["items"]
+
+    assert items[0] == {"title": "모델 공개", "link": "<https://example.com/llm>", "bullets": ["긴 문맥 처리", "비용 절반"]}
+    assert items[1] == {"title": "에이전트 프레임워크", "link": None, "bullets": ["도구 호출 표준화"]}
+    assert parser.sections[1]["emoji"] == "🟢"
+
+def test_interrupted_stream_keeps_only_finished_sections():
+    parser = SectionStreamParser()
+    cut = SUMMARY.index("[쿠버네티스")
+    feed_in_pieces(parser, SUMMARY[:cut + 5], 4)
+
+    assert [section["category"] for section in parser.sections] == ["AI / LLM"]
+    assert parser.completed_text == SUMMARY[:SUMMARY.index("🟢")]
+    assert "쿠버" not in parser.completed_text
+
+def test_partial_line_waits_for_newline():
+    parser = SectionStreamParser()
+    parser.feed("☕️ 헤더\n\n🔵 AI\n[제목]\n🟢 Clo")
+    assert parser.sections == []
+    assert parser.feed("ud\n")[0]["category"] == "AI"
@@ -0,0 +1,93 @@
+import copy
+
+from app.summarizer.dedup import title_fingerprint
+from app.summarizer.merge import attach_item_sources, merge_summary_sections
+
+
+EXISTING = [
+    {"emoji": "🔵", "category": "AI / LLM", "items": [
+        {"title": "모델 공개", "link": "https://www.example.com/llm/", "bullets": ["긴 문맥"]},
+        {"title": "링크 없는 주제", "sourceKey": "page-1:abc", "bullets": ["요약"]},
+    ]},
+]
+
+
+def test_merge_skips_known_items_and_appends_new_ones():
+    delta = [
+        {"emoji": "🔵", "category": "ai/llm", "items": [
+            {"title": "모델 공개 (재요약)", "link": "https://example.com/llm?utm_source=x", "bullets": []},
+            {"title": "새 모델", "link": "https://example.com/new", "bullets": ["추가"]},
+        ]},
+    ]
+    merged, added = merge_summary_sections(EXISTING, delta)
+
+    assert [item["title"] for item in merged[0]["items"]] == ["모델 공개", "링크 없는 주제", "새 모델"]
+    assert added == [{"emoji": "🔵", "category": "AI / LLM", "items": [delta[0]["items"][1]]}]
+
+def test_merge_adds_new_category_section():
+    delta = [{"emoji": "🟢", "category": "Cloud", "items": [{"title": "쿠버네티스", "link": "https://k8s.example.com"}]}]
+    merged, added = merge_summary_sections(EXISTING, delta)
+
+    assert [section["category"] for section in merged] == ["AI / LLM", "Cloud"]
+    assert added[0]["category"] == "Cloud"
+    assert added[0]["items"] == delta[0]["items"]
+
+def test_merge_does_not_modify_existing_sections():
+    existing = copy.deepcopy(EXISTING)
+    merge_summary_sections(existing, [{"emoji": "🔵", "category": "AI / LLM", "items": [{"title": "새 주제"}]}])
+    assert existing == EXISTING
+
+def test_merge_matches_link_less_items_by_source_key():
+    # LLM 이 제목을 다르게 만들어도 같은 원문 기사면 중복
+    delta = [{"emoji": "🔵", "category": "AI / LLM", "items": [
+        {"title": "제목이 바뀐 주제", "sourceKey": "page-1:abc", "bullets": []},
+        {"title": "링크 없는 주제", "sourceKey": "page-2:def", "bullets": []},
+    ]}]
+    merged, added = merge_summary_sections(EXISTING, delta)
+
+    assert len(merged[0]["items"]) == 3
+    assert [item["sourceKey"] for item in added[0]["items"]] == ["page-2:def"]
+
+def test_merge_falls_back_to_normalized_title():
+    existing = [{"emoji": "🔵", "category": "AI", "items": [{"title": "[모델  공개]"}]}]
+    delta = [{"emoji": "🔵", "category": "AI", "items": [{"title": "모델 공개"}, {"title": "다른 주제"}]}]
+    merged, added = merge_summary_sections(existing, delta)
+
+    assert [item["title"] for item in added[0]["items"]] == ["다른 주제"]
+    assert len(merged[0]["items"]) == 2
+
+def test_merge_ignores_duplicates_within_delta():
+    delta = [{"emoji": "🔵", "category": "AI", "items": [{"title": "새 모델", "link": "https://a.example.com"}] * 2}]
+    merged, added = merge_summary_sections([], delta)
+    assert len(merged[0]["items"]) == 1
+    assert len(added[0]["items"]) == 1
+
+def test_attach_item_sources():
+    pages = [
+        {"page_id": "page-1", "parsed_content": [
+            "## 쿠버네티스 사이드카 정식 기능",
+            "- 사이드카 컨테이너가 정식 기능이 되었다",
+            "## 짧음",
+            "- 데이터베이스 인덱스 튜닝 사례",
+        ]},
+    ]
+    sections = [{"emoji": "🟢", "category": "Cloud", "items": [
+        {"title": "쿠버네티스 사이드카", "bullets": ["사이드카 컨테이너 정식 지원"]},
+        {"title": "인덱스 튜닝", "bullets": ["데이터베이스 인덱스 튜닝"]},
+        {"title": "링크 있는 주제", "link": "https://example.com", "bullets": []},
+        {"title": "관계없는 양자 컴퓨터 발표", "bullets": ["큐비트 오류율 개선"]},
+    ]}]
+
+    assert attach_item_sources(sections, pages) == 2
+    items = sections[0]["items"]
+    assert items[0]["sourceKey"] == f"page-1:{title_fingerprint('쿠버네티스 사이드카 정식 기능')}"
+    # 제목이 짧아 지문이 없으면 페이지 안 기사 순서
+    assert items[1]["sourceKey"] == "page-1:#1"
+    assert "sourceKey" not in items[2]
+    assert "sourceKey" not in items[3]
+
+def test_attach_item_sources_keeps_existing_key():
+    sections = [{"category": "AI", "items": [{"title": "모델 공개", "sourceKey": "page-9:fixed"}]}]
+    pages = [{"page_id": "page-1", "parsed_content": ["## 모델 공개 소식 정리", "- 모델 공개"]}]
+    assert attach_item_sources(sections, pages) == 0
+    assert sections[0]["items"][0]["sourceKey"] == "page-9:fixed"
@@ -0,0 +1,165 @@
+import re
+from datetime import date
+
+import pytest
+
+from app.slack import notifier
+from app.slack.notifier import (
+    _pack_section_texts,
+    deliver_messages_to_webhook,
+    format_blocks_from_text,
+    format_messages_from_text,
+    mask_webhook,
+    post_to_webhooks,
+    webhook_key,
+)
+
+
+def summary_text(categories: int, items: int, bullets: int = 2) -> str:
+    lines = ["☕️ 2024-06-05 테크 트렌드 커피챗 요약", ""]
+    emojis = "🔵🟣🟡🟢🟠🟤"
+    for c in range(categories):
+        lines += [f"{emojis[c % len(emojis)]} *카테고리 {c}*", ""]
+        for i in range(items):
+            lines.append(f"• _주제 {c}-{i}_ | <https://example.com/{c}/{i}|[링크]>")
+            lines += [f"> › 요약 문장 {c}-{i}-{b} " + "내용 " * 10 for b in range(bullets)]
+            lines.append("")
+    return "\n".join(lines)
+
+def block_texts(messages):
+    return [block["text"]["text"] for message in messages for block in message["blocks"] if block["type"] == "section"]
+
+def normalized(text: str) -> str:
+    return re.sub(r"\s+", "", text)
+
+
+def test_small_summary_matches_single_message_format():
+    text = summary_text(2, 2)
+    messages = format_messages_from_text(text)
+    assert messages == [format_blocks_from_text(text)]
+
+def test_header_block_formats_date():
+    messages = format_messages_from_text(summary_text(1, 1))
+    assert messages[0]["blocks"][0]["text"]["text"] == "*☕️ 2024년 6월 5일 테크 트렌드 커피챗 요약*"
+
+def test_large_summary_is_split_without_losing_content():
+    text = summary_text(6, 30, bullets=4)
+    messages = format_messages_from_text(text, max_blocks=10, max_chars=500)
+
+    assert len(messages) > 1
+    assert all(len(message["blocks"]) <= 10 for message in messages)
+    assert all(len(text) <= 500 for text in block_texts(messages))
+    # 제목 줄을 제외한 모든 글자가 순서대로 남아 있음
+    body = "\n".join(text.split("\n")[1:])
+    assert normalized("".join(block_texts(messages)[1:])) == normalized(body)
+
+def test_category_header_stays_with_first_item_after_divider():
+    messages = format_messages_from_text(summary_text(6, 30, bullets=4), max_blocks=10, max_chars=500)
+    for message in messages:
+        blocks = message["blocks"]
+        for index, block in enumerate(blocks):
+            if block["type"] == "divider":
+                assert blocks[index + 1]["text"]["text"].startswith(("🔵", "🟣", "🟡", "🟢", "🟠", "🟤"))
+                assert "• _주제" in blocks[index + 1]["text"]["text"]
+        # 메시지가 divider 로 끝나지 않음
+        assert blocks[-1]["type"] != "divider"
+
+def test_pack_keeps_items_whole_when_they_fit():
+    items = [[], ["\n• _a_\n", "> › 1\n"], ["\n• _b_\n", "> › 2\n"], ["\n• _c_\n", "> › 3\n"]]
+    texts = _pack_section_texts("🔵 *AI*\n\n", items, max_chars=30)
+
+    assert texts == ["🔵 *AI*\n\n\n• _a_\n> › 1", "• _b_\n> › 2\n\n• _c_\n> › 3"]
+
+def test_pack_splits_oversized_item_on_line_boundaries():
+    item = ["\n• _긴 주제_\n"] + [f"> › 문장 {i}\n" for i in range(10)]
+    texts = _pack_section_texts(None, [[], item], max_chars=30)
+
+    assert all(len(text) <= 30 for text in texts)
+    assert normalized("".join(texts)) == normalized("".join(item))
+    assert all(not text.startswith("› ") for text in texts)
+
+def test_pack_cuts_single_line_longer_than_block():
+    texts = _pack_section_texts(None, [["가" * 70 + "\n"]], max_chars=30)
+    assert texts == ["가" * 30, "가" * 30, "가" * 10]
+
+
+MESSAGES = [{"text": f"m{i}"} for i in range(4)]
+
+
+# deliver_to_webhook 대체: 보낸 메시지를 웹훅별로 기록하고 fail_at 번째 전송에서 실패
+class FakeWebhook:
+    def __init__(self, fail_at=None):
+        self.sent = {}
+        self.fail_at = fail_at
+
+    def __call__(self, webhook_url, message):
+        sent = self.sent.setdefault(webhook_url, [])
+        ok = self.fail_at is None or len(sent) != self.fail_at
+        if ok:
+            sent.append(message["text"])
+        return {"webhook": webhook_url, "ok": ok, "status": "sent" if ok else "failed",
+                "attempts": 1, "latency_ms": 0.0, "error": None if ok else "invalid_payload"}
+
+
+def test_mask_webhook_handles_unset_url():
+    assert mask_webhook(None) == "(설정되지 않음)"
+
+def test_post_to_webhooks_rejects_unset_url():
+    with pytest.raises(ValueError):
+        post_to_webhooks(["https://hooks.slack.com/services/T/B/x", None], MESSAGES)
+
+def test_deliver_messages_stops_on_failure_and_reports_progress(monkeypatch):
+    fake = FakeWebhook(fail_at=2)
+    monkeypatch.setattr(notifier, "deliver_to_webhook", fake)
+    progress = []
+
+    result = deliver_messages_to_webhook("hook", MESSAGES, on_sent=progress.append)
+
+    assert not result["ok"]
+    assert result["messages"] == 2
+    assert progress == [1, 2]
+    assert fake.sent["hook"] == ["m0", "m1"]
+
+def test_post_to_webhooks_resumes_each_webhook_from_progress(monkeypatch):
+    fake = FakeWebhook()
+    monkeypatch.setattr(notifier, "deliver_to_webhook", fake)
+    updates = []
+
+    results = post_to_webhooks(
+        ["hook-a", "hook-b"], MESSAGES,
+        progress={webhook_key("hook-a"): 3},
+        on_progress=lambda key, sent: updates.append((key, sent))
+    )
+
+    assert fake.sent == {"hook-a": ["m3"], "hook-b": ["m0", "m1", "m2", "m3"]}
+    assert [result["skipped"] for result in results] == [3, 0]
+    assert [result["messages"] for result in results] == [4, 4]
+    assert (webhook_key("hook-a"), 4) in updates
+
+def test_webhook_key_does_not_contain_url():
+    url = "https://hooks.slack.com/services/T000/B000/secret"
+    assert "secret" not in webhook_key(url)
+    assert len(webhook_key(url)) == 16
+
+def test_resumed_delivery_skips_messages_already_sent(monkeypatch, tmp_path):
+    import main
+    from app.storage.checkpoint import RunCheckpoint
+
+    checkpoint = RunCheckpoint(date(2024, 6, 3), date(2024, 6, 7), resume=True, root=str(tmp_path))
+    failing = FakeWebhook(fail_at=2)
+    monkeypatch.setattr(notifier, "deliver_to_webhook", failing)
+    with pytest.raises(Exception):
+        main.deliver_slack_messages(MESSAGES, ["hook"], checkpoint)
+
+    resumed = FakeWebhook()
+    monkeypatch.setattr(notifier, "deliver_to_webhook", resumed)
+    main.deliver_slack_messages(MESSAGES, ["hook"], checkpoint)
+    assert failing.sent["hook"] + resumed.sent["hook"] == ["m0", "m1", "m2", "m3"]
+
+def test_unset_named_webhook_fails_with_variable_name(monkeypatch):
+    import main
+
+    monkeypatch.setattr(main, "SLACK_WEBHOOKS", [None])
+    monkeypatch.setattr(main, "SLACK_WEBHOOKS_UNSET", ["ALL_SHARE"])
+    with pytest.raises(ValueError, match="SLACK_WEBHOOK_ALL_SHARE"):
+        main.deliver_slack_messages(MESSAGES)
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+from app.summarizer import cache as cache_module
+from app.summarizer.cache import ResponseCache, build_cache_key
+
+
+PROMPTS = {"system": "요약 규칙", "user": "원문"}
+
+
+# 수동으로 움직이는 시계
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def new_cache(tmp_path, monkeypatch, ttl_seconds=3600, max_bytes=10 ** 6):
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=clock.time))
+    return ResponseCache(str(tmp_path / "llm.sqlite"), ttl_seconds=ttl_seconds, max_bytes=max_bytes), clock
+
+
+def test_cache_key_depends_on_prompt_and_parameters():
+    key = build_cache_key(PROMPTS, "gpt-4o", 0.3, 4000)
+
+    assert key == build_cache_key(dict(PROMPTS), "gpt-4o", 0.3, 4000)
+    assert key != build_cache_key({**PROMPTS, "user": "다른 원문"}, "gpt-4o", 0.3, 4000)
+    assert key != build_cache_key(PROMPTS, "gpt-4o-mini", 0.3, 4000)
+    assert key != build_cache_key(PROMPTS, "gpt-4o", 0.3, 4000, {"type": "json_object"})
+
+def test_entry_expires_after_ttl(tmp_path, monkeypatch):
+    cache, clock = new_cache(tmp_path, monkeypatch, ttl_seconds=60)
+    cache.set("k", "gpt-4o", "요약")
+
+    clock.advance(60)
+    assert cache.get("k") == "요약"
+    clock.advance(1)
+    assert cache.get("k") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_size_counts_utf8_bytes_and_overwrites(tmp_path, monkeypatch):
+    cache, _ = new_cache(tmp_path, monkeypatch)
+    cache.set("k", "gpt-4o", "요약" * 10)
+    cache.set("k", "gpt-4o", "요약")
+
+    assert cache.stats()["size_bytes"] == len("요약".encode("utf-8"))
+
+def test_evicts_least_recently_used_until_under_ninety_percent(tmp_path, monkeypatch):
+    cache, clock = new_cache(tmp_path, monkeypatch, max_bytes=350)
+    for key in ("a", "b", "c"):
+        cache.set(key, "gpt-4o", "x" * 100)
+        clock.advance(1)
+    # a 를 다시 사용해 b 가 가장 오래된 엔트리가 됨
+    assert cache.get("a") is not None
+    clock.advance(1)
+    cache.set("d", "gpt-4o", "x" * 100)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert cache.stats()["size_bytes"] == 300
+
+def test_eviction_drops_expired_entries_first(tmp_path, monkeypatch):
+    cache, clock = new_cache(tmp_path, monkeypatch, ttl_seconds=60, max_bytes=350)
+    cache.set("old", "gpt-4o", "x" * 100)
+    clock.advance(30)
+    cache.set("b", "gpt-4o", "x" * 100)
+    cache.set("c", "gpt-4o", "x" * 100)
+    # old 는 가장 최근에 사용했지만 만료되어 먼저 삭제됨
+    clock.advance(20)
+    assert cache.get("old") is not None
+    clock.advance(20)
+    cache.set("d", "gpt-4o", "x" * 100)
+
+    assert cache.get("old") is None
+    assert all(cache.get(key) is not None for key in ("b", "c", "d"))
+    assert cache.stats()["size_bytes"] == 300
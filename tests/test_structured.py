@@ -0,0 +1,98 @@
+import copy
+import json
+
+import pytest
+
+from app.summarizer import structured
+from app.summarizer.structured import get_structured_summary, validate_section, validate_summary
+
+
+SECTION = {
+    "emoji": "🔵",
+    "category": "AI / LLM",
+    "items": [{"title": "모델 공개", "link": "https://example.com/llm", "bullets": ["긴 문맥 처리"]}]
+}
+SUMMARY = {"date": "2024-06-05", "sections": [SECTION, {**SECTION, "emoji": "🟢", "category": "Cloud"}]}
+PROMPTS = {"system": "요약 규칙", "user": "원문"}
+
+
+# get_summary 대체: 준비한 응답을 순서대로 돌려주고 요청을 기록
+class ScriptedLLM:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, client, prompts, **kwargs):
+        self.calls.append({"prompts": prompts, **kwargs})
+        response = self.responses.pop(0)
+        return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
+
+
+def test_valid_summary_has_no_errors():
+    assert validate_summary(SUMMARY) == {"document": [], "sections": {}}
+
+def test_link_may_be_null_or_angle_bracketed():
+    section = copy.deepcopy(SECTION)
+    section["items"].append({"title": "링크 없음", "link": None, "bullets": []})
+    section["items"].append({"title": "꺾쇠 링크", "link": "<https://example.com>", "bullets": []})
+    assert validate_section(section) == []
+
+@pytest.mark.parametrize("change, message", [
+    ({"emoji": "⭐"}, "emoji"),
+    ({"category": "  "}, "category"),
+    ({"items": []}, "items"),
+    ({"items": [{"title": "", "link": None, "bullets": []}]}, "items[0].title"),
+    ({"items": [{"title": "a", "link": "example.com", "bullets": []}]}, "items[0].link"),
+    ({"items": [{"title": "a", "link": None, "bullets": "문장"}]}, "items[0].bullets"),
+    ({"items": ["문자열"]}, "items[0]"),
+])
+def test_section_errors(change, message):
+    errors = validate_section({**SECTION, **change})
+    assert len(errors) == 1
+    assert message in errors[0]
+
+@pytest.mark.parametrize("data", [
+    {**SUMMARY, "date": "2024/06/05"},
+    {**SUMMARY, "date": "2024-02-30"},
+    {**SUMMARY, "sections": []},
+    [SUMMARY],
+])
+def test_document_errors(data):
+    assert validate_summary(data)["document"]
+
+def test_section_errors_are_reported_by_index():
+    data = {**SUMMARY, "sections": [SECTION, {**SECTION, "emoji": "⭐"}, SECTION]}
+    validation = validate_summary(data)
+    assert validation["document"] == []
+    assert list(validation["sections"]) == [1]
+
+def test_only_broken_section_is_repaired(monkeypatch):
+    broken = {**SECTION, "category": "Cloud", "items": [{"title": "쿠버네티스", "link": "k8s", "bullets": []}]}
+    repaired = {**broken, "items": [{"title": "쿠버네티스", "link": "https://k8s.example.com", "bullets": []}]}
+    llm = ScriptedLLM({"date": "2024-06-05", "sections": [SECTION, broken]}, repaired)
+    monkeypatch.setattr(structured, "get_summary", llm)
+
+    result = get_structured_summary(None, PROMPTS)
+
+    assert result["sections"] == [SECTION, repaired]
+    assert result["date"] == "2024-06-05"
+    assert [call["route"] for call in llm.calls] == ["single", "repair"]
+    assert llm.calls[1]["response_format"] == structured.SECTION_RESPONSE_FORMAT
+    assert "items[0].link" in llm.calls[1]["prompts"]["user"]
+
+def test_document_errors_regenerate_whole_summary(monkeypatch):
+    llm = ScriptedLLM("{잘린 JSON", {**SUMMARY, "date": "6월 5일"}, SUMMARY)
+    monkeypatch.setattr(structured, "get_summary", llm)
+
+    assert get_structured_summary(None, PROMPTS)["sections"] == SUMMARY["sections"]
+    # 재생성은 캐시를 건너뜀
+    assert [call["force_refresh"] for call in llm.calls] == [False, True, True]
+
+def test_gives_up_after_repeated_section_failures(monkeypatch):
+    broken = {**SECTION, "emoji": "⭐"}
+    llm = ScriptedLLM({"date": "2024-06-05", "sections": [broken]}, broken, "not json")
+    monkeypatch.setattr(structured, "get_summary", llm)
+
+    with pytest.raises(ValueError, match="섹션 재생성 실패"):
+        get_structured_summary(None, PROMPTS)
+    assert len(llm.calls) == 1 + structured.MAX_SECTION_REPAIRS